@@ -0,0 +1,71 @@
+"""
+Order book hot path benchmarks
+
+Usage: python -m benchmarks [--output results.json] [--filter name] [--repeat 5]
+
+Results are written as JSON so runs can be compared for regression tracking.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+from typing import Any, Dict, List
+
+from benchmarks import json_decode, order_book
+from benchmarks.benchmark import Benchmark
+
+
+def run_benchmark(benchmark: Benchmark, repeat: int) -> Dict[str, Any]:
+    timer = timeit.Timer(benchmark.func)
+    # Calibrate so each measurement takes at least 0.2 seconds
+    number, _ = timer.autorange()
+    timings = [elapsed / number for elapsed in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "name": benchmark.name,
+        "case": benchmark.case,
+        "size": benchmark.size,
+        "iterations": number,
+        "repeat": repeat,
+        "best_us": min(timings) * 1e6,
+        "median_us": statistics.median(timings) * 1e6,
+        "mean_us": statistics.mean(timings) * 1e6,
+    }
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    parser.add_argument("--filter", help="Only run benchmarks whose name or case contains this")
+    parser.add_argument("--repeat", type=int, default=5, help="Measurements per benchmark")
+    args = parser.parse_args(argv)
+
+    results = []
+    for benchmark in order_book.benchmarks() + json_decode.benchmarks():
+        if args.filter and args.filter not in f"{benchmark.name} {benchmark.case}":
+            continue
+        result = run_benchmark(benchmark, args.repeat)
+        print(
+            f"{result['name']:<45} {result['case']:<22} {result['size']:>6} "
+            f"{result['best_us']:>12.2f} us",
+            file=sys.stderr,
+        )
+        results.append(result)
+
+    report = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
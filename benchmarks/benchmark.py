@@ -0,0 +1,18 @@
+from typing import Any, Callable, NamedTuple
+
+
+class Benchmark(NamedTuple):
+    """
+    A function to time
+
+    Attributes:
+        name: function being measured
+        case: input the function is measured on, eg. an order book or message type
+        size: size of the input, eg. price levels per side or bytes
+        func: callable running one iteration
+    """
+
+    name: str
+    case: str
+    size: int
+    func: Callable[[], Any]
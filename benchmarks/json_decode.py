@@ -0,0 +1,152 @@
+import json
+from functools import partial
+from typing import Any, Dict, List
+
+from benchmarks.benchmark import Benchmark
+from idex_sdk.client.json_codec import available_json_codecs
+
+# Representative WebSocket messages as sent by the API (short field names)
+MESSAGES: Dict[str, Any] = {
+    "l2orderbook": {
+        "type": "l2orderbook",
+        "data": {
+            "m": "IDEX-USDC",
+            "t": 1663357542131,
+            "u": 1130791,
+            "b": [[f"0.0{6500000 - i * 1000}", f"{1000 + i}.16670784", 1] for i in range(5)],
+            "a": [[f"0.0{6913000 + i * 1000}", f"{5218 + i}.01431648", 2] for i in range(5)],
+            "p": {"q": "3843521.04591346", "Q": "254011.14627617"},
+        },
+    },
+    "l1orderbook": {
+        "type": "l1orderbook",
+        "data": {
+            "m": "IDEX-USDC",
+            "t": 1663357542131,
+            "b": "0.06500000",
+            "B": "434.16670784",
+            "a": "0.06913000",
+            "A": "5218.01431648",
+            "p": {"q": "3843521.04591346", "Q": "254011.14627617"},
+        },
+    },
+    "trades": {
+        "type": "trades",
+        "data": {
+            "y": "hybrid",
+            "m": "IDEX-USDC",
+            "i": "a0b6a470-a6bf-11ea-90a3-8de307b3b6da",
+            "p": "0.06610000",
+            "q": "1000.00000000",
+            "Q": "66.10000000",
+            "t": 1663357542131,
+            "s": "sell",
+            "u": 848778,
+        },
+    },
+    "tickers": {
+        "type": "tickers",
+        "data": {
+            "m": "IDEX-USDC",
+            "t": 1663357542131,
+            "o": "0.06512000",
+            "h": "0.06921000",
+            "l": "0.06423000",
+            "c": "0.06610000",
+            "Q": "1000.00000000",
+            "v": "1543873.11840712",
+            "q": "103047.81261305",
+            "P": "1.50",
+            "n": 1512,
+            "a": "0.06913000",
+            "b": "0.06500000",
+            "u": 848778,
+        },
+    },
+    "candles": {
+        "type": "candles",
+        "data": {
+            "m": "IDEX-USDC",
+            "t": 1663357542131,
+            "i": "1m",
+            "s": 1663357500000,
+            "e": 1663357559999,
+            "o": "0.06512000",
+            "h": "0.06620000",
+            "l": "0.06510000",
+            "c": "0.06610000",
+            "v": "21043.47860000",
+            "n": 7,
+            "u": 848778,
+        },
+    },
+    "balances": {
+        "type": "balances",
+        "data": {
+            "w": "0x0ab3d7f8a3d2c2bb43ad7ea97eaa6a9b5c6ae2bd",
+            "a": "USDC",
+            "q": "38192.94678100",
+            "f": "26710.66678121",
+            "l": "11482.28000000",
+            "d": "38188.22",
+        },
+    },
+    "orders": {
+        "type": "orders",
+        "data": {
+            "m": "IDEX-USDC",
+            "i": "92782120-a775-11ea-aa55-4da1cc97a06d",
+            "w": "0x0ab3d7f8a3d2c2bb43ad7ea97eaa6a9b5c6ae2bd",
+            "t": 1663357542131,
+            "T": 1663357542131,
+            "x": "fill",
+            "X": "filled",
+            "u": 71228108,
+            "o": "market",
+            "S": "sell",
+            "q": "1000.00000000",
+            "z": "1000.00000000",
+            "Z": "66.10000000",
+            "v": "0.06610000",
+            "V": "dc",
+            "F": [
+                {
+                    "y": "hybrid",
+                    "i": "974480d0-a775-11ea-aa55-4da1cc97a06d",
+                    "p": "0.06610000",
+                    "q": "1000.00000000",
+                    "Q": "66.10000000",
+                    "oq": "600.00000000",
+                    "oQ": "39.66000000",
+                    "pq": "400.00000000",
+                    "pQ": "26.44000000",
+                    "t": 1663357542131,
+                    "s": "sell",
+                    "u": 981372,
+                    "f": "0.13220000",
+                    "a": "USDC",
+                    "l": "taker",
+                    "T": "0x01d28c33271cf1dd0eb04249617d3092f24bd9bad77ffb57a0316c3ce5425158",
+                    "S": "mined",
+                }
+            ],
+        },
+    },
+    "tokenprice": {"type": "tokenprice", "data": {"t": "IDEX", "p": "0.06610000"}},
+}
+
+
+def benchmarks() -> List[Benchmark]:
+    result: List[Benchmark] = []
+    for codec in available_json_codecs():
+        for message_type, message in MESSAGES.items():
+            frame = json.dumps(message)
+            result.append(
+                Benchmark(
+                    "json_decode",
+                    f"{message_type}/{codec.name}",
+                    len(frame),
+                    partial(codec.loads, frame),
+                )
+            )
+    return result
@@ -0,0 +1,195 @@
+import copy
+import json
+import os
+import random
+from functools import partial
+from typing import Callable, List, cast
+
+from benchmarks.benchmark import Benchmark
+from idex_sdk.client.order_book.utils import update_l2_levels
+from idex_sdk.idex_types.order_book import (
+    L2OrderBook,
+    OrderBookLevelL2,
+    compact_order_book_levels,
+    make_order_book_level,
+)
+from idex_sdk.idex_types.rest.response import RestResponseOrderBook
+from idex_sdk.order_book.api_conversions import (
+    l2_order_book_to_rest_response,
+    response_to_l2_order_book,
+)
+from idex_sdk.order_book.hybrid import l2_limit_order_book_to_hybrid_order_books
+from idex_sdk.order_book.quantities import (
+    aggregate_l2_order_book_at_tick_size,
+    quantities_available_from_pool_at_prices,
+)
+
+FIXTURE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "test",
+    "client",
+    "order_book",
+    "sequence_1130790.json",
+)
+
+LEVEL_COUNTS = [10, 100, 1000]
+
+# Fee rates and minimums in pips, matching production defaults
+IDEX_FEE_RATE = 50000
+POOL_FEE_RATE = 200000
+TAKER_MINIMUM_IN_QUOTE = 100000000
+TICK_SIZE = 1000
+
+
+def synthetic_l2_order_book(levels: int, seed: int = 1) -> L2OrderBook:
+    """
+    Limit order book with the given number of levels per side around a mid price of 1.0, spaced
+    one tick apart, backed by a pool at the mid price
+    """
+    rng = random.Random(seed)
+    mid_price = 100000000
+    return {
+        "sequence": 1,
+        "asks": [
+            make_order_book_level(
+                mid_price + (i + 1) * TICK_SIZE, rng.randint(10**8, 10**12), rng.randint(1, 5)
+            )
+            for i in range(levels)
+        ],
+        "bids": [
+            make_order_book_level(
+                mid_price - (i + 1) * TICK_SIZE, rng.randint(10**8, 10**12), rng.randint(1, 5)
+            )
+            for i in range(levels)
+        ],
+        "pool": {
+            "base_reserve_quantity": 10**14,
+            "quote_reserve_quantity": 10**14,
+        },
+    }
+
+
+def compact_l2_order_book(book: L2OrderBook) -> L2OrderBook:
+    """
+    Copy of book with its levels stored as compact OrderBookLevels rather than dicts
+    """
+    return {
+        **book,  # type: ignore
+        "asks": compact_order_book_levels(book["asks"]),
+        "bids": compact_order_book_levels(book["bids"]),
+    }
+
+
+def fixture_l2_order_book() -> L2OrderBook:
+    with open(FIXTURE_PATH) as json_file:
+        return response_to_l2_order_book(json.load(json_file))
+
+
+def update_l2_levels_benchmark(book: L2OrderBook) -> Callable[[], None]:
+    """
+    Applies a changeset that resizes every tenth level, removes the best level and adds one
+    beyond the worst, followed by the changeset reverting it, so every call sees the same book
+    """
+    book = copy.deepcopy(book)
+    forward: L2OrderBook = {"sequence": 1, "asks": [], "bids": [], "pool": book["pool"]}
+    backward: L2OrderBook = {"sequence": 1, "asks": [], "bids": [], "pool": book["pool"]}
+    for side, step in (("asks", TICK_SIZE), ("bids", -TICK_SIZE)):
+        levels = cast(List[OrderBookLevelL2], book[side])  # type: ignore
+        resized = levels[1::10]
+        best, added_price = levels[0], levels[-1]["price"] + step
+        forward_levels = [
+            make_order_book_level(level["price"], level["size"] * 2, level["num_orders"])
+            for level in resized
+        ] + [
+            make_order_book_level(best["price"], 0, 0),
+            make_order_book_level(added_price, 10**8, 1),
+        ]
+        backward_levels = [
+            make_order_book_level(level["price"], level["size"], level["num_orders"])
+            for level in resized
+        ] + [
+            make_order_book_level(best["price"], best["size"], best["num_orders"]),
+            make_order_book_level(added_price, 0, 0),
+        ]
+        for changeset, changed_levels in ((forward, forward_levels), (backward, backward_levels)):
+            changeset[side] = sorted(  # type: ignore
+                changed_levels, key=lambda level: level["price"], reverse=step < 0
+            )
+
+    def run() -> None:
+        update_l2_levels(book, forward)
+        update_l2_levels(book, backward)
+
+    return run
+
+
+def pool_quantities_benchmark(book: L2OrderBook) -> None:
+    """
+    Pool quantities at the price of every level on both sides, as in hybrid book recalculation
+    """
+    if not book["pool"]:
+        return
+    for side, is_ask in (("asks", True), ("bids", False)):
+        quantities_available_from_pool_at_prices(
+            book["pool"]["base_reserve_quantity"],
+            book["pool"]["quote_reserve_quantity"],
+            [level["price"] for level in book[side]],  # type: ignore
+            IDEX_FEE_RATE,
+            POOL_FEE_RATE,
+            is_ask,
+        )
+
+
+def benchmarks() -> List[Benchmark]:
+    books = [("synthetic", levels, synthetic_l2_order_book(levels)) for levels in LEVEL_COUNTS]
+    fixture = fixture_l2_order_book()
+    books.append(("sequence_1130790", max(len(fixture["asks"]), len(fixture["bids"])), fixture))
+    # Tracks the speed cost of holding books in compact levels to save memory
+    books.append(("synthetic_compact", 1000, compact_l2_order_book(synthetic_l2_order_book(1000))))
+
+    result: List[Benchmark] = []
+    for book_name, levels, book in books:
+        response: RestResponseOrderBook = l2_order_book_to_rest_response(book)
+
+        result += [
+            Benchmark("update_l2_levels", book_name, levels, update_l2_levels_benchmark(book)),
+            Benchmark(
+                "aggregate_l2_order_book_at_tick_size",
+                book_name,
+                levels,
+                partial(aggregate_l2_order_book_at_tick_size, book, TICK_SIZE * 10),
+            ),
+            Benchmark(
+                "l2_limit_order_book_to_hybrid_order_books",
+                book_name,
+                levels,
+                partial(
+                    l2_limit_order_book_to_hybrid_order_books,
+                    book,
+                    IDEX_FEE_RATE,
+                    POOL_FEE_RATE,
+                    True,
+                    TAKER_MINIMUM_IN_QUOTE,
+                    TICK_SIZE,
+                ),
+            ),
+            Benchmark(
+                "quantities_available_from_pool_at_prices",
+                book_name,
+                levels,
+                partial(pool_quantities_benchmark, book),
+            ),
+            Benchmark(
+                "l2_order_book_to_rest_response",
+                book_name,
+                levels,
+                partial(l2_order_book_to_rest_response, book),
+            ),
+            Benchmark(
+                "response_to_l2_order_book",
+                book_name,
+                levels,
+                partial(response_to_l2_order_book, response),
+            ),
+        ]
+    return result
@@ -0,0 +1,95 @@
+import json
+from typing import Any, Callable, List, NamedTuple, Union
+
+
+class JsonCodec(NamedTuple):
+    """
+    JSON encoder and decoder used by the REST and WebSocket clients
+
+    Attributes:
+        name: name of the underlying library
+        loads: decodes a str or bytes document
+        dumps: encodes to a compact str
+    """
+
+    name: str
+    loads: Callable[[Union[str, bytes]], Any]
+    dumps: Callable[[Any], str]
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"))
+
+
+STDLIB_JSON_CODEC = JsonCodec("json", json.loads, _stdlib_dumps)
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    return JsonCodec("orjson", orjson.loads, dumps)
+
+
+def _ujson_codec() -> JsonCodec:
+    import ujson  # type: ignore
+
+    def dumps(obj: Any) -> str:
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+
+    return JsonCodec("ujson", ujson.loads, dumps)
+
+
+_CODEC_FACTORIES = {
+    "orjson": _orjson_codec,
+    "ujson": _ujson_codec,
+    "json": lambda: STDLIB_JSON_CODEC,
+}
+
+JSON_CODEC_NAMES = ["orjson", "ujson", "json"]
+
+
+def get_json_codec(name: str) -> JsonCodec:
+    """
+    orjson and ujson decode messages faster than the standard library, but may not decode
+    integers wider than 64 bits exactly: orjson converts them to floats, and older ujson
+    versions reject them. The API sends quantities as strings, so they are not affected.
+
+    Args:
+        name: one of "orjson", "ujson" or "json" (standard library)
+
+    Returns:
+        The named codec, raising ImportError if its library is not installed
+    """
+    factory = _CODEC_FACTORIES.get(name)
+    if not factory:
+        raise Exception(f"Unknown JSON codec {name}, expected one of {JSON_CODEC_NAMES}")
+    try:
+        return factory()
+    except ImportError as error:
+        raise ImportError(
+            f"{name} is required for the {name} JSON codec: pip install {name}"
+        ) from error
+
+
+def available_json_codecs() -> List[JsonCodec]:
+    """
+    All codecs whose library is installed
+    """
+    codecs = []
+    for name in JSON_CODEC_NAMES:
+        try:
+            codecs.append(get_json_codec(name))
+        except ImportError:
+            pass
+    return codecs
+
+
+def get_default_json_codec() -> JsonCodec:
+    """
+    The standard library json module, which decodes any valid document exactly. Faster codecs
+    are opt-in, see get_json_codec.
+    """
+    return STDLIB_JSON_CODEC
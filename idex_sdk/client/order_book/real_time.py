@@ -1,15 +1,26 @@
 import asyncio
-from typing import Dict, List, Optional, Set, cast
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar, cast
 
 from pyee.asyncio import AsyncIOEventEmitter
 
-from idex_sdk.client.order_book.utils import l1_equal, update_l2_levels
+from idex_sdk.client.json_codec import JsonCodec
+from idex_sdk.client.order_book.utils import (
+    l1_equal,
+    to_l2_order_book_side,
+    update_l2_levels,
+)
+from idex_sdk.client.rate_limit import RateLimiter
 from idex_sdk.client.rest.public import RestPublicClient
+from idex_sdk.client.rest.single_flight import SingleFlight
 from idex_sdk.client.utils import derive_base_url
 from idex_sdk.client.websocket.client import WebSocketClient
+from idex_sdk.client.websocket.recording import WebSocketRecorder
 from idex_sdk.constants import (
     ORDER_BOOK_FIRST_LEVEL_MULTIPLIER_IN_PIPS,
     ORDER_BOOK_HYBRID_SLIPPAGE,
+    ORDER_BOOK_MAX_CONCURRENT_REST_REQUESTS,
     ORDER_BOOK_MAX_L2_LEVELS,
 )
 from idex_sdk.idex_types.enums import MultiverseChain
@@ -26,7 +37,9 @@ from idex_sdk.idex_types.websocket.request import (
 )
 from idex_sdk.idex_types.websocket.response import (
     WebSocketResponse,
+    WebSocketResponseL2OrderBookSubscriptionMessageLong,
     WebSocketResponseTokenPriceLong,
+    WebSocketResponseTokenPriceSubscriptionMessageLong,
 )
 from idex_sdk.order_book.api_conversions import (
     l1_order_book_to_rest_response,
@@ -44,6 +57,11 @@ from idex_sdk.pipmath import (
     pip_to_decimal,
 )
 
+# tick size, book sequence, pool reserves, market minimum and fee rates
+HybridBooksCacheKey = Tuple[int, int, Optional[int], Optional[int], Optional[int], int, int]
+
+T = TypeVar("T")
+
 
 class OrderBookRealTimeClient(AsyncIOEventEmitter):
     rest_public_client: RestPublicClient
@@ -62,6 +80,15 @@ class OrderBookRealTimeClient(AsyncIOEventEmitter):
     tick_sizes_by_market: Dict[str, int] = {}
     websocket_connection_listeners_configured = False
     websocket_response_listener_configured = False
+    # Hybrid books are expensive to compute, so they are memoized per market until the
+    # underlying book, pool or token prices change
+    hybrid_books_cache: Dict[str, Dict[HybridBooksCacheKey, L1AndL2OrderBook]]
+    hybrid_books_cache_hits: int
+    hybrid_books_cache_misses: int
+    max_concurrent_rest_requests: int
+    rest_executor: Optional[ThreadPoolExecutor]
+    # Markets currently being re-synchronized after a missed update, see resynchronize_market
+    market_resynchronization_tasks: Dict[str, asyncio.Task]
 
     def __init__(
         self,
@@ -72,8 +99,45 @@ class OrderBookRealTimeClient(AsyncIOEventEmitter):
         rest_base_url: Optional[str] = None,
         websocket_base_url: Optional[str] = None,
         fees_and_minimums_override: Optional[OrderBookFeesAndMinimums] = None,
+        max_concurrent_rest_requests: int = ORDER_BOOK_MAX_CONCURRENT_REST_REQUESTS,
+        websocket_recorder: Optional[WebSocketRecorder] = None,
+        json_codec: Optional[JsonCodec] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        rest_cache_ttls: Optional[Dict[str, float]] = None,
+        rest_single_flight: Optional[SingleFlight] = None,
     ) -> None:
+        """
+        Args:
+            api_key: Optional API key, used for REST API requests
+            connect_timeout: Timeout (in milliseconds) before failing when trying to connect to
+                the WebSocket
+            sandbox: If true, client will point to API sandbox
+            multiverse_chain: Which multiverse chain the client will point to
+            rest_base_url: Override the REST API base url
+            websocket_base_url: Override the WebSocket API base url
+            fees_and_minimums_override: Custom fee rates for synthetic price level calculations
+            max_concurrent_rest_requests: Maximum number of REST API requests that run
+                concurrently when synchronizing order book snapshots, fees and token prices
+            websocket_recorder: Optional recorder that captures the raw WebSocket stream, which
+                can be fed back into websocket_handle_response with WebSocketReplayer
+            json_codec: JSON codec for REST and WebSocket messages, defaults to the standard
+                library json module
+            rate_limiter: Limits the rate of REST API requests, shared with other REST clients
+                to keep them under one rate limit together
+            rest_cache_ttls: Cache TTLs (in seconds) of REST API endpoints, so resynchronizing
+                does not refetch unchanged reference data, see RestPublicClient
+            rest_single_flight: Coalesces identical concurrent REST API requests, shared with
+                other clients so that they send one request when resynchronizing together
+        """
         super().__init__()
+        if max_concurrent_rest_requests < 1:
+            raise Exception("max_concurrent_rest_requests must be at least 1")
+        self.max_concurrent_rest_requests = max_concurrent_rest_requests
+        self.rest_executor = None
+        self.market_resynchronization_tasks = {}
+        self.hybrid_books_cache = {}
+        self.hybrid_books_cache_hits = 0
+        self.hybrid_books_cache_misses = 0
         rest_api_url = derive_base_url("rest", multiverse_chain, sandbox, rest_base_url)
         websocket_api_url = derive_base_url(
             "websocket", multiverse_chain, sandbox, websocket_base_url
@@ -84,13 +148,22 @@ class OrderBookRealTimeClient(AsyncIOEventEmitter):
             multiverse_chain=multiverse_chain,
             sandbox=sandbox,
             base_url=rest_api_url,
+            json_codec=json_codec,
+            rate_limiter=rate_limiter,
+            cache_ttls=rest_cache_ttls,
+            single_flight=rest_single_flight,
         )
+        # websocket_handle_connect subscribes and resynchronizes on every connect, so the
+        # WebSocket client must not restore subscriptions itself
         self.websocket_client = WebSocketClient(
             should_reconnect_automatically=True,
+            should_restore_subscriptions=False,
             connect_timeout=connect_timeout,
             sandbox=sandbox,
             multiverse_chain=multiverse_chain,
             base_url=websocket_api_url,
+            recorder=websocket_recorder,
+            json_codec=json_codec,
         )
 
         if fees_and_minimums_override:
@@ -115,6 +188,9 @@ class OrderBookRealTimeClient(AsyncIOEventEmitter):
             await self.unsubscribe()
             await self.websocket_client.disconnect()
         self.reset_internal_state()
+        if self.rest_executor:
+            self.rest_executor.shutdown(wait=False)
+            self.rest_executor = None
 
     def set_fees_and_minimums_override(self, override: OrderBookFeesAndMinimums) -> None:
         """
@@ -171,19 +247,55 @@ class OrderBookRealTimeClient(AsyncIOEventEmitter):
         return l2_order_book_to_rest_response(self.get_hybrid_books(market, tick_size)["l2"], limit)
 
     def get_hybrid_books(self, market: str, tick_size: Optional[int] = None) -> L1AndL2OrderBook:
+        """
+        Calculate the hybrid level 1 and level 2 orderbooks for this market. Results are cached
+        until the market's book, pool reserves, token prices or fees change, so the returned
+        books must not be modified.
+
+        Args:
+            market
+            tick_size: minimum price movement expressed in pips (10^-8), defaults to market setting
+        """
         applied_tick_size = tick_size or self.tick_sizes_by_market[market] or 1
         input_book = self.load_level2(market)
+        market_minimum = self.get_market_minimum(market)
+        pool = input_book["pool"]
+        cache_key: HybridBooksCacheKey = (
+            applied_tick_size,
+            input_book["sequence"],
+            pool["base_reserve_quantity"] if pool else None,
+            pool["quote_reserve_quantity"] if pool else None,
+            market_minimum,
+            self.taker_idex_fee_rate,
+            self.taker_liquidity_provider_fee_rate,
+        )
+        market_cache = self.hybrid_books_cache.setdefault(market, {})
+        hybrid_books = market_cache.get(cache_key)
+        if hybrid_books is not None:
+            self.hybrid_books_cache_hits += 1
+            return hybrid_books
+        self.hybrid_books_cache_misses += 1
+
         aggregated_l2_book = aggregate_l2_order_book_at_tick_size(input_book, applied_tick_size)
-        return l2_limit_order_book_to_hybrid_order_books(
+        hybrid_books = l2_limit_order_book_to_hybrid_order_books(
             aggregated_l2_book,
             self.taker_idex_fee_rate,
             self.taker_liquidity_provider_fee_rate,
             True,
-            self.get_market_minimum(market),
+            market_minimum,
             applied_tick_size,
             ORDER_BOOK_MAX_L2_LEVELS,
             ORDER_BOOK_HYBRID_SLIPPAGE,
         )
+        market_cache[cache_key] = hybrid_books
+        return hybrid_books
+
+    def get_hybrid_books_cache_stats(self) -> Dict[str, int]:
+        """
+        Hit and miss counters for the hybrid orderbook cache used by get_order_book_l1 and
+        get_order_book_l2
+        """
+        return {"hits": self.hybrid_books_cache_hits, "misses": self.hybrid_books_cache_misses}
 
     async def apply_order_book_updates(self, market: str) -> None:
         updates = self.l2_order_book_updates.get(market)
@@ -196,8 +308,9 @@ class OrderBookRealTimeClient(AsyncIOEventEmitter):
         if not book:
             return
 
+        self.hybrid_books_cache.pop(market, None)
         before_l1 = l2_to_l1_order_book(book)
-        for update in updates:
+        for index, update in enumerate(updates):
             if book["sequence"] > update["sequence"]:
                 # outdated sequence, ignore
                 continue
@@ -208,20 +321,18 @@ class OrderBookRealTimeClient(AsyncIOEventEmitter):
                 # the pool was updated (sequence does not increment)
                 book["pool"] = update["pool"]
             else:
-                # If an invalid update arrives, reset all data and synchronize anew
-                self.emit("disconnected")
+                # If an invalid update arrives, discard this market's book and synchronize it
+                # anew, keeping the remaining updates to replay on top of the new snapshot.
+                # Other markets stay live.
                 self.emit(
                     "error",
                     Exception(
-                        f"Missing l2 update sequence, current book is {book['sequence']} "
-                        f"message was {update['sequence']}"
+                        f"Missing l2 update sequence for {market}, current book is "
+                        f"{book['sequence']} message was {update['sequence']}"
                     ),
                 )
-                await self.unsubscribe()
-                self.reset_internal_state()
-                await self.subscribe()
-                await self.synchronize_from_rest_api()
-                self.emit("connected")
+                self.l2_order_book_updates[market] = updates[index:]
+                self.resynchronize_market(market)
                 return
         after_l1 = l2_to_l1_order_book(book)
 
@@ -238,6 +349,8 @@ class OrderBookRealTimeClient(AsyncIOEventEmitter):
         markets = self.markets_by_asset_symbol.get(message["token"])
         if markets:
             for market in markets:
+                # market minimums depend on token prices
+                self.hybrid_books_cache.pop(market, None)
                 self.emit("l1", market)
                 self.emit("l2", market)
 
@@ -247,7 +360,7 @@ class OrderBookRealTimeClient(AsyncIOEventEmitter):
         if self.fees_and_minimums_loaded:
             return
 
-        exchange_info = self.rest_public_client.get_exchange_info()
+        exchange_info = await self.run_rest_request(self.rest_public_client.get_exchange_info)
         self.taker_liquidity_provider_fee_rate = decimal_to_pip(
             exchange_info["takerLiquidityProviderFeeRate"]
         )
@@ -259,10 +372,6 @@ class OrderBookRealTimeClient(AsyncIOEventEmitter):
         self.fees_and_minimums_loaded = True
 
     async def synchronize_from_rest_api(self) -> None:
-        async def load_market(market: str) -> None:
-            self.l2_order_books[market] = self.load_level2(market)
-            self.emit("ready", market)
-
         # Updates cannot be applied until successfully synchronized with the REST API, so keep
         # trying with exponential backoff until success
         reconnect_attempt = 0
@@ -275,12 +384,66 @@ class OrderBookRealTimeClient(AsyncIOEventEmitter):
                 await asyncio.gather(
                     self.load_fees_and_minimums(), self.load_token_prices(), self.load_tick_sizes()
                 )
-                await asyncio.gather(*[load_market(market) for market in self.markets])
+                await asyncio.gather(
+                    *[self.synchronize_market_from_rest_api(market) for market in self.markets]
+                )
                 return
             except Exception as error:
                 self.emit("error", error)
                 await asyncio.sleep(backoff_seconds)
 
+    async def synchronize_market_from_rest_api(self, market: str) -> None:
+        book = await self.run_rest_request(self.load_level2, market)
+        # Index both sides by price up front so websocket updates apply in place
+        book["asks"] = to_l2_order_book_side(True, book["asks"])
+        book["bids"] = to_l2_order_book_side(False, book["bids"])
+        self.l2_order_books[market] = book
+        self.emit("ready", market)
+
+    def resynchronize_market(self, market: str) -> None:
+        """
+        Discard a single market's book and load a new snapshot in the background. Updates for the
+        market are buffered meanwhile and replayed past the snapshot sequence once it loads;
+        emits "ready" for the market when done.
+        """
+        if market in self.market_resynchronization_tasks:
+            return
+        self.l1_order_books.pop(market, None)
+        self.l2_order_books.pop(market, None)
+        self.hybrid_books_cache.pop(market, None)
+
+        async def resynchronize() -> None:
+            # Keep trying with exponential backoff until success, as for the initial
+            # synchronization
+            reconnect_attempt = 0
+            while True:
+                backoff_seconds = 2**reconnect_attempt
+                reconnect_attempt += 1
+                try:
+                    await self.synchronize_market_from_rest_api(market)
+                    break
+                except Exception as error:
+                    self.emit("error", error)
+                    await asyncio.sleep(backoff_seconds)
+            del self.market_resynchronization_tasks[market]
+            await self.apply_order_book_updates(market)
+
+        self.market_resynchronization_tasks[market] = asyncio.create_task(resynchronize())
+
+    async def run_rest_request(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking REST API call on the client's bounded thread pool, so snapshot loading
+        for many markets runs concurrently without blocking the event loop
+        """
+        if not self.rest_executor:
+            self.rest_executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrent_rest_requests,
+                thread_name_prefix="idex-order-book-rest",
+            )
+        return await asyncio.get_running_loop().run_in_executor(
+            self.rest_executor, partial(func, *args)
+        )
+
     def load_level2(self, market: str) -> L2OrderBook:
         if self.l2_order_books.get(market):
             return self.l2_order_books[market]
@@ -288,7 +451,7 @@ class OrderBookRealTimeClient(AsyncIOEventEmitter):
         return response_to_l2_order_book(book)
 
     async def load_token_prices(self) -> None:
-        assets = self.rest_public_client.get_assets()
+        assets = await self.run_rest_request(self.rest_public_client.get_assets)
         for asset in assets:
             if asset["symbol"] not in self.token_prices:
                 self.token_prices[asset["symbol"]] = (
@@ -301,7 +464,7 @@ class OrderBookRealTimeClient(AsyncIOEventEmitter):
         # Market tick sizes only need to be loaded once as they are effectively static
         if self.is_tick_sizes_loaded:
             return
-        markets = self.rest_public_client.get_markets()
+        markets = await self.run_rest_request(self.rest_public_client.get_markets)
         for market in markets:
             self.tick_sizes_by_market[market["market"]] = decimal_to_pip(market["tickSize"])
         self.is_tick_sizes_loaded = True
@@ -324,6 +487,9 @@ class OrderBookRealTimeClient(AsyncIOEventEmitter):
         return int(self.taker_trade_minimum * ONE_IN_PIPS / price) if price else None
 
     def reset_internal_state(self) -> None:
+        for task in self.market_resynchronization_tasks.values():
+            task.cancel()
+        self.market_resynchronization_tasks.clear()
         self.taker_idex_fee_rate = 0
         self.taker_liquidity_provider_fee_rate = 0
         self.taker_trade_minimum = 0
@@ -331,6 +497,7 @@ class OrderBookRealTimeClient(AsyncIOEventEmitter):
         self.l1_order_books.clear()
         self.l2_order_books.clear()
         self.l2_order_book_updates.clear()
+        self.hybrid_books_cache.clear()
 
     # Connection management
 
@@ -362,7 +529,8 @@ class OrderBookRealTimeClient(AsyncIOEventEmitter):
 
     async def websocket_handle_connect(self) -> None:
         if not self.websocket_response_listener_configured:
-            self.websocket_client.on_response(self.websocket_handle_response)
+            self.websocket_client.on("l2orderbook", self.websocket_handle_l2_order_book)
+            self.websocket_client.on("tokenprice", self.websocket_handle_token_price)
             self.websocket_response_listener_configured = True
 
         await self.subscribe()
@@ -380,10 +548,18 @@ class OrderBookRealTimeClient(AsyncIOEventEmitter):
 
     async def websocket_handle_response(self, response: WebSocketResponse) -> None:
         if response["type"] == "l2orderbook":
-            # accumulate L2 updates to be applied
-            updates_to_apply = self.l2_order_book_updates.get(response["data"]["market"], [])
-            updates_to_apply.append(response_to_l2_order_book(response["data"]))
-            self.l2_order_book_updates[response["data"]["market"]] = updates_to_apply
-            await self.apply_order_book_updates(response["data"]["market"])
+            await self.websocket_handle_l2_order_book(response)
         if response["type"] == "tokenprice":
-            self.apply_token_price_update(response["data"])
+            await self.websocket_handle_token_price(response)
+
+    async def websocket_handle_l2_order_book(self, response: WebSocketResponse) -> None:
+        message = cast(WebSocketResponseL2OrderBookSubscriptionMessageLong, response)
+        # accumulate L2 updates to be applied
+        updates_to_apply = self.l2_order_book_updates.get(message["data"]["market"], [])
+        updates_to_apply.append(response_to_l2_order_book(message["data"]))
+        self.l2_order_book_updates[message["data"]["market"]] = updates_to_apply
+        await self.apply_order_book_updates(message["data"]["market"])
+
+    async def websocket_handle_token_price(self, response: WebSocketResponse) -> None:
+        message = cast(WebSocketResponseTokenPriceSubscriptionMessageLong, response)
+        self.apply_token_price_update(message["data"])
@@ -1,10 +1,8 @@
-from typing import List
+from bisect import bisect_left
+from typing import Iterable, List, Union
 
-from idex_sdk.idex_types.order_book import (
-    L1OrderBook,
-    L2OrderBook,
-    OrderBookLevelL2,
-)
+from idex_sdk.idex_types.order_book import L1OrderBook, L2OrderBook, OrderBookLevelL2
+from idex_sdk.order_book.columnar import ColumnarL2OrderBook
 
 
 def l1_equal(before_l1: L1OrderBook, after_l1: L1OrderBook) -> bool:
@@ -63,17 +61,88 @@ def update_l2_side(
     return new_levels
 
 
-def update_l2_levels(book: L2OrderBook, updated_levels: L2OrderBook) -> None:
+class L2OrderBookSide(List[OrderBookLevelL2]):
+    """
+    A single side of a level 2 orderbook that maintains a sorted price index alongside its
+    levels, so that changed price levels are located by binary search and applied in place
+    rather than rebuilding the side on every update.
+
+    Behaves as a regular list of price levels; it must only be mutated through apply_update and
+    apply_updates to keep the index consistent.
+    """
+
+    is_ascending: bool
+    _keys: List[int]
+
+    def __init__(self, is_ascending: bool, levels: Iterable[OrderBookLevelL2] = ()) -> None:
+        """
+        Args:
+            is_ascending: true for asks, false for bids (ordering of price levels)
+            levels: price levels, already sorted in the side's order
+        """
+        super().__init__(levels)
+        self.is_ascending = is_ascending
+        self._keys = [self._key(level["price"]) for level in self]
+
+    def _key(self, price: int) -> int:
+        # Bids are sorted by descending price, so index them by negated price to keep the
+        # index ascending for bisect
+        return price if self.is_ascending else -price
+
+    def apply_update(self, update: OrderBookLevelL2) -> None:
+        """
+        Applies a single changed price level: replaces the level at the same price, removes it
+        if the update has no size or no orders, or inserts it at its sorted position
+        """
+        key = self._key(update["price"])
+        index = bisect_left(self._keys, key)
+        exists = index < len(self._keys) and self._keys[index] == key
+        if update["size"] and update["num_orders"]:
+            if exists:
+                self[index] = update
+            else:
+                self._keys.insert(index, key)
+                self.insert(index, update)
+        elif exists:
+            del self._keys[index]
+            del self[index]
+
+    def apply_updates(self, updates: Iterable[OrderBookLevelL2]) -> None:
+        """Applies a changeset of price levels in place"""
+        for update in updates:
+            self.apply_update(update)
+
+
+def update_l2_levels(
+    book: Union[L2OrderBook, ColumnarL2OrderBook], updated_levels: L2OrderBook
+) -> None:
     """
     Updates a level 2 orderbook using a partial "diff" received over websockets
 
     Args:
-        book: level 2 orderbook to update
+        book: level 2 orderbook to update, either form
         updated_levels: level 2 orderbook containing only limit order price levels that
             have changed
     """
+    if isinstance(book, ColumnarL2OrderBook):
+        book.apply_updates(updated_levels)
+        return
+
+    asks = to_l2_order_book_side(True, book["asks"])
+    asks.apply_updates(updated_levels["asks"])
+    bids = to_l2_order_book_side(False, book["bids"])
+    bids.apply_updates(updated_levels["bids"])
     book["sequence"] = updated_levels["sequence"]
-    book["asks"] = update_l2_side(True, book["asks"], updated_levels["asks"])
-    book["bids"] = update_l2_side(False, book["bids"], updated_levels["bids"])
+    book["asks"] = asks
+    book["bids"] = bids
     book["pool"] = updated_levels["pool"]
-    pass
+
+
+def to_l2_order_book_side(is_ascending: bool, side: List[OrderBookLevelL2]) -> L2OrderBookSide:
+    """
+    Wraps a sorted list of price levels in a price-indexed L2OrderBookSide, unless it already is
+    one
+    """
+    if isinstance(side, L2OrderBookSide) and side.is_ascending == is_ascending:
+        return side
+    return L2OrderBookSide(is_ascending, side)
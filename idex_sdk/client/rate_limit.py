@@ -0,0 +1,199 @@
+import asyncio
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional, TypedDict
+
+import requests
+
+from idex_sdk.constants import (
+    REST_MAX_RETRIES,
+    REST_RATE_LIMIT_BURST,
+    REST_RATE_LIMIT_REQUESTS_PER_SECOND,
+    REST_RETRY_BACKOFF_MAX_SECONDS,
+    REST_RETRY_BACKOFF_SECONDS,
+)
+from idex_sdk.idex_types.errors import TooManyRequestsError
+
+
+class RateLimiterMetrics(TypedDict):
+    # Requests sent, including retries
+    requests: int
+    # Requests that had to wait for the rate limit
+    throttled: int
+    # Requests currently waiting for the rate limit
+    queued: int
+    # Total time in seconds requests waited for the rate limit
+    wait_seconds: float
+    # Responses rejected by the API with 429 Too Many Requests
+    rejected: int
+    # Rejected requests that were retried
+    retried: int
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting REST API requests, shared by any number of REST clients
+    (including the order book client's) so they stay under one rate limit together
+
+    Each request takes its endpoint's weight (1 by default) in tokens. Tokens refill at
+    requests_per_second up to burst; requests wait while the bucket is empty. GET requests
+    rejected with 429 Too Many Requests are retried with exponential backoff, honoring the
+    Retry-After header when the API sends one.
+    """
+
+    requests_per_second: float
+    burst: float
+    endpoint_weights: Dict[str, float]
+    max_retries: int
+    retry_backoff_seconds: float
+    retry_backoff_max_seconds: float
+    metrics: RateLimiterMetrics
+
+    def __init__(
+        self,
+        requests_per_second: float = REST_RATE_LIMIT_REQUESTS_PER_SECOND,
+        burst: float = REST_RATE_LIMIT_BURST,
+        endpoint_weights: Optional[Dict[str, float]] = None,
+        max_retries: int = REST_MAX_RETRIES,
+        retry_backoff_seconds: float = REST_RETRY_BACKOFF_SECONDS,
+        retry_backoff_max_seconds: float = REST_RETRY_BACKOFF_MAX_SECONDS,
+    ) -> None:
+        """
+        Args:
+            requests_per_second: Sustained rate of weight 1 requests
+            burst: Bucket capacity, the number of weight 1 requests that can be sent at once
+            endpoint_weights: Tokens taken by a request, by endpoint path eg. "/orderbook"
+            max_retries: Times a GET request rejected with 429 is retried, 0 to disable
+            retry_backoff_seconds: Delay before the first retry, doubling for each retry
+            retry_backoff_max_seconds: Maximum delay between retries
+        """
+        if requests_per_second <= 0 or burst <= 0:
+            raise Exception("requests_per_second and burst must be positive")
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.endpoint_weights = endpoint_weights or {}
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.retry_backoff_max_seconds = retry_backoff_max_seconds
+        self.metrics = {
+            "requests": 0,
+            "throttled": 0,
+            "queued": 0,
+            "wait_seconds": 0.0,
+            "rejected": 0,
+            "retried": 0,
+        }
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def get_metrics(self) -> RateLimiterMetrics:
+        with self.lock:
+            return {**self.metrics}  # type: ignore
+
+    def reserve(self, endpoint: str) -> float:
+        """
+        Takes the endpoint's weight from the bucket, which may go negative to queue requests
+        behind each other
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        weight = self.endpoint_weights.get(endpoint, 1)
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated_at) * self.requests_per_second
+            )
+            self.updated_at = now
+            self.tokens -= weight
+            self.metrics["requests"] += 1
+            if self.tokens >= 0:
+                return 0
+            wait_seconds = -self.tokens / self.requests_per_second
+            self.metrics["throttled"] += 1
+            self.metrics["queued"] += 1
+            self.metrics["wait_seconds"] += wait_seconds
+            return wait_seconds
+
+    def _dequeue(self) -> None:
+        with self.lock:
+            self.metrics["queued"] -= 1
+
+    def acquire(self, endpoint: str) -> None:
+        """
+        Blocks until a request to endpoint may be sent
+        """
+        wait_seconds = self.reserve(endpoint)
+        if wait_seconds:
+            try:
+                time.sleep(wait_seconds)
+            finally:
+                self._dequeue()
+
+    async def acquire_async(self, endpoint: str) -> None:
+        """
+        Waits without blocking the event loop until a request to endpoint may be sent
+        """
+        wait_seconds = self.reserve(endpoint)
+        if wait_seconds:
+            try:
+                await asyncio.sleep(wait_seconds)
+            finally:
+                self._dequeue()
+
+    def should_retry(self, method: str, status_code: int, attempt: int) -> bool:
+        """
+        Records a response and decides whether to retry it: only GET requests, which are
+        idempotent, are retried after 429 Too Many Requests
+
+        Args:
+            attempt: Number of times the request was already retried
+        """
+        if status_code != TooManyRequestsError.status_code:
+            return False
+        with self.lock:
+            self.metrics["rejected"] += 1
+            if method != "GET" or attempt >= self.max_retries:
+                return False
+            self.metrics["retried"] += 1
+            return True
+
+    def get_retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Returns:
+            Seconds to wait before retry number attempt (starting at 0), between half and all
+            of the exponential backoff, or the Retry-After header value if it is longer
+        """
+        backoff_seconds = min(
+            self.retry_backoff_max_seconds, self.retry_backoff_seconds * 2 ** min(attempt, 32)
+        )
+        delay = backoff_seconds / 2 + random.uniform(0, backoff_seconds / 2)
+        try:
+            return max(delay, float(retry_after)) if retry_after else delay
+        except ValueError:
+            # Retry-After may also be an HTTP date, which is not worth parsing here
+            return delay
+
+
+def send_with_rate_limit(
+    rate_limiter: Optional[RateLimiter],
+    method: str,
+    endpoint: str,
+    send: Callable[[], requests.Response],
+) -> requests.Response:
+    """
+    Sends a request with requests once the rate limiter allows it, retrying GET requests
+    rejected with 429. send is called again for each retry so it can sign a new request.
+    """
+    if not rate_limiter:
+        return send()
+    attempt = 0
+    while True:
+        rate_limiter.acquire(endpoint)
+        res = send()
+        if not rate_limiter.should_retry(method, res.status_code, attempt):
+            return res
+        time.sleep(rate_limiter.get_retry_delay(attempt, res.headers.get("Retry-After")))
+        attempt += 1
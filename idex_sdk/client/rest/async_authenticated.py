@@ -0,0 +1,448 @@
+import json
+from functools import partial
+from typing import Any, AsyncIterator, List, Optional, Union, cast
+
+import aiohttp
+
+from idex_sdk import signatures as sig
+from idex_sdk.client.json_codec import JsonCodec
+from idex_sdk.client.rate_limit import RateLimiter
+from idex_sdk.client.rest.async_base import AsyncRestClientBase, encode_query_params
+from idex_sdk.client.rest.authenticated import RequestMethodTypes
+from idex_sdk.client.rest.pagination import async_iterate_pages
+from idex_sdk.client.utils import create_hmac_rest_request_signature_header
+from idex_sdk.idex_types.enums import MultiverseChain
+from idex_sdk.idex_types.rest import request, response
+
+
+class AsyncRestAuthenticatedClient(AsyncRestClientBase):
+    """
+    asyncio version of RestAuthenticatedClient with the same methods, which must be awaited
+    """
+
+    api_secret: Optional[str]
+    signer: Optional[sig.MessageSigner] = None
+
+    def __init__(
+        self,
+        api_key: Optional[str],
+        api_secret: Optional[str],
+        wallet_private_key: Optional[str] = None,
+        multiverse_chain: MultiverseChain = MultiverseChain.MATIC,
+        sandbox: bool = False,
+        base_url: Optional[str] = None,
+        json_codec: Optional[JsonCodec] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        """
+        Args:
+            session: aiohttp session to send requests with, shared with other clients. By
+                default the client creates its own session on first use.
+            rate_limiter: Limits the rate of requests and retries GET requests rejected with
+                429 Too Many Requests. Share one between clients to limit them together.
+        """
+        super().__init__(
+            multiverse_chain=multiverse_chain,
+            sandbox=sandbox,
+            base_url=base_url,
+            api_key=api_key,
+            json_codec=json_codec,
+            session=session,
+            rate_limiter=rate_limiter,
+        )
+        self.api_secret = api_secret
+        if wallet_private_key:
+            self.signer = sig.create_private_key_message_signer(wallet_private_key)
+
+    async def _request(
+        self, method: RequestMethodTypes, endpoint: str, params: Any = None, json_body: Any = None
+    ) -> Any:
+        # Sign exactly the query string or body that is sent
+        if method == "GET":
+            query = encode_query_params(params)
+            body = None
+            payload = query
+        else:
+            query = ""
+            body = json.dumps(json_body, separators=(",", ":"))
+            payload = body
+        headers = create_hmac_rest_request_signature_header(
+            secret=cast(str, self.api_secret), payload=payload
+        )
+        return await self._send(method, endpoint, query, body, headers)
+
+    async def _get(self, endpoint: str, params: Any = None) -> Any:
+        return await self._request("GET", endpoint, params=params)
+
+    async def _post(self, endpoint: str, json: Any = None) -> Any:
+        return await self._request("POST", endpoint, json_body=json)
+
+    async def _delete(self, endpoint: str, json: Any = None) -> Any:
+        return await self._request("DELETE", endpoint, json_body=json)
+
+    def _check_signer(self, signer: Optional[sig.MessageSigner]) -> sig.MessageSigner:
+        if not signer:
+            signer = self.signer
+        if not signer:
+            raise Exception(
+                "A 'signer' function is required but was not provided during "
+                "AsyncRestAuthenticatedClient constructor or when calling the method"
+            )
+        return signer
+
+    async def add_liquidity(
+        self,
+        req: request.RestRequestAddLiquidity,
+        signer: Optional[sig.MessageSigner] = None,
+        dependent_transactions: Optional[List[str]] = None,
+    ) -> response.RestResponseLiquidityAddition:
+        """
+        Add liquidity to a hybrid liquidity pool from assets held by a wallet on the exchange
+        """
+        signer = self._check_signer(signer)
+        data = {
+            "parameters": req,
+            "signature": signer(
+                sig.create_add_liquidity_signature_hash(
+                    req,
+                    multiverse_chain=self.multiverse_chain,
+                    sandbox=self.sandbox,
+                )
+            ),
+        }
+        if dependent_transactions:
+            data["dependentTransactions"] = dependent_transactions
+        return await self._post("/addLiquidity", data)
+
+    async def remove_liquidity(
+        self,
+        req: request.RestRequestRemoveLiquidity,
+        signer: Optional[sig.MessageSigner] = None,
+        dependent_transactions: Optional[List[str]] = None,
+    ) -> response.RestResponseLiquidityRemoval:
+        """
+        Remove liquidity from a hybrid liquidity pool represented by LP tokens held by a wallet
+        on the exchange
+        """
+        signer = self._check_signer(signer)
+        data = {
+            "parameters": req,
+            "signature": signer(
+                sig.create_remove_liquidity_signature_hash(
+                    req,
+                    multiverse_chain=self.multiverse_chain,
+                    sandbox=self.sandbox,
+                )
+            ),
+        }
+        if dependent_transactions:
+            data["dependentTransactions"] = dependent_transactions
+        return await self._post("/removeLiquidity", data)
+
+    async def get_liquidity_addition(
+        self,
+        req: request.RestRequestFindLiquidityAddition,
+    ) -> Union[
+        response.RestResponseLiquidityAddition, List[response.RestResponseLiquidityAddition]
+    ]:
+        """
+        Returns information about a single liquidity addition from a wallet
+        """
+        return await self._get("/liquidityAdditions", req)
+
+    async def get_liquidity_additions(
+        self,
+        req: request.RestRequestFindLiquidityChanges,
+    ) -> List[response.RestResponseLiquidityAddition]:
+        """
+        Returns information about multiple liquidity additions from a wallet
+        """
+        return await self._get("/liquidityAdditions", req)
+
+    async def get_liquidity_removal(
+        self,
+        req: request.RestRequestFindLiquidityRemoval,
+    ) -> response.RestResponseLiquidityRemoval:
+        """
+        Returns information about a single liquidity removal from a wallet
+        """
+        return await self._get("/liquidityRemovals", req)
+
+    async def get_liquidity_removals(
+        self,
+        req: request.RestRequestFindLiquidityChanges,
+    ) -> List[response.RestResponseLiquidityRemoval]:
+        """
+        Returns information about multiple liquidity removals from a wallet
+        """
+        return await self._get("/liquidityRemovals", req)
+
+    # User Data Endpoints
+
+    async def get_user(self, nonce: str) -> response.RestResponseUser:
+        """
+        Get account details for the API key's user
+        See https://api-docs-v3.idex.io/#get-user-account
+
+        Args:
+            nonce: UUIDv1
+
+        Returns:
+            Information about the user
+        """
+        return await self._get("/user", {"nonce": nonce})
+
+    async def get_wallets(self, nonce: str) -> List[response.RestResponseWallet]:
+        """
+        Get account details for the API key's user
+        See https://api-docs-v3.idex.io/#get-wallets
+
+        Args:
+            nonce: UUIDv1
+
+        Returns:
+            The user's wallets
+        """
+        return await self._get("/wallets", {"nonce": nonce})
+
+    async def get_balances(
+        self, req: request.RestRequestFindBalances
+    ) -> List[response.RestResponseBalance]:
+        """
+        Get asset quantity data (positions) held by a wallet on the exchange
+        """
+        return await self._get("/balances", req)
+
+    # Wallet Association Endpoint
+
+    async def associate_wallet(
+        self, req: request.RestRequestAssociateWallet, signer: Optional[sig.MessageSigner] = None
+    ) -> response.RestResponseAssociateWallet:
+        """
+        Associate a wallet with the authenticated account
+        See https://api-docs-v3.idex.io/#associate-wallet
+        """
+        signer = self._check_signer(signer)
+        return await self._post(
+            "/wallets",
+            {
+                "parameters": req,
+                "signature": signer(sig.create_associate_wallet_signature_hash(req)),
+            },
+        )
+
+    # Orders & Trade Endpoints
+
+    async def create_order(
+        self, req: request.RestRequestOrder, signer: Optional[sig.MessageSigner] = None
+    ) -> response.RestResponseOrder:
+        """
+        Create and submit an order to the matching engine
+        See https://api-docs-v3.idex.io/#create-order
+        """
+        signer = self._check_signer(signer)
+        return await self._post(
+            "/orders",
+            {
+                "parameters": req,
+                "signature": signer(
+                    sig.create_order_signature_hash(req, self.multiverse_chain, self.sandbox)
+                ),
+            },
+        )
+
+    async def create_test_order(
+        self, req: request.RestRequestOrder, signer: Optional[sig.MessageSigner] = None
+    ) -> response.RestResponseOrder:
+        """
+        Tests order creation and validation without submitting an order to the matching engine
+        See https://api-docs-v3.idex.io/#test-create-order
+        """
+        signer = self._check_signer(signer)
+        return await self._post(
+            "/orders/test",
+            {
+                "parameters": req,
+                "signature": signer(
+                    sig.create_order_signature_hash(req, self.multiverse_chain, self.sandbox)
+                ),
+            },
+        )
+
+    async def cancel_order(
+        self, req: request.RestRequestCancelOrder, signer: Optional[sig.MessageSigner] = None
+    ) -> List[response.RestResponseCanceledOrder]:
+        """
+        Cancel a single order
+        See https://api-docs-v3.idex.io/#cancel-order
+        """
+        signer = self._check_signer(signer)
+        return await self._delete(
+            "/orders",
+            {
+                "parameters": req,
+                "signature": signer(sig.create_cancel_order_signature_hash(req)),
+            },
+        )
+
+    async def cancel_orders(
+        self, req: request.RestRequestCancelOrder, signer: Optional[sig.MessageSigner] = None
+    ) -> List[response.RestResponseCanceledOrder]:
+        """
+        Cancel multiple orders
+        See https://api-docs-v3.idex.io/#cancel-order
+        """
+        signer = self._check_signer(signer)
+        return await self._delete(
+            "/orders",
+            {
+                "parameters": req,
+                "signature": signer(sig.create_cancel_order_signature_hash(req)),
+            },
+        )
+
+    async def get_order(self, req: request.RestRequestFindOrder) -> response.RestResponseOrder:
+        """
+        Get an order
+        See https://api-docs-v3.idex.io/#get-orders
+        """
+        return await self._get("/orders", req)
+
+    async def get_orders(
+        self, req: request.RestRequestFindOrders
+    ) -> List[response.RestResponseOrder]:
+        """
+        Get multiple orders
+        See https://api-docs-v3.idex.io/#get-orders
+        """
+        return await self._get("/orders", req)
+
+    async def get_fill(self, req: request.RestRequestFindFill) -> response.RestResponseFill:
+        """
+        Get a fill
+        See https://api-docs-v3.idex.io/#get-fills
+        """
+        return await self._get("/fills", req)
+
+    async def get_fills(self, req: request.RestRequestFindFills) -> List[response.RestResponseFill]:
+        """
+        Get multiple fills
+        See https://api-docs-v3.idex.io/#get-fills
+        """
+        return await self._get("/fills", req)
+
+    # Deposit Endpoints
+
+    async def get_deposit(
+        self, req: request.RestRequestFindDeposit
+    ) -> response.RestResponseDeposit:
+        """
+        Get a fill
+        See https://api-docs-v3.idex.io/#get-deposits
+        """
+        return await self._get("/deposits", req)
+
+    async def get_deposits(
+        self, req: request.RestRequestFindDeposits
+    ) -> List[response.RestResponseDeposit]:
+        """
+        Get a fill
+        See https://api-docs-v3.idex.io/#get-deposits
+        """
+        return await self._get("/deposits", req)
+
+    # Withdrawal Endpoints
+
+    async def withdraw(
+        self, req: request.RestRequestWithdrawal, signer: Optional[sig.MessageSigner] = None
+    ) -> response.RestResponseWithdrawal:
+        """
+        Create a new withdrawal
+        See https://api-docs-v3.idex.io/#withdraw-funds
+        """
+        signer = self._check_signer(signer)
+        return await self._post(
+            "/withdrawals",
+            {
+                "parameters": req,
+                "signature": signer(sig.create_withdrawal_signature_hash(req)),
+            },
+        )
+
+    async def get_withdrawal(
+        self, req: request.RestRequestFindWithdrawal
+    ) -> response.RestResponseWithdrawal:
+        """
+        Get a withdrawal
+        See https://api-docs-v3.idex.io/#get-withdrawals
+        """
+        return await self._get("/withdrawals", req)
+
+    async def get_withdrawals(
+        self, req: request.RestRequestFindWithdrawals
+    ) -> List[response.RestResponseWithdrawal]:
+        """
+        Get multiple withdrawals
+        See https://api-docs-v3.idex.io/#get-withdrawals
+        """
+        return await self._get("/withdrawals", req)
+
+    # WebSocket Authentication Endpoints
+
+    async def get_ws_token(self, nonce: str, wallet: str) -> str:
+        """
+        Get multiple withdrawals
+        See https://api-docs-v3.idex.io/#get-withdrawals
+        """
+        res = await self._get("/wsToken", {"nonce": nonce, "wallet": wallet})
+        return res["token"]
+
+    # Pagination
+
+    def iter_fills(
+        self, req: request.RestRequestFindFills
+    ) -> AsyncIterator[response.RestResponseFill]:
+        """
+        Iterates over all fills matching the request, oldest first, following the fromId cursor.
+        Each next page is fetched in a task while the previous one is consumed.
+        """
+        return async_iterate_pages(partial(self._get, "/fills"), req, "fillId")
+
+    def iter_orders(
+        self, req: request.RestRequestFindOrders
+    ) -> AsyncIterator[response.RestResponseOrder]:
+        """
+        Iterates over all orders matching the request, oldest first, following the fromId cursor.
+        Each next page is fetched in a task while the previous one is consumed.
+        """
+        return async_iterate_pages(partial(self._get, "/orders"), req, "orderId")
+
+    def iter_deposits(
+        self, req: request.RestRequestFindDeposits
+    ) -> AsyncIterator[response.RestResponseDeposit]:
+        """
+        Iterates over all deposits matching the request, oldest first, following the fromId cursor.
+        Each next page is fetched in a task while the previous one is consumed.
+        """
+        return async_iterate_pages(partial(self._get, "/deposits"), req, "depositId")
+
+    def iter_withdrawals(
+        self, req: request.RestRequestFindWithdrawals
+    ) -> AsyncIterator[response.RestResponseWithdrawal]:
+        """
+        Iterates over all withdrawals matching the request, oldest first, following the fromId
+        cursor. Each next page is fetched in a task while the previous one is consumed.
+        """
+        return async_iterate_pages(partial(self._get, "/withdrawals"), req, "withdrawalId")
+
+    def iter_liquidity_additions(
+        self, req: request.RestRequestFindLiquidityChanges
+    ) -> AsyncIterator[response.RestResponseLiquidityAddition]:
+        """
+        Iterates over all liquidity additions matching the request, oldest first, following the
+        fromId cursor. Each next page is fetched in a task while the previous one is consumed.
+        """
+        return async_iterate_pages(
+            partial(self._get, "/liquidityAdditions"), req, "liquidityAdditionId"
+        )
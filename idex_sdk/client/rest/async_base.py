@@ -0,0 +1,146 @@
+import asyncio
+from types import TracebackType
+from typing import Any, Dict, Mapping, Optional, Type, TypeVar
+from urllib.parse import urlencode
+
+import aiohttp
+
+from idex_sdk.client.json_codec import JsonCodec, get_default_json_codec
+from idex_sdk.client.rate_limit import RateLimiter
+from idex_sdk.client.utils import derive_base_url
+from idex_sdk.constants import REST_API_KEY_HEADER
+from idex_sdk.idex_types.enums import MultiverseChain
+from idex_sdk.idex_types.errors import check_response_status
+
+AsyncRestClientType = TypeVar("AsyncRestClientType", bound="AsyncRestClientBase")
+
+
+def encode_query_params(params: Optional[Mapping[str, Any]]) -> str:
+    """
+    Encodes GET parameters the way the synchronous clients send them: parameters set to None
+    are omitted and booleans are sent as True or False
+    """
+    if not params:
+        return ""
+    return urlencode(
+        {
+            key: str(value) if isinstance(value, bool) else value
+            for key, value in params.items()
+            if value is not None
+        }
+    )
+
+
+class AsyncRestClientBase:
+    """
+    Connection handling shared by the asyncio REST clients
+
+    Requests use a pooled aiohttp.ClientSession, created on first use unless one is passed to
+    the constructor. Pass the same session to several clients to share their connection pool.
+    A session created by the client is closed by close(), or on leaving `async with client`.
+    """
+
+    base_url: str
+    multiverse_chain: MultiverseChain
+    sandbox: bool
+    json_codec: JsonCodec
+    headers: Dict[str, str]
+    session: Optional[aiohttp.ClientSession]
+    rate_limiter: Optional[RateLimiter]
+
+    def __init__(
+        self,
+        multiverse_chain: MultiverseChain = MultiverseChain.MATIC,
+        sandbox: bool = False,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        json_codec: Optional[JsonCodec] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        self.base_url = derive_base_url(
+            api_type="rest",
+            multiverse_chain=multiverse_chain,
+            sandbox=sandbox,
+            override_base_url=base_url,
+        )
+        self.multiverse_chain = multiverse_chain
+        self.sandbox = sandbox
+        self.json_codec = json_codec or get_default_json_codec()
+        self.headers = {REST_API_KEY_HEADER: api_key} if api_key else {}
+        self.session = session
+        self.rate_limiter = rate_limiter
+        self._owns_session = session is None
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """
+        The session requests are sent with, which can be passed to other clients to share it
+        """
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession()
+            self._owns_session = True
+        return self.session
+
+    async def close(self) -> None:
+        """
+        Close the client's HTTP session, unless it was passed to the constructor
+        """
+        if self._owns_session and self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    async def __aenter__(self: AsyncRestClientType) -> AsyncRestClientType:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        query: str = "",
+        body: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        return self.json_codec.loads(
+            await self._send_content(method, endpoint, query, body, headers)
+        )
+
+    async def _send_content(
+        self,
+        method: str,
+        endpoint: str,
+        query: str = "",
+        body: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> bytes:
+        """
+        Sends a request, retrying it if the rate limiter allows, and returns the raw response
+        body of a successful response
+        """
+        url = self.base_url + endpoint + (f"?{query}" if query else "")
+        request_headers = {**self.headers, **(headers or {})}
+        if body is not None:
+            request_headers["Content-Type"] = "application/json"
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async(endpoint)
+            async with self.get_session().request(
+                method, url, data=body, headers=request_headers
+            ) as res:
+                content = await res.read()
+                status = res.status
+                retry_after = res.headers.get("Retry-After")
+            if not self.rate_limiter or not self.rate_limiter.should_retry(method, status, attempt):
+                break
+            await asyncio.sleep(self.rate_limiter.get_retry_delay(attempt, retry_after))
+            attempt += 1
+        check_response_status(status, content.decode("utf-8", errors="replace"))
+        return content
@@ -0,0 +1,195 @@
+from functools import partial
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import aiohttp
+
+from idex_sdk.client.json_codec import JsonCodec
+from idex_sdk.client.rate_limit import RateLimiter
+from idex_sdk.client.rest.async_base import AsyncRestClientBase, encode_query_params
+from idex_sdk.client.rest.cache import get_request_key
+from idex_sdk.client.rest.pagination import async_iterate_pages
+from idex_sdk.client.rest.single_flight import AsyncSingleFlight
+from idex_sdk.idex_types.enums import MultiverseChain
+from idex_sdk.idex_types.rest.request import (
+    RestRequestFindCandles,
+    RestRequestFindLiquidityPools,
+    RestRequestFindMarkets,
+    RestRequestFindTrades,
+)
+from idex_sdk.idex_types.rest.response import (
+    RestResponseAsset,
+    RestResponseCandle,
+    RestResponseExchangeInfo,
+    RestResponseLiquidityPool,
+    RestResponseMarket,
+    RestResponseOrderBook,
+    RestResponseTicker,
+    RestResponseTrade,
+)
+
+
+class AsyncRestPublicClient(AsyncRestClientBase):
+    """
+    asyncio version of RestPublicClient with the same methods, which must be awaited
+    """
+
+    single_flight: Optional[AsyncSingleFlight]
+
+    def __init__(
+        self,
+        multiverse_chain: MultiverseChain = MultiverseChain.MATIC,
+        sandbox: bool = False,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        json_codec: Optional[JsonCodec] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        single_flight: Optional[AsyncSingleFlight] = None,
+        should_coalesce_requests: bool = True,
+    ) -> None:
+        """
+        Args:
+            session: aiohttp session to send requests with, shared with other clients. By
+                default the client creates its own session on first use.
+            rate_limiter: Limits the rate of requests and retries GET requests rejected with
+                429 Too Many Requests. Share one between clients to limit them together.
+            single_flight: Shares identical concurrent GET requests between coroutines, so
+                they send one request and decode its response separately. Pass the same one to
+                several clients to coalesce their requests together.
+            should_coalesce_requests: If false, and no single_flight is given, every GET
+                request is sent separately
+        """
+        super().__init__(
+            multiverse_chain=multiverse_chain,
+            sandbox=sandbox,
+            base_url=base_url,
+            api_key=api_key,
+            json_codec=json_codec,
+            session=session,
+            rate_limiter=rate_limiter,
+        )
+        self.single_flight = single_flight or (
+            AsyncSingleFlight() if should_coalesce_requests else None
+        )
+
+    async def _get(self, endpoint: str, params: Any = None) -> Any:
+        if not self.single_flight:
+            return await self._send("GET", endpoint, encode_query_params(params))
+        # Keyed by url, the single flight may be shared with clients of other APIs
+        content = await self.single_flight.do(
+            get_request_key(self.base_url + endpoint, params),
+            partial(self._send_content, "GET", endpoint, encode_query_params(params)),
+        )
+        return self.json_codec.loads(content)
+
+    # Public Data Endpoints
+
+    async def ping(self) -> Dict:
+        """
+        Test connectivity to the REST API
+        See https://api-docs-v3.idex.io/#get-ping
+        """
+        return await self._get("/ping")
+
+    async def get_server_time(self) -> int:
+        """
+        Returns the current server time
+        See https://api-docs-v3.idex.io/#get-time
+        """
+        res = await self._get("/time")
+        return res["serverTime"]
+
+    async def get_exchange_info(self) -> RestResponseExchangeInfo:
+        """
+        Returns basic information about the exchange
+        See https://api-docs-v3.idex.io/#get-exchange
+        """
+        return await self._get("/exchange")
+
+    async def get_assets(self) -> List[RestResponseAsset]:
+        """
+        Returns information about assets supported by the exchange
+        See https://api-docs-v3.idex.io/#get-assets
+        """
+        return await self._get("/assets")
+
+    async def get_markets(
+        self, find_markets: Optional[RestRequestFindMarkets] = None
+    ) -> List[RestResponseMarket]:
+        """
+        Returns information about the currently listed markets
+        See https://api-docs-v3.idex.io/#get-markets
+        """
+        return await self._get("/markets", find_markets)
+
+    async def get_liquidity_pools(
+        self, find_liquidity_pools: Optional[RestRequestFindLiquidityPools] = None
+    ) -> List[RestResponseLiquidityPool]:
+        """
+        Returns information about liquidity pools supported by the exchange
+        See https://api-docs-v3.idex.io/#get-liquidity-pools
+        """
+        return await self._get("/liquidityPools", find_liquidity_pools)
+
+    # Market Data Endpoints
+
+    async def get_tickers(self, market: Optional[str] = None) -> List[RestResponseTicker]:
+        """
+        Returns market statistics for the trailing 24-hour period
+        """
+        return await self._get("/tickers", {"market": market})
+
+    async def get_candles(self, find_candles: RestRequestFindCandles) -> List[RestResponseCandle]:
+        """
+        Returns candle (OHLCV) data for a market
+        See https://api-docs-v3.idex.io/#get-candles
+        """
+        return await self._get("/candles", find_candles)
+
+    async def get_trades(self, find_trades: RestRequestFindTrades) -> List[RestResponseTrade]:
+        """
+        Returns public trade data for a market
+        See https://api-docs-v3.idex.io/#get-trades
+        """
+        return await self._get("/trades", find_trades)
+
+    async def get_order_book_level1(
+        self, market: str, limit_order_only: bool = False
+    ) -> List[RestResponseOrderBook]:
+        """
+        Get current top bid/ask price levels of order book for a market
+        See https://api-docs-v3.idex.io/#get-order-books
+        """
+        return await self._get(
+            "/orderbook", {"level": 1, "limitOrderOnly": limit_order_only, "market": market}
+        )
+
+    async def get_order_book_level2(
+        self, market: str, limit: int = 50, limit_order_only: bool = False
+    ) -> RestResponseOrderBook:
+        """
+        Get current order book price levels for a market
+        See https://api-docs-v3.idex.io/#get-order-books
+        """
+        return await self._get(
+            "/orderbook",
+            {"level": 2, "limit": limit, "limitOrderOnly": limit_order_only, "market": market},
+        )
+
+    # Pagination
+
+    def iter_trades(self, find_trades: RestRequestFindTrades) -> AsyncIterator[RestResponseTrade]:
+        """
+        Iterates over all trades matching the request, oldest first, following the fromId cursor.
+        Each next page is fetched in a task while the previous one is consumed.
+        """
+        return async_iterate_pages(partial(self._get, "/trades"), find_trades, "fillId")
+
+    def iter_candles(
+        self, find_candles: RestRequestFindCandles
+    ) -> AsyncIterator[RestResponseCandle]:
+        """
+        Iterates over all candles matching the request, oldest first, following the start cursor.
+        Each next page is fetched in a task while the previous one is consumed.
+        """
+        return async_iterate_pages(partial(self._get, "/candles"), find_candles, None)
@@ -1,10 +1,14 @@
 import json
-from typing import Any, Dict, List, Literal, Optional, Union, cast
+from functools import partial
+from typing import Any, Dict, Iterator, List, Literal, Optional, Union, cast
 from urllib.parse import urlencode
 
 import requests
 
 from idex_sdk import signatures as sig
+from idex_sdk.client.json_codec import JsonCodec, get_default_json_codec
+from idex_sdk.client.rate_limit import RateLimiter, send_with_rate_limit
+from idex_sdk.client.rest.pagination import iterate_pages
 from idex_sdk.client.utils import (
     create_hmac_rest_request_signature_header,
     derive_base_url,
@@ -24,6 +28,8 @@ class RestAuthenticatedClient:
     multiverse_chain: MultiverseChain
     sandbox: bool
     session: requests.Session
+    json_codec: JsonCodec
+    rate_limiter: Optional[RateLimiter]
 
     def __init__(
         self,
@@ -33,7 +39,14 @@ class RestAuthenticatedClient:
         multiverse_chain: MultiverseChain = MultiverseChain.MATIC,
         sandbox: bool = False,
         base_url: Optional[str] = None,
+        json_codec: Optional[JsonCodec] = None,
+        rate_limiter: Optional[RateLimiter] = None,
     ) -> None:
+        """
+        Args:
+            rate_limiter: Limits the rate of requests and retries GET requests rejected with
+                429 Too Many Requests. Share one between clients to limit them together.
+        """
         self.base_url = derive_base_url(
             api_type="rest",
             multiverse_chain=multiverse_chain,
@@ -46,6 +59,8 @@ class RestAuthenticatedClient:
         if wallet_private_key:
             self.signer = sig.create_private_key_message_signer(wallet_private_key)
         self.session = requests.Session()
+        self.json_codec = json_codec or get_default_json_codec()
+        self.rate_limiter = rate_limiter
         if api_key:
             self.session.headers[REST_API_KEY_HEADER] = api_key
 
@@ -61,11 +76,14 @@ class RestAuthenticatedClient:
         )
 
     def _request(self, method: RequestMethodTypes, endpoint: str, **kwargs: Any) -> Any:
-        headers = dict(self.session.headers)
-        headers.update(self._create_request_signature_header(method, **kwargs))
-        res = self.session.request(method, self.base_url + endpoint, headers=headers, **kwargs)
+        def send() -> requests.Response:
+            headers = dict(self.session.headers)
+            headers.update(self._create_request_signature_header(method, **kwargs))
+            return self.session.request(method, self.base_url + endpoint, headers=headers, **kwargs)
+
+        res = send_with_rate_limit(self.rate_limiter, method, endpoint, send)
         check_response_errors(res)
-        return res.json()
+        return self.json_codec.loads(res.content)
 
     def _get(self, endpoint: str, params: Any = None) -> Any:
         return self._request("GET", endpoint, params=params)
@@ -387,3 +405,49 @@ class RestAuthenticatedClient:
         See https://api-docs-v3.idex.io/#get-withdrawals
         """
         return self._get("/wsToken", {"nonce": nonce, "wallet": wallet})["token"]
+
+    # Pagination
+
+    def iter_fills(self, req: request.RestRequestFindFills) -> Iterator[response.RestResponseFill]:
+        """
+        Iterates over all fills matching the request, oldest first, following the fromId cursor.
+        Each next page is fetched on a background thread while the previous one is consumed.
+        """
+        return iterate_pages(partial(self._get, "/fills"), req, "fillId")
+
+    def iter_orders(
+        self, req: request.RestRequestFindOrders
+    ) -> Iterator[response.RestResponseOrder]:
+        """
+        Iterates over all orders matching the request, oldest first, following the fromId cursor.
+        Each next page is fetched on a background thread while the previous one is consumed.
+        """
+        return iterate_pages(partial(self._get, "/orders"), req, "orderId")
+
+    def iter_deposits(
+        self, req: request.RestRequestFindDeposits
+    ) -> Iterator[response.RestResponseDeposit]:
+        """
+        Iterates over all deposits matching the request, oldest first, following the fromId cursor.
+        Each next page is fetched on a background thread while the previous one is consumed.
+        """
+        return iterate_pages(partial(self._get, "/deposits"), req, "depositId")
+
+    def iter_withdrawals(
+        self, req: request.RestRequestFindWithdrawals
+    ) -> Iterator[response.RestResponseWithdrawal]:
+        """
+        Iterates over all withdrawals matching the request, oldest first, following the fromId
+        cursor. Each next page is fetched on a background thread while the previous one is consumed.
+        """
+        return iterate_pages(partial(self._get, "/withdrawals"), req, "withdrawalId")
+
+    def iter_liquidity_additions(
+        self, req: request.RestRequestFindLiquidityChanges
+    ) -> Iterator[response.RestResponseLiquidityAddition]:
+        """
+        Iterates over all liquidity additions matching the request, oldest first, following the
+        fromId cursor. Each next page is fetched on a background thread while the previous one is
+        consumed.
+        """
+        return iterate_pages(partial(self._get, "/liquidityAdditions"), req, "liquidityAdditionId")
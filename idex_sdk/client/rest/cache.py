@@ -0,0 +1,95 @@
+import threading
+import time
+from typing import Any, Dict, Hashable, Mapping, NamedTuple, Optional, Tuple
+
+# Endpoint (or url) and sorted query params of a GET request
+RequestKey = Tuple[str, Hashable]
+
+
+def get_request_key(endpoint: str, params: Optional[Mapping[str, Any]]) -> RequestKey:
+    if not params:
+        return (endpoint, ())
+    return (
+        endpoint,
+        tuple(sorted((key, value) for key, value in params.items() if value is not None)),
+    )
+
+
+class CachedResponse(NamedTuple):
+    """
+    Raw response body, decoded again on every hit so callers cannot modify cached data
+
+    Attributes:
+        content: response body
+        expires_at: time.monotonic() after which the response is revalidated
+        etag: ETag header, sent as If-None-Match when revalidating
+        last_modified: Last-Modified header, sent as If-Modified-Since when revalidating
+    """
+
+    content: bytes
+    expires_at: float
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+    def is_fresh(self) -> bool:
+        return self.expires_at > time.monotonic()
+
+    def get_revalidation_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Thread-safe cache of GET responses for endpoints with a TTL
+    """
+
+    ttls: Dict[str, float]
+    responses: Dict[RequestKey, CachedResponse]
+    stats: Dict[str, int]
+
+    def __init__(self, ttls: Mapping[str, float]) -> None:
+        self.ttls = dict(ttls)
+        self.responses = {}
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0}
+        self.lock = threading.Lock()
+
+    def get(self, key: RequestKey) -> Optional[CachedResponse]:
+        with self.lock:
+            response = self.responses.get(key)
+            if response and response.is_fresh():
+                self.stats["hits"] += 1
+            else:
+                self.stats["misses"] += 1
+            return response
+
+    def set(
+        self,
+        key: RequestKey,
+        content: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        expires_at = time.monotonic() + self.ttls[key[0]]
+        with self.lock:
+            self.responses[key] = CachedResponse(content, expires_at, etag, last_modified)
+
+    def revalidated(self, key: RequestKey, response: CachedResponse) -> None:
+        """
+        Extends a cached response after the API answered 304 Not Modified
+        """
+        with self.lock:
+            self.stats["revalidated"] += 1
+            self.responses[key] = response._replace(expires_at=time.monotonic() + self.ttls[key[0]])
+
+    def invalidate(self, endpoint: Optional[str] = None) -> None:
+        with self.lock:
+            if endpoint is None:
+                self.responses.clear()
+                return
+            for key in [key for key in self.responses if key[0] == endpoint]:
+                del self.responses[key]
@@ -0,0 +1,130 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    TypeVar,
+)
+from uuid import uuid1
+
+from idex_sdk.constants import REST_PAGINATION_PAGE_SIZE
+
+T = TypeVar("T")
+
+
+class _PageCursor:
+    """
+    Walks the fromId (or start) cursor of a paginated endpoint forward, skipping the record a
+    fromId page starts with when it was already returned on the previous page
+    """
+
+    def __init__(self, request: Optional[Mapping[str, Any]], id_key: Optional[str]) -> None:
+        self.request: Dict[str, Any] = dict(request or {})
+        self.request.setdefault("limit", REST_PAGINATION_PAGE_SIZE)
+        self.limit: int = self.request["limit"]
+        # Each fromId page starts with the previous page's last record, so a page of one record
+        # would never get past it
+        if id_key and self.limit < 2:
+            raise Exception("limit must be at least 2 to paginate by fromId")
+        self.id_key = id_key
+        self.previous_ids: Set[str] = set()
+
+    def first_request(self) -> Dict[str, Any]:
+        return dict(self.request)
+
+    def records(self, page: List[Any]) -> List[Any]:
+        if self.id_key and self.previous_ids:
+            return [record for record in page if record[self.id_key] not in self.previous_ids]
+        return page
+
+    def next_request(self, page: List[Any]) -> Optional[Dict[str, Any]]:
+        """
+        Returns:
+            The request for the page after page, None if page was the last one
+        """
+        if len(page) < self.limit:
+            return None
+        request = dict(self.request)
+        if self.id_key:
+            self.previous_ids = {record[self.id_key] for record in page}
+            request["fromId"] = page[-1][self.id_key]
+        else:
+            request["start"] = page[-1]["start"] + 1
+        if "nonce" in request:
+            # Authenticated requests need a new nonce each
+            request["nonce"] = str(uuid1())
+        self.request = request
+        return request
+
+
+def iterate_pages(
+    fetch_page: Callable[[Dict[str, Any]], List[T]],
+    request: Optional[Mapping[str, Any]],
+    id_key: Optional[str],
+) -> Iterator[T]:
+    """
+    Yields the records of every page of a paginated endpoint, oldest first, fetching the next
+    page on a background thread while the current one is consumed. At most two pages are held
+    in memory.
+
+    Args:
+        fetch_page: Blocking function requesting one page
+        request: Request of the first page; limit sets the page size and defaults to
+            REST_PAGINATION_PAGE_SIZE. It must be at least 2 when paginating by fromId.
+        id_key: Record field passed as fromId to request the next page, or None to paginate
+            by the start timestamp of records (candles)
+    """
+    return _iterate_pages(fetch_page, _PageCursor(request, id_key))
+
+
+def _iterate_pages(
+    fetch_page: Callable[[Dict[str, Any]], List[T]], cursor: _PageCursor
+) -> Iterator[T]:
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="idex-rest-pagination")
+    try:
+        page: Optional[List[T]] = fetch_page(cursor.first_request())
+        while page:
+            records = cursor.records(page)
+            next_request = cursor.next_request(page)
+            next_page = executor.submit(fetch_page, next_request) if next_request else None
+            yield from records
+            page = next_page.result() if next_page else None
+    finally:
+        executor.shutdown(wait=False)
+
+
+def async_iterate_pages(
+    fetch_page: Callable[[Dict[str, Any]], Awaitable[List[T]]],
+    request: Optional[Mapping[str, Any]],
+    id_key: Optional[str],
+) -> AsyncIterator[T]:
+    """
+    asyncio version of iterate_pages, fetching the next page in a task
+    """
+    return _async_iterate_pages(fetch_page, _PageCursor(request, id_key))
+
+
+async def _async_iterate_pages(
+    fetch_page: Callable[[Dict[str, Any]], Awaitable[List[T]]], cursor: _PageCursor
+) -> AsyncIterator[T]:
+    next_page: Optional["asyncio.Future[List[T]]"] = None
+    try:
+        page: Optional[List[T]] = await fetch_page(cursor.first_request())
+        while page:
+            records = cursor.records(page)
+            next_request = cursor.next_request(page)
+            next_page = asyncio.ensure_future(fetch_page(next_request)) if next_request else None
+            for record in records:
+                yield record
+            page = await next_page if next_page else None
+    finally:
+        if next_page and not next_page.done():
+            next_page.cancel()
@@ -1,7 +1,13 @@
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Dict, Iterator, List, Mapping, Optional
 
 import requests
 
+from idex_sdk.client.json_codec import JsonCodec, get_default_json_codec
+from idex_sdk.client.rate_limit import RateLimiter, send_with_rate_limit
+from idex_sdk.client.rest.cache import ResponseCache, get_request_key
+from idex_sdk.client.rest.pagination import iterate_pages
+from idex_sdk.client.rest.single_flight import SingleFlight
 from idex_sdk.client.utils import derive_base_url
 from idex_sdk.constants import REST_API_KEY_HEADER
 from idex_sdk.idex_types.enums import MultiverseChain
@@ -29,6 +35,10 @@ class RestPublicClient:
     multiverse_chain: MultiverseChain
     sandbox: bool
     session: requests.Session
+    json_codec: JsonCodec
+    rate_limiter: Optional[RateLimiter]
+    response_cache: Optional[ResponseCache]
+    single_flight: Optional[SingleFlight]
 
     def __init__(
         self,
@@ -36,7 +46,26 @@ class RestPublicClient:
         sandbox: bool = False,
         base_url: Optional[str] = None,
         api_key: Optional[str] = None,
+        json_codec: Optional[JsonCodec] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache_ttls: Optional[Mapping[str, float]] = None,
+        single_flight: Optional[SingleFlight] = None,
+        should_coalesce_requests: bool = True,
     ) -> None:
+        """
+        Args:
+            rate_limiter: Limits the rate of requests and retries GET requests rejected with
+                429 Too Many Requests. Share one between clients to limit them together.
+            cache_ttls: Enables caching responses of the given endpoints (eg. "/markets") for
+                their TTL in seconds. Expired responses are revalidated with the ETag and
+                Last-Modified headers when the API sends them. See REST_RESPONSE_CACHE_TTLS
+                in idex_sdk.constants for suggested TTLs of reference data endpoints.
+            single_flight: Shares identical concurrent GET requests between threads, so they
+                send one request and decode its response separately. Pass the same one to
+                several clients to coalesce their requests together.
+            should_coalesce_requests: If false, and no single_flight is given, every GET
+                request is sent separately
+        """
         self.base_url = derive_base_url(
             api_type="rest",
             multiverse_chain=multiverse_chain,
@@ -46,13 +75,73 @@ class RestPublicClient:
         self.multiverse_chain = multiverse_chain
         self.sandbox = sandbox
         self.session = requests.Session()
+        self.json_codec = json_codec or get_default_json_codec()
+        self.rate_limiter = rate_limiter
+        self.response_cache = ResponseCache(cache_ttls) if cache_ttls else None
+        self.single_flight = single_flight or (SingleFlight() if should_coalesce_requests else None)
         if api_key:
             self.session.headers[REST_API_KEY_HEADER] = api_key
 
+    def _send_get(
+        self, endpoint: str, params: Any = None, headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
+        return send_with_rate_limit(
+            self.rate_limiter,
+            "GET",
+            endpoint,
+            partial(self.session.get, self.base_url + endpoint, params=params, headers=headers),
+        )
+
     def _get(self, endpoint: str, params: Any = None) -> Any:
-        res = self.session.get(self.base_url + endpoint, params=params)
+        if self.single_flight:
+            # Keyed by url, the single flight may be shared with clients of other APIs
+            content = self.single_flight.do(
+                get_request_key(self.base_url + endpoint, params),
+                partial(self._get_content, endpoint, params),
+            )
+        else:
+            content = self._get_content(endpoint, params)
+        return self.json_codec.loads(content)
+
+    def _get_content(self, endpoint: str, params: Any) -> bytes:
+        if self.response_cache and endpoint in self.response_cache.ttls:
+            return self._get_cached_content(endpoint, params)
+        res = self._send_get(endpoint, params)
         check_response_errors(res)
-        return res.json()
+        return res.content
+
+    def _get_cached_content(self, endpoint: str, params: Any) -> bytes:
+        assert self.response_cache
+        key = get_request_key(endpoint, params)
+        cached = self.response_cache.get(key)
+        if cached and cached.is_fresh():
+            return cached.content
+
+        res = self._send_get(
+            endpoint, params, cached.get_revalidation_headers() if cached else None
+        )
+        if cached and res.status_code == 304:
+            self.response_cache.revalidated(key, cached)
+            return cached.content
+        check_response_errors(res)
+        self.response_cache.set(
+            key, res.content, res.headers.get("ETag"), res.headers.get("Last-Modified")
+        )
+        return res.content
+
+    def invalidate_cache(self, endpoint: Optional[str] = None) -> None:
+        """
+        Discard cached responses of an endpoint (eg. "/markets"), or of all endpoints
+        """
+        if self.response_cache:
+            self.response_cache.invalidate(endpoint)
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """
+        Returns:
+            Response cache hits, misses and responses revalidated with 304 Not Modified
+        """
+        return dict(self.response_cache.stats) if self.response_cache else {}
 
     # Public Data Endpoints
 
@@ -147,3 +236,19 @@ class RestPublicClient:
             "/orderbook",
             {"level": 2, "limit": limit, "limitOrderOnly": limit_order_only, "market": market},
         )
+
+    # Pagination
+
+    def iter_trades(self, find_trades: RestRequestFindTrades) -> Iterator[RestResponseTrade]:
+        """
+        Iterates over all trades matching the request, oldest first, following the fromId cursor.
+        Each next page is fetched on a background thread while the previous one is consumed.
+        """
+        return iterate_pages(partial(self._get, "/trades"), find_trades, "fillId")
+
+    def iter_candles(self, find_candles: RestRequestFindCandles) -> Iterator[RestResponseCandle]:
+        """
+        Iterates over all candles matching the request, oldest first, following the start cursor.
+        Each next page is fetched on a background thread while the previous one is consumed.
+        """
+        return iterate_pages(partial(self._get, "/candles"), find_candles, None)
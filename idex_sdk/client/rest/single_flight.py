@@ -0,0 +1,99 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict
+
+from idex_sdk.client.rest.cache import RequestKey
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent requests: while a request is in flight, threads making the
+    same request wait for its result instead of sending their own. Share one between clients
+    to coalesce their requests too.
+    """
+
+    calls: Dict[RequestKey, "Future[bytes]"]
+    coalesced: int
+
+    def __init__(self) -> None:
+        self.calls = {}
+        self.coalesced = 0
+        self.lock = threading.Lock()
+
+    def do(self, key: RequestKey, send: Callable[[], bytes]) -> bytes:
+        """
+        Calls send, unless a call with the same key is in flight, and returns its result
+
+        Args:
+            key: Identifies identical requests
+            send: Blocking function sending the request and returning the raw response body,
+                which every caller decodes separately so they do not share mutable results
+
+        Returns:
+            The raw response body. Exceptions raised by send are raised in every caller.
+        """
+        with self.lock:
+            in_flight = self.calls.get(key)
+            if in_flight:
+                self.coalesced += 1
+            else:
+                future: "Future[bytes]" = Future()
+                self.calls[key] = future
+        if in_flight:
+            return in_flight.result()
+
+        try:
+            content = send()
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+        self._finish(key)
+        future.set_result(content)
+        return content
+
+    def _finish(self, key: RequestKey) -> None:
+        # Requests made from now on are sent again, rather than receiving this result
+        with self.lock:
+            del self.calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    asyncio version of SingleFlight: while a request is in flight, coroutines making the same
+    request await the task sending it instead of sending their own. Cancelling one of them does
+    not cancel the request for the others.
+    """
+
+    calls: Dict[RequestKey, "asyncio.Task[bytes]"]
+    coalesced: int
+
+    def __init__(self) -> None:
+        self.calls = {}
+        self.coalesced = 0
+
+    async def do(self, key: RequestKey, send: Callable[[], Awaitable[bytes]]) -> bytes:
+        """
+        Awaits send, unless a call with the same key is in flight, and returns its result
+
+        Args:
+            key: Identifies identical requests
+            send: Coroutine function sending the request and returning the raw response body,
+                which every caller decodes separately so they do not share mutable results
+
+        Returns:
+            The raw response body. Exceptions raised by send are raised in every caller.
+        """
+        task = self.calls.get(key)
+        if task:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(send())
+            self.calls[key] = task
+            task.add_done_callback(lambda _: self._finish(key))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: RequestKey) -> None:
+        # Requests made from now on are sent again, rather than receiving this result
+        del self.calls[key]
@@ -0,0 +1,192 @@
+import asyncio
+import time
+from concurrent.futures import Executor
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+from uuid import uuid1
+
+from idex_sdk.client.rest.authenticated import RestAuthenticatedClient
+from idex_sdk.constants import (
+    WEBSOCKET_AUTH_TOKEN_REFRESH_MARGIN_SECONDS,
+    WEBSOCKET_AUTH_TOKEN_TTL_SECONDS,
+)
+from idex_sdk.idex_types.enums import MultiverseChain
+
+
+def rest_websocket_auth_token_fetch(
+    api_key: str,
+    api_secret: str,
+    multiverse_chain: MultiverseChain = MultiverseChain.MATIC,
+    sandbox: bool = False,
+) -> Callable[[str], str]:
+    """
+    Returns:
+        A websocket_auth_token_fetch function that requests tokens from the REST API, reusing a
+        single RestAuthenticatedClient (and its HTTP session) for every wallet
+    """
+    rest_client: Optional[RestAuthenticatedClient] = None
+
+    def fetch(wallet_address: str) -> str:
+        nonlocal rest_client
+        if rest_client is None:
+            rest_client = RestAuthenticatedClient(
+                api_key=api_key,
+                api_secret=api_secret,
+                multiverse_chain=multiverse_chain,
+                sandbox=sandbox,
+            )
+        return rest_client.get_ws_token(str(uuid1()), wallet_address)
+
+    return fetch
+
+
+class WebSocketAuthTokenCache:
+    """
+    Caches WebSocket authentication tokens by wallet
+
+    Tokens are fetched on a thread pool so several wallets can be fetched concurrently without
+    blocking the event loop, and concurrent requests for the same wallet share one fetch. Once
+    fetched, a wallet's token is refreshed in the background shortly before it expires, for as
+    long as an owner that requested it (eg. a WebSocketClient sharing the cache) has not
+    called cancel_refresh() for it.
+    """
+
+    fetch: Callable[[str], str]
+    ttl_seconds: float
+    refresh_margin_seconds: float
+    executor: Optional[Executor]
+    # Token and its expiry time (time.monotonic) by wallet
+    tokens: Dict[str, Tuple[str, float]]
+    pending_fetches: Dict[str, "asyncio.Future[str]"]
+    refresh_handles: Dict[str, asyncio.TimerHandle]
+    # Owners that keep each wallet's token refreshed
+    refresh_owners: Dict[str, Set[Hashable]]
+
+    def __init__(
+        self,
+        fetch: Callable[[str], str],
+        ttl_seconds: float = WEBSOCKET_AUTH_TOKEN_TTL_SECONDS,
+        refresh_margin_seconds: float = WEBSOCKET_AUTH_TOKEN_REFRESH_MARGIN_SECONDS,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Args:
+            fetch: Blocking function returning a new token for a wallet
+            ttl_seconds: How long a token is used after it was fetched
+            refresh_margin_seconds: How long before expiry a token is refreshed
+            executor: Thread pool to fetch tokens on, defaults to the event loop's executor
+        """
+        self.fetch = fetch
+        self.ttl_seconds = ttl_seconds
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self.executor = executor
+        self.tokens = {}
+        self.pending_fetches = {}
+        self.refresh_handles = {}
+        self.refresh_owners = {}
+
+    def get_cached(self, wallet: str) -> Optional[str]:
+        """
+        Returns:
+            The wallet's token if one is cached and not expired
+        """
+        cached = self.tokens.get(wallet)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+        return None
+
+    async def get(self, wallet: str, owner: Optional[Hashable] = None) -> str:
+        """
+        Args:
+            wallet
+            owner: Keeps the wallet's token refreshed until cancel_refresh is called with this
+                owner, defaults to the cache itself
+
+        Returns:
+            A valid token for the wallet, fetching one if none is cached
+        """
+        self.refresh_owners.setdefault(wallet, set()).add(self if owner is None else owner)
+        token = self.get_cached(wallet)
+        if token is not None:
+            if wallet not in self.refresh_handles:
+                self._schedule_refresh(wallet, self.tokens[wallet][1])
+            return token
+        return await asyncio.shield(self._fetch_once(wallet))
+
+    async def get_many(self, wallets: Sequence[str], owner: Optional[Hashable] = None) -> List[str]:
+        """
+        Returns:
+            Tokens for the wallets in the same order, fetched concurrently
+        """
+        return list(await asyncio.gather(*[self.get(wallet, owner) for wallet in wallets]))
+
+    def invalidate(self, wallet: Optional[str] = None) -> None:
+        """
+        Discard the cached token of a wallet, or of all wallets if none is given
+        """
+        for _wallet in [wallet] if wallet else list(self.tokens):
+            self.tokens.pop(_wallet, None)
+            handle = self.refresh_handles.pop(_wallet, None)
+            if handle:
+                handle.cancel()
+
+    def cancel_refresh(
+        self, owner: Optional[Hashable] = None, wallets: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        Stop refreshing tokens in the background, cached tokens remain usable until they expire
+
+        Args:
+            owner: Only stop refreshing for this owner, tokens still requested by other owners
+                keep being refreshed. If not given, refreshing stops for every owner.
+            wallets: Only stop refreshing these wallets, defaults to all wallets
+        """
+        for wallet in list(self.refresh_owners if wallets is None else wallets):
+            owners = self.refresh_owners.get(wallet)
+            if owners is None:
+                continue
+            if owner is None:
+                owners.clear()
+            else:
+                owners.discard(owner)
+            if not owners:
+                del self.refresh_owners[wallet]
+                handle = self.refresh_handles.pop(wallet, None)
+                if handle:
+                    handle.cancel()
+
+    def _fetch_once(self, wallet: str) -> "asyncio.Future[str]":
+        pending = self.pending_fetches.get(wallet)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch(wallet))
+            self.pending_fetches[wallet] = pending
+            pending.add_done_callback(lambda _: self.pending_fetches.pop(wallet, None))
+        return pending
+
+    async def _fetch(self, wallet: str) -> str:
+        loop = asyncio.get_running_loop()
+        token = await loop.run_in_executor(self.executor, self.fetch, wallet)
+        expires_at = time.monotonic() + self.ttl_seconds
+        self.tokens[wallet] = (token, expires_at)
+        if self.refresh_owners.get(wallet):
+            self._schedule_refresh(wallet, expires_at)
+        return token
+
+    def _schedule_refresh(self, wallet: str, expires_at: float) -> None:
+        handle = self.refresh_handles.pop(wallet, None)
+        if handle:
+            handle.cancel()
+        delay = max(expires_at - self.refresh_margin_seconds - time.monotonic(), 0)
+        self.refresh_handles[wallet] = asyncio.get_running_loop().call_later(
+            delay, self._refresh, wallet
+        )
+
+    def _refresh(self, wallet: str) -> None:
+        self.refresh_handles.pop(wallet, None)
+
+        def on_done(future: "asyncio.Future[str]") -> None:
+            # A failed refresh leaves the current token in place until it expires, after which
+            # the next subscription fetches a new one
+            if not future.cancelled():
+                future.exception()
+
+        self._fetch_once(wallet).add_done_callback(on_done)
@@ -1,33 +1,49 @@
 import asyncio
-import json
+import random
+import time
+from collections import deque
 from typing import (
     Any,
     Callable,
     Coroutine,
+    Deque,
+    Dict,
     List,
     Optional,
     Sequence,
     Set,
+    Tuple,
     TypedDict,
     Union,
     cast,
 )
-from uuid import uuid1
-
 from websockets.client import WebSocketClientProtocol
 from websockets.client import connect as ws_connect
 from websockets.exceptions import ConnectionClosed
 
-from idex_sdk.client.rest.authenticated import RestAuthenticatedClient
+from idex_sdk.client.json_codec import JsonCodec, get_default_json_codec
 from idex_sdk.client.utils import derive_base_url
+from idex_sdk.client.websocket.auth import (
+    WebSocketAuthTokenCache,
+    rest_websocket_auth_token_fetch,
+)
+from idex_sdk.client.websocket.dispatch import (
+    DEFAULT_DISPATCH_POLICIES,
+    DispatchPolicy,
+    DispatchQueue,
+    DispatchQueueMetrics,
+)
+from idex_sdk.client.websocket.recording import WebSocketRecorder
 from idex_sdk.client.websocket.transform import (
-    transform_websocket_short_response_mesg,
+    RESPONSE_MODE_TRANSFORM_FUNCS,
+    WebSocketResponseMode,
 )
-from idex_sdk.client.websocket.utils import remove_wallet_from_sdk_subscription
-from idex_sdk.idex_types.enums import MultiverseChain
-from idex_sdk.idex_types.websocket.guards import (
-    is_websocket_authenticated_subscription,
+from idex_sdk.client.websocket.utils import (
+    get_message_market,
+    remove_wallet_from_sdk_subscription,
 )
+from idex_sdk.idex_types.enums import MultiverseChain
+from idex_sdk.idex_types.websocket.guards import is_websocket_authenticated_subscription
 from idex_sdk.idex_types.websocket.request import (
     AuthTokenWebSocketRequestAuthenticatedSubscription,
     WebSocketRequest,
@@ -53,6 +69,21 @@ WebSocketListenerResponse = Callable[[WebSocketResponse], Coroutine[Any, Any, An
 # to check for liveness?
 PING_TIMEOUT = 30000
 
+# How long (in ms) to wait for the server to answer a ping before the connection is considered
+# dead and closed
+PONG_TIMEOUT = 10000
+
+# Number of most recent ping round trip times kept to compute latency percentiles
+LATENCY_SAMPLE_SIZE = 100
+
+# Reconnect delays grow exponentially from the base up to the maximum, and are jittered between
+# half and all of that value so many clients do not reconnect at the same moment
+RECONNECT_BACKOFF_BASE_SECONDS = 1
+RECONNECT_BACKOFF_MAX_SECONDS = 60
+
+# Active subscriptions are tracked by name, wallet and candle interval
+ActiveSubscriptionKey = Tuple[str, Optional[str], Optional[str]]
+
 
 class WebSocketClientState(TypedDict):
     # Set to true when the reconnect logic should not be run.
@@ -61,14 +92,36 @@ class WebSocketClientState(TypedDict):
     # Used to track the number of reconnect attempts for exponential backoff
     reconnect_attempt: int
     connect_timeout: int
-    # When the ping timeout is scheduled, it saves its id to this property
-    ping_timeout_id: Union[None, int]
+    # Task pinging the server while connected
+    heartbeat_task: Optional[asyncio.Task]
+    # Round trip times (in ms) of the latest pings on the current connection
+    ping_round_trip_times: Deque[float]
+    # time.monotonic() when the last message was received
+    last_message_at: Optional[float]
     connect_listeners: Set[WebSocketListenerConnect]
     disconnect_listeners: Set[WebSocketListenerDisconnect]
     error_listeners: Set[WebSocketListenerError]
     response_listeners: Set[WebSocketListenerResponse]
+    # Listeners registered with on(), by message type and then by market (None for all markets)
+    routed_response_listeners: Dict[str, Dict[Optional[str], Set[WebSocketListenerResponse]]]
     have_ever_started: bool
     background_tasks: Set[asyncio.Task]
+    # Markets of each subscription requested with subscribe() and not since unsubscribed,
+    # resent on reconnect
+    active_subscriptions: Dict[ActiveSubscriptionKey, Set[str]]
+
+
+class WebSocketLatencyMetrics(TypedDict):
+    # Number of ping round trip times the percentiles are computed from
+    samples: int
+    # Ping round trip times in ms, None until a ping has been answered
+    last_rtt: Optional[float]
+    rtt_p50: Optional[float]
+    rtt_p90: Optional[float]
+    rtt_p99: Optional[float]
+    rtt_max: Optional[float]
+    # Time in ms since the last message was received, None if none has been received
+    ms_since_last_message: Optional[float]
 
 
 class WebSocketClient:
@@ -80,24 +133,23 @@ class WebSocketClient:
     WebSocket subscriptions.
     """
 
-    state: WebSocketClientState = {
-        "do_not_reconnect": False,
-        "is_reconnecting": False,
-        "reconnect_attempt": 0,
-        "connect_timeout": 5000,
-        "ping_timeout_id": None,
-        "connect_listeners": set(),
-        "disconnect_listeners": set(),
-        "error_listeners": set(),
-        "response_listeners": set(),
-        "have_ever_started": False,
-        "background_tasks": set(),
-    }
+    state: WebSocketClientState
 
     base_url: str
     should_reconnect_automatically: bool
+    should_restore_subscriptions: bool
     connect_timeout: int
+    ping_interval: Optional[int]
+    pong_timeout: int
     websocket_auth_token_fetch: Optional[Callable[[str], str]]
+    websocket_auth_token_cache: Optional[WebSocketAuthTokenCache]
+    recorder: Optional[WebSocketRecorder]
+    json_codec: JsonCodec
+    response_mode: WebSocketResponseMode
+    transform_response: Callable[[Any], Any]
+    dispatch_queue_size: Optional[int]
+    dispatch_policies: Dict[str, DispatchPolicy]
+    dispatch_queues: Dict[str, DispatchQueue]
     ws: Optional[WebSocketClientProtocol] = None
 
     def __init__(
@@ -105,11 +157,20 @@ class WebSocketClient:
         api_key: Optional[str] = None,
         api_secret: Optional[str] = None,
         should_reconnect_automatically: bool = False,
+        should_restore_subscriptions: bool = True,
         connect_timeout: Optional[int] = None,
+        ping_interval: Optional[int] = PING_TIMEOUT,
+        pong_timeout: int = PONG_TIMEOUT,
         sandbox: bool = False,
         multiverse_chain: MultiverseChain = MultiverseChain.MATIC,
         base_url: Optional[str] = None,
         websocket_auth_token_fetch: Optional[Callable[[str], str]] = None,
+        websocket_auth_token_cache: Optional[WebSocketAuthTokenCache] = None,
+        recorder: Optional[WebSocketRecorder] = None,
+        json_codec: Optional[JsonCodec] = None,
+        response_mode: WebSocketResponseMode = "long",
+        dispatch_queue_size: Optional[int] = None,
+        dispatch_policies: Optional[Dict[str, DispatchPolicy]] = None,
     ):
         """
         Args:
@@ -118,10 +179,35 @@ class WebSocketClient:
                 receiving push updates. Eg. {market}@{subscription}_{option}
             should_reconnect_automatically: If true, automatically reconnects when connection is
                 closed by the server or network errors
+            should_restore_subscriptions: If true, resubscribes to all active subscriptions in
+                a single request after reconnecting automatically
             connect_timeout: Timeout (in milliseconds) before failing when trying to connect to
                 the WebSocket. Defaults to 5000.
+            ping_interval: How often (in milliseconds) to ping the server to measure round trip
+                latency and detect dead connections, or None to disable. Defaults to 30000.
+            pong_timeout: How long (in milliseconds) to wait for the server to answer a ping
+                before closing the connection as dead. Defaults to 10000.
             sandbox: If true, client will point to API sandbox
             multiverse_chain: Which multiverse chain the client will point to
+            websocket_auth_token_fetch: Blocking function returning a WebSocket authentication
+                token for a wallet, instead of fetching tokens with api_key and api_secret
+            websocket_auth_token_cache: Token cache to share with other clients, instead of
+                api_key and api_secret or websocket_auth_token_fetch
+            recorder: Optional recorder that captures every received frame for offline replay
+            json_codec: JSON codec for messages, defaults to the standard library json module.
+                See get_json_codec for faster codecs.
+            response_mode: How subscription messages are passed to response listeners: "long"
+                (default) transforms them to long field names, "short" passes the payload as
+                received, and "view" wraps the data in a read-only WebSocketResponseDataView
+                that maps long names to short keys on access
+            dispatch_queue_size: If set, received messages are queued per message type, up to
+                this many per type, and dispatched to response listeners by a separate task so
+                slow listeners do not delay receiving. Messages of the same type are dispatched
+                in order. By default listeners are awaited before the next message is received.
+            dispatch_policies: Policy by message type when its dispatch queue is full: "block"
+                (default) pauses receiving until there is room, "drop_oldest" discards the
+                oldest queued message, and "conflate" keeps only the latest queued message per
+                market. Defaults to conflating tickers and l1orderbook messages.
         """
         base_url = derive_base_url(
             api_type="websocket",
@@ -135,27 +221,60 @@ class WebSocketClient:
                 "Invalid configuration, cannot specify both API credentials and "
                 "websocket_auth_token_fetch"
             )
+        if websocket_auth_token_cache and (api_key or api_secret or websocket_auth_token_fetch):
+            raise Exception(
+                "Invalid configuration, cannot specify websocket_auth_token_cache with API "
+                "credentials or websocket_auth_token_fetch"
+            )
         if (api_key and not api_secret) or (not api_key and api_secret):
             raise Exception(
                 "Invalid configuration, must specify both api_key and api_secret or neither"
             )
 
         if not websocket_auth_token_fetch and api_key and api_secret:
-
-            def default_websocket_auth_token_fetch(wallet_address: str) -> str:
-                return RestAuthenticatedClient(
-                    api_key=api_key,
-                    api_secret=api_secret,
-                    multiverse_chain=multiverse_chain,
-                    sandbox=sandbox,
-                ).get_ws_token(str(uuid1()), wallet_address)
-
-            websocket_auth_token_fetch = default_websocket_auth_token_fetch
-
+            websocket_auth_token_fetch = rest_websocket_auth_token_fetch(
+                api_key=api_key,
+                api_secret=api_secret,
+                multiverse_chain=multiverse_chain,
+                sandbox=sandbox,
+            )
+        if not websocket_auth_token_cache and websocket_auth_token_fetch:
+            websocket_auth_token_cache = WebSocketAuthTokenCache(websocket_auth_token_fetch)
+
+        self.state = {
+            "do_not_reconnect": False,
+            "is_reconnecting": False,
+            "reconnect_attempt": 0,
+            "connect_timeout": 5000,
+            "heartbeat_task": None,
+            "ping_round_trip_times": deque(maxlen=LATENCY_SAMPLE_SIZE),
+            "last_message_at": None,
+            "connect_listeners": set(),
+            "disconnect_listeners": set(),
+            "error_listeners": set(),
+            "response_listeners": set(),
+            "routed_response_listeners": {},
+            "have_ever_started": False,
+            "background_tasks": set(),
+            "active_subscriptions": {},
+        }
         self.base_url = base_url
         self.connect_timeout = 5000 if connect_timeout is None else connect_timeout
+        self.ping_interval = ping_interval
+        self.pong_timeout = pong_timeout
         self.should_reconnect_automatically = should_reconnect_automatically
-        self.websocket_auth_token_fetch = websocket_auth_token_fetch
+        self.should_restore_subscriptions = should_restore_subscriptions
+        self.websocket_auth_token_cache = websocket_auth_token_cache
+        self.websocket_auth_token_fetch = (
+            websocket_auth_token_cache.fetch if websocket_auth_token_cache else None
+        )
+        self.recorder = recorder
+        self.json_codec = json_codec or get_default_json_codec()
+        self.response_mode = response_mode
+        self.transform_response = RESPONSE_MODE_TRANSFORM_FUNCS[response_mode]
+        self.dispatch_queue_size = dispatch_queue_size
+        self.dispatch_policies = {**DEFAULT_DISPATCH_POLICIES, **(dispatch_policies or {})}
+        self.dispatch_queues = {}
 
     # Connection management
 
@@ -175,21 +294,35 @@ class WebSocketClient:
         self.state["do_not_reconnect"] = False
 
         try:
-            self.ws = await ws_connect(self.base_url)
+            if self.ping_interval:
+                # The heartbeat replaces the library's own keepalive pings
+                self.ws = await ws_connect(self.base_url, ping_interval=None)
+            else:
+                self.ws = await ws_connect(self.base_url)
         except Exception as error:
             if self.should_reconnect_automatically and not self.state["do_not_reconnect"]:
                 print(
                     f'Failed to connect: "{error}" - '
                     "a reconnect attempt will be scheduled automatically"
                 )
+                # Allow the next attempt to be scheduled when a reconnect attempt fails
+                self.state["is_reconnecting"] = False
                 await self.reconnect()
             else:
                 raise error
 
-        await self._handle_connect()
-        self.state["is_reconnecting"] = False
-
-        await self._run()
+        if self.is_connected():
+            if self.state["is_reconnecting"] and self.should_restore_subscriptions:
+                await self._restore_subscriptions()
+            await self._handle_connect()
+            self.state["is_reconnecting"] = False
+
+            self._start_heartbeat()
+            try:
+                await self._run()
+            finally:
+                self._stop_heartbeat()
+            await self._join_dispatch_queues()
 
         if should_wait_for_tasks:
             # Wait for all tasks to finish
@@ -216,9 +349,67 @@ class WebSocketClient:
         if not self.ws:
             return
         self.state["do_not_reconnect"] = True
+        self._stop_heartbeat()
+        if self.websocket_auth_token_cache:
+            # The cache may be shared with other clients that still use their tokens
+            self.websocket_auth_token_cache.cancel_refresh(self)
         await self.ws.close()
         self.ws = None
 
+    # Heartbeat
+
+    def _start_heartbeat(self) -> None:
+        self.state["ping_round_trip_times"].clear()
+        if self.ping_interval and self.ws:
+            self.state["heartbeat_task"] = asyncio.create_task(self._heartbeat(self.ws))
+
+    def _stop_heartbeat(self) -> None:
+        heartbeat_task = self.state["heartbeat_task"]
+        if heartbeat_task and heartbeat_task is not asyncio.current_task():
+            heartbeat_task.cancel()
+        self.state["heartbeat_task"] = None
+
+    async def _heartbeat(self, ws: WebSocketClientProtocol) -> None:
+        """
+        Ping the server every ping_interval, recording round trip times, and close the
+        connection if a ping is not answered within pong_timeout so the disconnect (and
+        reconnect) logic runs without waiting for TCP to time out
+        """
+        assert self.ping_interval
+        while ws.open:
+            await asyncio.sleep(self.ping_interval / 1000)
+            sent_at = time.monotonic()
+            try:
+                pong_waiter = await ws.ping()
+                await asyncio.wait_for(pong_waiter, self.pong_timeout / 1000)
+            except asyncio.TimeoutError:
+                print(f"No pong received within {self.pong_timeout}ms, closing connection")
+                await ws.close(1011, "ping timeout")
+                return
+            except ConnectionClosed:
+                return
+            self.state["ping_round_trip_times"].append((time.monotonic() - sent_at) * 1000)
+
+    def get_latency_metrics(self) -> WebSocketLatencyMetrics:
+        """
+        Returns:
+            Ping round trip time percentiles for the current connection, and the time since the
+            last message was received
+        """
+        round_trip_times = sorted(self.state["ping_round_trip_times"])
+        last_message_at = self.state["last_message_at"]
+        return {
+            "samples": len(round_trip_times),
+            "last_rtt": self.state["ping_round_trip_times"][-1] if round_trip_times else None,
+            "rtt_p50": get_percentile(round_trip_times, 0.5),
+            "rtt_p90": get_percentile(round_trip_times, 0.9),
+            "rtt_p99": get_percentile(round_trip_times, 0.99),
+            "rtt_max": round_trip_times[-1] if round_trip_times else None,
+            "ms_since_last_message": (
+                (time.monotonic() - last_message_at) * 1000 if last_message_at else None
+            ),
+        }
+
     # Event listeners
 
     async def _handle_connect(self) -> None:
@@ -241,8 +432,54 @@ class WebSocketClient:
         await asyncio.gather(*[listener(e) for listener in self.state["error_listeners"]])
 
     async def _handle_message(self, response: Union[str, bytes]) -> None:
-        mesg = transform_websocket_short_response_mesg(json.loads(response))
-        await asyncio.gather(*[listener(mesg) for listener in self.state["response_listeners"]])
+        self.state["last_message_at"] = time.monotonic()
+        if self.recorder:
+            self.recorder.record(response)
+        mesg = self.transform_response(self.json_codec.loads(response))
+        if self.dispatch_queue_size is None:
+            await self._dispatch_message(mesg)
+            return
+
+        message_type = mesg.get("type")
+        queue = self.dispatch_queues.get(message_type)
+        if queue is None:
+            queue = DispatchQueue(
+                message_type,
+                self.dispatch_queue_size,
+                self.dispatch_policies.get(message_type, "block"),
+                self._dispatch_message,
+                self._handle_error,
+            )
+            self.dispatch_queues[message_type] = queue
+        await queue.put(mesg)
+
+    async def _dispatch_message(self, mesg: Any) -> None:
+        listeners: List[WebSocketListenerResponse] = list(self.state["response_listeners"])
+        routes = self.state["routed_response_listeners"].get(mesg.get("type"))
+        if routes:
+            listeners.extend(routes.get(None, ()))
+            if len(routes) > 1 or None not in routes:
+                listeners.extend(routes.get(get_message_market(mesg), ()))
+
+        if len(listeners) == 1:
+            await listeners[0](mesg)
+        elif listeners:
+            await asyncio.gather(*[listener(mesg) for listener in listeners])
+
+    async def _join_dispatch_queues(self) -> None:
+        for queue in list(self.dispatch_queues.values()):
+            await queue.join()
+
+    def get_dispatch_queue_metrics(self) -> Dict[str, DispatchQueueMetrics]:
+        """
+        Returns:
+            Queue depth, dropped and conflated message counts by message type, empty unless
+            dispatch_queue_size is set
+        """
+        return {
+            message_type: cast(DispatchQueueMetrics, dict(queue.metrics))
+            for message_type, queue in self.dispatch_queues.items()
+        }
 
     def on_connect(self, listener: WebSocketListenerConnect) -> "WebSocketClient":
         self.state["connect_listeners"].add(listener)
@@ -260,8 +497,112 @@ class WebSocketClient:
         self.state["response_listeners"].add(listener)
         return self
 
+    def on(
+        self,
+        message_type: str,
+        listener: WebSocketListenerResponse,
+        market: Optional[str] = None,
+    ) -> "WebSocketClient":
+        """
+        Register a listener only for messages of one type, unlike on_response listeners which
+        receive every message
+
+        Args:
+            message_type: Message type, eg. "l2orderbook" or "tokenprice"
+            listener: Called with each matching message
+            market: Optionally only call the listener for messages of this market
+        """
+        routes = self.state["routed_response_listeners"].setdefault(message_type, {})
+        routes.setdefault(market, set()).add(listener)
+        return self
+
+    def off(
+        self,
+        message_type: str,
+        listener: WebSocketListenerResponse,
+        market: Optional[str] = None,
+    ) -> "WebSocketClient":
+        """
+        Remove a listener registered with on() using the same arguments
+        """
+        routes = self.state["routed_response_listeners"].get(message_type, {})
+        listeners = routes.get(market)
+        if listeners is not None:
+            listeners.discard(listener)
+            if not listeners:
+                del routes[market]
+        if not routes:
+            self.state["routed_response_listeners"].pop(message_type, None)
+        return self
+
     # Subscription management
 
+    def get_active_subscriptions(self) -> List[Any]:
+        """
+        Returns:
+            Subscriptions requested with subscribe() and not since unsubscribed, in the form
+            accepted by subscribe()
+        """
+        subscriptions: List[Any] = []
+        for (name, wallet, interval), markets in self.state["active_subscriptions"].items():
+            subscription: Dict[str, Any] = {"name": name}
+            if markets:
+                subscription["markets"] = sorted(markets)
+            if wallet:
+                subscription["wallet"] = wallet
+            if interval:
+                subscription["interval"] = interval
+            subscriptions.append(subscription)
+        return subscriptions
+
+    def _track_subscribe(self, subscriptions: Sequence[Any], markets: Optional[List[str]]) -> None:
+        for subscription in subscriptions:
+            if isinstance(subscription, str):
+                subscription = {"name": subscription}
+            key = (subscription["name"], subscription.get("wallet"), subscription.get("interval"))
+            tracked_markets = self.state["active_subscriptions"].setdefault(key, set())
+            tracked_markets.update(subscription.get("markets") or markets or [])
+
+    def _track_unsubscribe(
+        self, subscriptions: Sequence[Any], markets: Optional[List[str]]
+    ) -> None:
+        active_subscriptions = self.state["active_subscriptions"]
+        for subscription in subscriptions:
+            if isinstance(subscription, str):
+                subscription = {"name": subscription}
+            unsubscribe_markets = subscription.get("markets") or markets
+            for key in [key for key in active_subscriptions if key[0] == subscription["name"]]:
+                if unsubscribe_markets:
+                    active_subscriptions[key].difference_update(unsubscribe_markets)
+                if not unsubscribe_markets or not active_subscriptions[key]:
+                    del active_subscriptions[key]
+
+    def _cancel_unsubscribed_token_refresh(self) -> None:
+        """
+        Stop refreshing the tokens of wallets without active authenticated subscriptions
+        """
+        cache = self.websocket_auth_token_cache
+        if not cache:
+            return
+        active_wallets = {wallet for _, wallet, _ in self.state["active_subscriptions"] if wallet}
+        cache.cancel_refresh(
+            self,
+            [
+                wallet
+                for wallet, owners in cache.refresh_owners.items()
+                if self in owners and wallet not in active_wallets
+            ],
+        )
+
+    async def _restore_subscriptions(self) -> None:
+        subscriptions = self.get_active_subscriptions()
+        if not subscriptions:
+            return
+        try:
+            await self.subscribe(subscriptions)
+        except Exception as e:
+            await self._handle_error(e)
+
     async def list_subscriptions(self) -> None:
         mesg: WebSocketRequestSubscriptions = {"method": "subscriptions"}
         await self._send_message(mesg)
@@ -269,8 +610,8 @@ class WebSocketClient:
     async def subscribe_authenticated(
         self,
         subscriptions: Sequence[AuthTokenWebSocketRequestAuthenticatedSubscription],
-        markets: List[str] = None,
-        cid: str = None,
+        markets: Optional[List[str]] = None,
+        cid: Optional[str] = None,
     ) -> None:
         """
         Strictly typed subscribe which only can be used on authenticated subscriptions.
@@ -291,8 +632,8 @@ class WebSocketClient:
     async def subscribe_unauthenticated(
         self,
         subscriptions: Sequence[WebSocketRequestUnauthenticatedSubscription],
-        markets: List[str] = None,
-        cid: str = None,
+        markets: Optional[List[str]] = None,
+        cid: Optional[str] = None,
     ) -> None:
         """
         Strictly typed subscribe which only can be used on non-authenticated subscriptions.
@@ -320,8 +661,8 @@ class WebSocketClient:
                 WebSocketRequestUnauthenticatedSubscriptionNameOnly,
             ]
         ],
-        markets: List[str] = None,
-        cid: str = None,
+        markets: Optional[List[str]] = None,
+        cid: Optional[str] = None,
     ) -> None:
         """
         Subscribe to a given set of subscriptions, optionally providing a list of top level markets
@@ -353,6 +694,8 @@ class WebSocketClient:
                 mesg["cid"] = cid
             return mesg
 
+        self._track_subscribe(subscriptions, markets)
+
         auth_subscriptions = [
             cast(WebSocketRequestAuthenticatedSubscription, s)
             for s in subscriptions
@@ -363,7 +706,7 @@ class WebSocketClient:
             await self._send_message(mesg)
             return
 
-        if not self.websocket_auth_token_fetch:
+        if not self.websocket_auth_token_cache:
             raise Exception(
                 "WebSocket: `websocket_auth_token_fetch` is required "
                 "for authenticated subscriptions"
@@ -378,12 +721,15 @@ class WebSocketClient:
             mesg = make_subscription_message(
                 list(map(remove_wallet_from_sdk_subscription, subscriptions))
             )
-            mesg["token"] = self.websocket_auth_token_fetch(unique_wallets[0])
+            mesg["token"] = await self.websocket_auth_token_cache.get(unique_wallets[0], self)
             await self._send_message(mesg)
             return
 
         # In specific case when user subscribed with more than 1 wallet...
 
+        # Fetch tokens for all wallets concurrently
+        tokens = await self.websocket_auth_token_cache.get_many(unique_wallets, self)
+
         # Subscribe public subscriptions all at once
         public_subscriptions = list(filter(is_public_subscription, subscriptions))
         if len(public_subscriptions):
@@ -391,13 +737,13 @@ class WebSocketClient:
             await self._send_message(mesg)
 
         # Send multiple wallets subscriptions grouped by wallet
-        for wallet in unique_wallets:
+        for wallet, token in zip(unique_wallets, tokens):
             subs = cast(
                 Sequence, list([s for s in auth_subscriptions if s.get("wallet") == wallet])
             )
             subs_no_wallet = list(map(remove_wallet_from_sdk_subscription, subs))
             mesg = make_subscription_message(subs_no_wallet)
-            mesg["token"] = self.websocket_auth_token_fetch(wallet)
+            mesg["token"] = token
             await self._send_message(mesg)
 
         return
@@ -407,9 +753,11 @@ class WebSocketClient:
         subscriptions: Sequence[
             Union[WebSocketRequestUnsubscribeSubscription, WebSocketRequestUnsubscribeShortNames]
         ],
-        markets: List[str] = None,
-        cid: str = None,
+        markets: Optional[List[str]] = None,
+        cid: Optional[str] = None,
     ) -> None:
+        self._track_unsubscribe(subscriptions, markets)
+        self._cancel_unsubscribed_token_refresh()
         mesg: WebSocketRequestUnsubscribe = {
             "method": "unsubscribe",
             "subscriptions": subscriptions,
@@ -423,15 +771,15 @@ class WebSocketClient:
 
     async def reconnect(self) -> None:
         """
-        Reconnect with exponential backoff
+        Reconnect with capped, jittered exponential backoff
         """
         await self.disconnect()
         self.state["do_not_reconnect"] = False
         if not self.state["is_reconnecting"]:
             self.state["is_reconnecting"] = True
-            backoff_seconds = 2 ** self.state["reconnect_attempt"]
+            backoff_seconds = get_reconnect_backoff_seconds(self.state["reconnect_attempt"])
             self.state["reconnect_attempt"] += 1
-            print(f"Reconnecting after {backoff_seconds} seconds...")
+            print(f"Reconnecting after {backoff_seconds:.1f} seconds...")
 
             async def wait_and_reconnect() -> None:
                 await asyncio.sleep(backoff_seconds)
@@ -449,7 +797,28 @@ class WebSocketClient:
     async def _send_message(self, payload: WebSocketRequest) -> None:
         self._raise_if_disconnected()
         assert self.ws
-        await self.ws.send(json.dumps(payload))
+        await self.ws.send(self.json_codec.dumps(payload))
+
+
+def get_percentile(sorted_values: List[float], percentile: float) -> Optional[float]:
+    """
+    Nearest rank percentile of sorted values, None if there are none
+    """
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(percentile * len(sorted_values)))]
+
+
+def get_reconnect_backoff_seconds(attempt: int) -> float:
+    """
+    Returns:
+        Delay before reconnect attempt number attempt (starting at 0), between half and all of
+        RECONNECT_BACKOFF_BASE_SECONDS * 2 ** attempt, capped at RECONNECT_BACKOFF_MAX_SECONDS
+    """
+    backoff_seconds = min(
+        RECONNECT_BACKOFF_MAX_SECONDS, RECONNECT_BACKOFF_BASE_SECONDS * 2 ** min(attempt, 32)
+    )
+    return backoff_seconds / 2 + random.uniform(0, backoff_seconds / 2)
 
 
 # We use this instead of the other type guards to account for unhandled subscription types
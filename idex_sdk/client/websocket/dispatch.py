@@ -0,0 +1,127 @@
+import asyncio
+from collections import OrderedDict
+from itertools import count
+from typing import Any, Awaitable, Callable, Dict, Literal, Optional, TypedDict
+
+from idex_sdk.client.websocket.utils import get_message_market
+
+# How a full dispatch queue handles a new message:
+# - "block" waits for room, which pauses receiving from the WebSocket (backpressure)
+# - "drop_oldest" discards the oldest queued message
+# - "conflate" replaces a queued message for the same market with the new one, and otherwise
+#   discards the oldest queued message
+DispatchPolicy = Literal["block", "drop_oldest", "conflate"]
+
+# Only the latest ticker and level 1 order book of a market are relevant, so conflate them by
+# default. Everything else, including level 2 order book updates which must not be skipped,
+# blocks when the queue is full.
+DEFAULT_DISPATCH_POLICIES: Dict[str, DispatchPolicy] = {
+    "tickers": "conflate",
+    "l1orderbook": "conflate",
+}
+
+
+class DispatchQueueMetrics(TypedDict):
+    policy: DispatchPolicy
+    # Number of messages currently waiting to be dispatched
+    depth: int
+    max_depth: int
+    enqueued: int
+    dispatched: int
+    # Messages discarded because the queue was full
+    dropped: int
+    # Messages replaced by a later message for the same market
+    conflated: int
+
+
+class DispatchQueue:
+    """
+    Bounded queue of WebSocket messages of one type, dispatched to listeners in order by a
+    worker task that runs while messages are queued
+    """
+
+    message_type: str
+    maxsize: int
+    policy: DispatchPolicy
+    metrics: DispatchQueueMetrics
+
+    def __init__(
+        self,
+        message_type: str,
+        maxsize: int,
+        policy: DispatchPolicy,
+        dispatch: Callable[[Any], Awaitable[Any]],
+        on_error: Callable[[Exception], Awaitable[Any]],
+    ) -> None:
+        if maxsize < 1:
+            raise Exception("maxsize must be at least 1")
+        self.message_type = message_type
+        self.maxsize = maxsize
+        self.policy = policy
+        self.dispatch = dispatch
+        self.on_error = on_error
+        self.metrics = {
+            "policy": policy,
+            "depth": 0,
+            "max_depth": 0,
+            "enqueued": 0,
+            "dispatched": 0,
+            "dropped": 0,
+            "conflated": 0,
+        }
+        # Keyed by market for conflated messages, otherwise by a sequence number
+        self.messages: "OrderedDict[Any, Any]" = OrderedDict()
+        self.sequence = count()
+        self.not_full = asyncio.Event()
+        self.not_full.set()
+        self.worker: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    async def put(self, mesg: Any) -> None:
+        """
+        Queues a message, applying the queue's policy if it is full
+        """
+        self.metrics["enqueued"] += 1
+        key: Any = None
+        if self.policy == "conflate":
+            key = get_message_market(mesg)
+            if key is not None and key in self.messages:
+                self.messages[key] = mesg
+                self.metrics["conflated"] += 1
+                return
+        if key is None:
+            key = next(self.sequence)
+
+        if self.policy == "block":
+            while len(self.messages) >= self.maxsize:
+                self.not_full.clear()
+                await self.not_full.wait()
+        elif len(self.messages) >= self.maxsize:
+            self.messages.popitem(last=False)
+            self.metrics["dropped"] += 1
+
+        self.messages[key] = mesg
+        self.metrics["depth"] = len(self.messages)
+        self.metrics["max_depth"] = max(self.metrics["max_depth"], len(self.messages))
+        if not self.worker or self.worker.done():
+            self.worker = asyncio.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        while self.messages:
+            _, mesg = self.messages.popitem(last=False)
+            self.metrics["depth"] = len(self.messages)
+            self.not_full.set()
+            try:
+                await self.dispatch(mesg)
+            except Exception as e:
+                await self.on_error(e)
+            self.metrics["dispatched"] += 1
+
+    async def join(self) -> None:
+        """
+        Waits until all queued messages have been dispatched
+        """
+        while self.worker and not self.worker.done():
+            await asyncio.shield(self.worker)
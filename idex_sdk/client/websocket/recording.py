@@ -0,0 +1,145 @@
+import asyncio
+import struct
+import time
+from typing import Any, BinaryIO, Callable, Coroutine, Iterator, Optional, Tuple, Union
+
+from idex_sdk.client.json_codec import JsonCodec, get_default_json_codec
+from idex_sdk.client.websocket.transform import (
+    RESPONSE_MODE_TRANSFORM_FUNCS,
+    WebSocketResponseMode,
+)
+from idex_sdk.idex_types.websocket.response import WebSocketResponse
+
+# Each recorded frame is prefixed with its receive time (seconds since the epoch, float64)
+# and its length in bytes (uint32), both little endian
+FRAME_HEADER = struct.Struct("<dI")
+
+RecordedFrame = Tuple[float, bytes]
+WebSocketReplayHandler = Callable[[WebSocketResponse], Coroutine[Any, Any, Any]]
+
+
+class WebSocketRecorder:
+    """
+    Appends raw WebSocket frames with their receive timestamps to a file, for offline replay
+    with WebSocketReplayer. Pass as the recorder of a WebSocketClient (or the
+    websocket_recorder of an OrderBookRealTimeClient) to capture a live stream.
+    """
+
+    path: str
+    file: BinaryIO
+    frames_recorded: int
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path: File to append recorded frames to, created if it does not exist
+        """
+        self.path = path
+        self.file = open(path, "ab")
+        self.frames_recorded = 0
+
+    def record(self, frame: Union[str, bytes], received_at: Optional[float] = None) -> None:
+        """
+        Append a raw frame to the recording
+
+        Args:
+            frame: The frame as received from the WebSocket
+            received_at: Receive time in seconds since the epoch, defaults to now
+        """
+        data = frame.encode("utf-8") if isinstance(frame, str) else frame
+        self.file.write(
+            FRAME_HEADER.pack(time.time() if received_at is None else received_at, len(data))
+        )
+        self.file.write(data)
+        self.frames_recorded += 1
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __enter__(self) -> "WebSocketRecorder":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def read_recorded_frames(path: str) -> Iterator[RecordedFrame]:
+    """
+    Reads frames written by WebSocketRecorder in order. A frame truncated by an interrupted
+    recording is ignored.
+
+    Returns:
+        Iterator of (receive timestamp, raw frame) tuples
+    """
+    with open(path, "rb") as file:
+        while True:
+            header = file.read(FRAME_HEADER.size)
+            if len(header) < FRAME_HEADER.size:
+                return
+            received_at, length = FRAME_HEADER.unpack(header)
+            data = file.read(length)
+            if len(data) < length:
+                return
+            yield received_at, data
+
+
+class WebSocketReplayer:
+    """
+    Feeds frames captured by WebSocketRecorder back into a WebSocket response handler, such as
+    OrderBookRealTimeClient.websocket_handle_response, without network access
+    """
+
+    path: str
+    json_codec: JsonCodec
+    response_mode: WebSocketResponseMode
+
+    def __init__(
+        self,
+        path: str,
+        json_codec: Optional[JsonCodec] = None,
+        response_mode: WebSocketResponseMode = "long",
+    ) -> None:
+        """
+        Args:
+            path: Recording file written by WebSocketRecorder
+            json_codec: JSON codec for recorded messages, defaults to the standard library
+            response_mode: How messages are passed to the handler, see WebSocketClient
+        """
+        self.path = path
+        self.json_codec = json_codec or get_default_json_codec()
+        self.response_mode = response_mode
+
+    async def replay(self, handler: WebSocketReplayHandler, speed: Optional[float] = None) -> int:
+        """
+        Replays all recorded frames, parsed and transformed the same way as WebSocketClient does
+        for live messages
+
+        Args:
+            handler: Coroutine function called with each response in recorded order
+            speed: Playback speed relative to the recording, eg. 1.0 reproduces the recorded
+                timing and 2.0 replays twice as fast. Defaults to replaying as fast as possible.
+
+        Returns:
+            Number of frames replayed
+        """
+        if speed is not None and speed <= 0:
+            raise Exception("speed must be positive")
+        loop = asyncio.get_running_loop()
+        loads = self.json_codec.loads
+        transform = RESPONSE_MODE_TRANSFORM_FUNCS[self.response_mode]
+        count = 0
+        first_received_at: Optional[float] = None
+        started_at = loop.time()
+        for received_at, frame in read_recorded_frames(self.path):
+            if speed is not None:
+                if first_received_at is None:
+                    first_received_at = received_at
+                delay = (received_at - first_received_at) / speed - (loop.time() - started_at)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await handler(transform(loads(frame)))
+            count += 1
+        return count
@@ -0,0 +1,320 @@
+import asyncio
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from idex_sdk.client.json_codec import JsonCodec
+from idex_sdk.client.websocket.client import (
+    PING_TIMEOUT,
+    PONG_TIMEOUT,
+    WebSocketClient,
+    WebSocketLatencyMetrics,
+    WebSocketListenerConnect,
+    WebSocketListenerDisconnect,
+    WebSocketListenerError,
+    WebSocketListenerResponse,
+)
+from idex_sdk.client.websocket.dispatch import DispatchPolicy, DispatchQueueMetrics
+from idex_sdk.client.websocket.recording import WebSocketRecorder
+from idex_sdk.client.websocket.transform import WebSocketResponseMode
+from idex_sdk.idex_types.enums import MultiverseChain
+from idex_sdk.idex_types.websocket.guards import is_websocket_authenticated_subscription
+
+# Subscriptions and top level markets to send to a single shard
+ShardRequest = Tuple[List[Any], List[str]]
+
+
+class ShardedWebSocketClient:
+    """
+    WebSocket API client that spreads market subscriptions across several connections, so one
+    connection's backlog or reconnect does not stall updates for every market
+
+    Each market is always routed to the same shard. Subscriptions without markets, such as
+    authenticated balances and orders subscriptions, use the first shard. Listeners are
+    registered on every shard: response and error listeners receive messages from all shards,
+    and connect and disconnect listeners are called once per shard connection.
+    """
+
+    shards: List[WebSocketClient]
+
+    def __init__(
+        self,
+        num_shards: int = 2,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        should_reconnect_automatically: bool = False,
+        should_restore_subscriptions: bool = True,
+        connect_timeout: Optional[int] = None,
+        ping_interval: Optional[int] = PING_TIMEOUT,
+        pong_timeout: int = PONG_TIMEOUT,
+        sandbox: bool = False,
+        multiverse_chain: MultiverseChain = MultiverseChain.MATIC,
+        base_url: Optional[str] = None,
+        websocket_auth_token_fetch: Optional[Callable[[str], str]] = None,
+        recorder: Optional[WebSocketRecorder] = None,
+        json_codec: Optional[JsonCodec] = None,
+        response_mode: WebSocketResponseMode = "long",
+        dispatch_queue_size: Optional[int] = None,
+        dispatch_policies: Optional[Dict[str, DispatchPolicy]] = None,
+    ):
+        """
+        Args:
+            num_shards: Number of WebSocket connections to distribute markets across
+            api_key: Used to authenticate user when automatically refreshing WS token
+            api_secret: Used to compute HMAC signature when automatically refreshing WS token
+            should_reconnect_automatically: If true, each connection automatically reconnects
+                when closed by the server or network errors
+            should_restore_subscriptions: If true, each connection resubscribes to its active
+                subscriptions after reconnecting automatically
+            connect_timeout: Timeout (in milliseconds) before failing when trying to connect to
+                the WebSocket. Defaults to 5000.
+            ping_interval: How often (in milliseconds) each connection pings the server, or
+                None to disable, see WebSocketClient
+            pong_timeout: How long (in milliseconds) to wait for a pong before closing a
+                connection as dead
+            sandbox: If true, client will point to API sandbox
+            multiverse_chain: Which multiverse chain the client will point to
+            recorder: Optional recorder that captures every frame received by any shard
+            json_codec: JSON codec for messages, defaults to the standard library
+            response_mode: How subscription messages are passed to response listeners, see
+                WebSocketClient
+            dispatch_queue_size: If set, each shard queues received messages per message type,
+                up to this many per type, see WebSocketClient
+            dispatch_policies: Policy by message type when a shard's dispatch queue is full,
+                see WebSocketClient
+        """
+        if num_shards < 1:
+            raise Exception("num_shards must be at least 1")
+        first_shard = WebSocketClient(
+            api_key=api_key,
+            api_secret=api_secret,
+            should_reconnect_automatically=should_reconnect_automatically,
+            should_restore_subscriptions=should_restore_subscriptions,
+            connect_timeout=connect_timeout,
+            ping_interval=ping_interval,
+            pong_timeout=pong_timeout,
+            sandbox=sandbox,
+            multiverse_chain=multiverse_chain,
+            base_url=base_url,
+            websocket_auth_token_fetch=websocket_auth_token_fetch,
+            recorder=recorder,
+            json_codec=json_codec,
+            response_mode=response_mode,
+            dispatch_queue_size=dispatch_queue_size,
+            dispatch_policies=dispatch_policies,
+        )
+        # Other shards share the first shard's authentication token cache
+        self.shards = [first_shard] + [
+            WebSocketClient(
+                should_reconnect_automatically=should_reconnect_automatically,
+                should_restore_subscriptions=should_restore_subscriptions,
+                connect_timeout=connect_timeout,
+                ping_interval=ping_interval,
+                pong_timeout=pong_timeout,
+                sandbox=sandbox,
+                multiverse_chain=multiverse_chain,
+                base_url=base_url,
+                websocket_auth_token_cache=first_shard.websocket_auth_token_cache,
+                recorder=recorder,
+                json_codec=json_codec,
+                response_mode=response_mode,
+                dispatch_queue_size=dispatch_queue_size,
+                dispatch_policies=dispatch_policies,
+            )
+            for _ in range(num_shards - 1)
+        ]
+
+    def shard_index_for_market(self, market: str) -> int:
+        """
+        Stable assignment of a market to a shard, independent of Python's hash randomization
+        """
+        return zlib.crc32(market.encode("utf-8")) % len(self.shards)
+
+    def shard_for_market(self, market: str) -> WebSocketClient:
+        return self.shards[self.shard_index_for_market(market)]
+
+    # Connection management
+
+    def is_connected(self) -> bool:
+        return all(shard.is_connected() for shard in self.shards)
+
+    async def connect(self) -> None:
+        """
+        Establish all WebSocket connections and listen for messages until every connection is
+        closed
+        """
+        await asyncio.gather(*[shard.connect() for shard in self.shards])
+
+    async def disconnect(self) -> None:
+        await asyncio.gather(*[shard.disconnect() for shard in self.shards])
+
+    def get_latency_metrics(self) -> List[WebSocketLatencyMetrics]:
+        """
+        Returns:
+            Latency metrics of each shard's connection, see WebSocketClient.get_latency_metrics
+        """
+        return [shard.get_latency_metrics() for shard in self.shards]
+
+    def get_dispatch_queue_metrics(self) -> List[Dict[str, DispatchQueueMetrics]]:
+        """
+        Returns:
+            Dispatch queue metrics of each shard by message type, see
+            WebSocketClient.get_dispatch_queue_metrics
+        """
+        return [shard.get_dispatch_queue_metrics() for shard in self.shards]
+
+    # Event listeners
+
+    def on_connect(self, listener: WebSocketListenerConnect) -> "ShardedWebSocketClient":
+        for shard in self.shards:
+            shard.on_connect(listener)
+        return self
+
+    def on_disconnect(self, listener: WebSocketListenerDisconnect) -> "ShardedWebSocketClient":
+        for shard in self.shards:
+            shard.on_disconnect(listener)
+        return self
+
+    def on_error(self, listener: WebSocketListenerError) -> "ShardedWebSocketClient":
+        for shard in self.shards:
+            shard.on_error(listener)
+        return self
+
+    def on_response(self, listener: WebSocketListenerResponse) -> "ShardedWebSocketClient":
+        for shard in self.shards:
+            shard.on_response(listener)
+        return self
+
+    def on(
+        self,
+        message_type: str,
+        listener: WebSocketListenerResponse,
+        market: Optional[str] = None,
+    ) -> "ShardedWebSocketClient":
+        """
+        Register a listener for one message type, only on the market's shard if market is given
+        """
+        for shard in [self.shard_for_market(market)] if market else self.shards:
+            shard.on(message_type, listener, market)
+        return self
+
+    def off(
+        self,
+        message_type: str,
+        listener: WebSocketListenerResponse,
+        market: Optional[str] = None,
+    ) -> "ShardedWebSocketClient":
+        for shard in [self.shard_for_market(market)] if market else self.shards:
+            shard.off(message_type, listener, market)
+        return self
+
+    # Subscription management
+
+    def get_active_subscriptions(self) -> List[Any]:
+        """
+        Returns:
+            Active subscriptions of all shards, with the markets of a subscription split across
+            shards merged, in the form accepted by subscribe()
+        """
+        merged: Dict[Tuple[str, Optional[str], Optional[str]], Dict[str, Any]] = {}
+        for shard in self.shards:
+            for subscription in shard.get_active_subscriptions():
+                key = (
+                    subscription["name"],
+                    subscription.get("wallet"),
+                    subscription.get("interval"),
+                )
+                if key not in merged:
+                    merged[key] = subscription
+                elif "markets" in subscription:
+                    merged[key]["markets"] = sorted(
+                        set(merged[key].get("markets", [])) | set(subscription["markets"])
+                    )
+        return list(merged.values())
+
+    async def list_subscriptions(self) -> None:
+        await asyncio.gather(*[shard.list_subscriptions() for shard in self.shards])
+
+    def _route_subscriptions(
+        self,
+        subscriptions: Sequence[Any],
+        markets: Optional[List[str]],
+        broadcast_unscoped: bool = False,
+    ) -> Dict[int, ShardRequest]:
+        """
+        Split subscriptions and top level markets into one request per shard. Subscriptions
+        without any markets go to the first shard, or to every shard if broadcast_unscoped.
+        """
+        requests: Dict[int, ShardRequest] = {}
+
+        def shard_request(index: int) -> ShardRequest:
+            if index not in requests:
+                requests[index] = ([], [])
+            return requests[index]
+
+        for market in markets or []:
+            shard_request(self.shard_index_for_market(market))[1].append(market)
+
+        for subscription in subscriptions:
+            if isinstance(subscription, dict) and subscription.get("markets"):
+                markets_by_shard: Dict[int, List[str]] = {}
+                for market in subscription["markets"]:
+                    markets_by_shard.setdefault(self.shard_index_for_market(market), []).append(
+                        market
+                    )
+                for index, shard_markets in markets_by_shard.items():
+                    shard_request(index)[0].append({**subscription, "markets": shard_markets})
+            elif markets and not is_websocket_authenticated_subscription(subscription):
+                # applies to the top level markets of each shard
+                for index in list(requests):
+                    if requests[index][1]:
+                        requests[index][0].append(subscription)
+            elif broadcast_unscoped:
+                for index in range(len(self.shards)):
+                    shard_request(index)[0].append(subscription)
+            else:
+                shard_request(0)[0].append(subscription)
+
+        return {index: request for index, request in requests.items() if request[0]}
+
+    async def subscribe(
+        self,
+        subscriptions: Sequence[Any],
+        markets: Optional[List[str]] = None,
+        cid: Optional[str] = None,
+    ) -> None:
+        """
+        Subscribe to a given set of subscriptions, sending each shard only its own markets.
+        See WebSocketClient.subscribe.
+
+        Args:
+            subscriptions
+            markets: Optionally provide top level markets
+            cid: Optional custom identifier to identify the matching responses (one per shard)
+        """
+        await asyncio.gather(
+            *[
+                self.shards[index].subscribe(shard_subscriptions, shard_markets, cid)
+                for index, (shard_subscriptions, shard_markets) in self._route_subscriptions(
+                    subscriptions, markets
+                ).items()
+            ]
+        )
+
+    async def unsubscribe(
+        self,
+        subscriptions: Sequence[Any],
+        markets: Optional[List[str]] = None,
+        cid: Optional[str] = None,
+    ) -> None:
+        """
+        Unsubscribe from a given set of subscriptions on the shards serving their markets, or
+        on every shard for subscriptions without markets. See WebSocketClient.unsubscribe.
+        """
+        await asyncio.gather(
+            *[
+                self.shards[index].unsubscribe(shard_subscriptions, shard_markets, cid)
+                for index, (shard_subscriptions, shard_markets) in self._route_subscriptions(
+                    subscriptions, markets, broadcast_unscoped=True
+                ).items()
+            ]
+        )
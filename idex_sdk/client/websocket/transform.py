@@ -1,4 +1,4 @@
-from typing import Callable, Dict, Union, cast, Any
+from typing import Any, Callable, Dict, Iterator, List, Literal, Mapping, Optional, Union, cast
 
 from idex_sdk.idex_types.websocket.request import (
     WebSocketRequestSubscribeShortNames,
@@ -228,3 +228,200 @@ def transform_websocket_short_response_mesg(
         "data": transform(mesg["data"]),
     }
     return cast(WebSocketResponseSubscriptionMessageLong, long_mesg)
+
+
+# Response modes of WebSocketClient: "long" transforms messages to long field names, "short"
+# passes the payload through as received, and "view" wraps the data of subscription messages
+# in a WebSocketResponseDataView which maps long names to short keys on access
+WebSocketResponseMode = Literal["long", "short", "view"]
+
+# The long to short key tables of the "view" mode mirror the transform functions of the "long"
+# mode, and must be kept in sync with them
+POOL_LONG_TO_SHORT_KEYS = {"baseReserveQuantity": "q", "quoteReserveQuantity": "Q"}
+
+ORDER_FILL_LONG_TO_SHORT_KEYS = {
+    "type": "y",
+    "fillId": "i",
+    "price": "p",
+    "quantity": "q",
+    "quoteQuantity": "Q",
+    "orderBookQuantity": "oq",
+    "orderBookQuoteQuantity": "oQ",
+    "poolQuantity": "pq",
+    "poolQuoteQuantity": "pQ",
+    "time": "t",
+    "makerSide": "s",
+    "sequence": "u",
+    "fee": "f",
+    "feeAsset": "a",
+    "gas": "g",
+    "liquidity": "l",
+    "txId": "T",
+    "txStatus": "S",
+}
+
+MESG_DATA_LONG_TO_SHORT_KEYS: Dict[WebSocketRequestSubscribeShortNames, Dict[str, str]] = {
+    "tickers": {
+        "market": "m",
+        "time": "t",
+        "open": "o",
+        "high": "h",
+        "low": "l",
+        "close": "c",
+        "closeQuantity": "Q",
+        "baseVolume": "v",
+        "quoteVolume": "q",
+        "percentChange": "P",
+        "numTrades": "n",
+        "ask": "a",
+        "bid": "b",
+        "sequence": "u",
+    },
+    "candles": {
+        "market": "m",
+        "time": "t",
+        "interval": "i",
+        "start": "s",
+        "end": "e",
+        "open": "o",
+        "high": "h",
+        "low": "l",
+        "close": "c",
+        "volume": "v",
+        "numTrades": "n",
+        "sequence": "u",
+    },
+    "trades": {
+        "type": "y",
+        "market": "m",
+        "fillId": "i",
+        "price": "p",
+        "quantity": "q",
+        "quoteQuantity": "Q",
+        "time": "t",
+        "makerSide": "s",
+        "sequence": "u",
+    },
+    "l1orderbook": {
+        "market": "m",
+        "time": "t",
+        "bidPrice": "b",
+        "bidQuantity": "B",
+        "askPrice": "a",
+        "askQuantity": "A",
+        "pool": "p",
+    },
+    "l2orderbook": {
+        "market": "m",
+        "time": "t",
+        "sequence": "u",
+        "bids": "b",
+        "asks": "a",
+        "pool": "p",
+    },
+    "balances": {
+        "wallet": "w",
+        "asset": "a",
+        "quantity": "q",
+        "availableForTrade": "f",
+        "locked": "l",
+        "usdValue": "d",
+    },
+    "orders": {
+        "market": "m",
+        "orderId": "i",
+        "clientOrderId": "c",
+        "wallet": "w",
+        "executionTime": "t",
+        "time": "T",
+        "update": "x",
+        "status": "X",
+        "sequence": "u",
+        "type": "o",
+        "side": "S",
+        "originalQuantity": "q",
+        "originalQuoteQuantity": "Q",
+        "executedQuantity": "z",
+        "cumulativeQuoteQuantity": "Z",
+        "avgExecutionPrice": "v",
+        "price": "p",
+        "stopPrice": "P",
+        "timeInForce": "f",
+        "selfTradePrevention": "V",
+        "fills": "F",
+    },
+    "tokenprice": {"token": "t", "price": "p"},
+}
+
+
+def _pool_view(pool: Any) -> Optional["WebSocketResponseDataView"]:
+    return WebSocketResponseDataView(pool, POOL_LONG_TO_SHORT_KEYS) if pool else None
+
+
+def _order_fills_view(fills: List[Any]) -> List["WebSocketResponseDataView"]:
+    return [WebSocketResponseDataView(fill, ORDER_FILL_LONG_TO_SHORT_KEYS, True) for fill in fills]
+
+
+# Nested values that are transformed on access, by long name
+_NESTED_VIEWS: Dict[str, Callable[[Any], Any]] = {
+    "pool": _pool_view,
+    "fills": _order_fills_view,
+}
+
+
+class WebSocketResponseDataView(Mapping[str, Any]):
+    """
+    Read-only view of the data of a short-form WebSocket message, indexed by the long field names
+    of the transformed message. Only the fields that are accessed are looked up, so no long-form
+    dict is built per message.
+
+    Attributes:
+        short: the message data as received
+    """
+
+    __slots__ = ("short", "_keys", "_omit_none")
+
+    def __init__(self, short: Any, keys: Dict[str, str], omit_none: bool = False) -> None:
+        self.short = short
+        self._keys = keys
+        # Like the long transforms of orders and fills, treat None values as absent
+        self._omit_none = omit_none
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.short[self._keys[key]]
+        if value is None and self._omit_none:
+            raise KeyError(key)
+        nested_view = _NESTED_VIEWS.get(key)
+        return nested_view(value) if nested_view else value
+
+    def __iter__(self) -> Iterator[str]:
+        for key, short_key in self._keys.items():
+            if short_key in self.short and not (self._omit_none and self.short[short_key] is None):
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+def view_websocket_short_response_mesg(mesg: Any) -> Any:
+    """
+    Wraps the data of a short-form subscription message in a WebSocketResponseDataView, in place
+    """
+    keys = MESG_DATA_LONG_TO_SHORT_KEYS.get(mesg["type"])
+    if keys and "data" in mesg:
+        mesg["data"] = WebSocketResponseDataView(mesg["data"], keys, mesg["type"] == "orders")
+    return mesg
+
+
+def _short_websocket_response_mesg(mesg: Any) -> Any:
+    return mesg
+
+
+RESPONSE_MODE_TRANSFORM_FUNCS: Dict[WebSocketResponseMode, Callable[[Any], Any]] = {
+    "long": transform_websocket_short_response_mesg,
+    "short": _short_websocket_response_mesg,
+    "view": view_websocket_short_response_mesg,
+}
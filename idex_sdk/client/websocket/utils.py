@@ -1,4 +1,4 @@
-from typing import Union, cast
+from typing import Any, Optional, Union, cast
 
 from idex_sdk.idex_types.websocket.request import (
     WebSocketRequestSubscription,
@@ -19,3 +19,14 @@ def remove_wallet_from_sdk_subscription(
     if "wallet" in subscription_without_wallet:
         del subscription_without_wallet["wallet"]
     return subscription_without_wallet
+
+
+def get_message_market(mesg: Any) -> Optional[str]:
+    """
+    Market of a subscription message, or None for messages that are not scoped to a market
+    """
+    data = mesg.get("data")
+    if not data or not hasattr(data, "get"):
+        return None
+    # long and view response modes use "market", short mode "m"
+    return data.get("market") or data.get("m")
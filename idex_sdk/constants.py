@@ -11,6 +11,42 @@ ORDER_BOOK_FIRST_LEVEL_MULTIPLIER_IN_PIPS = 110000000  # 1.1x
 
 ORDER_BOOK_HYBRID_SLIPPAGE = 100  # 0.1%
 
+# Maximum number of REST API requests the real time order book client runs concurrently when
+# synchronizing snapshots
+ORDER_BOOK_MAX_CONCURRENT_REST_REQUESTS = 4
+
+# Number of formatted price levels cached when converting order books to REST API responses,
+# enough to cover both sides of several full books
+ORDER_BOOK_RESPONSE_LEVEL_CACHE_SIZE = 16384
+
+# Default client-side REST API rate limit: sustained requests per second and the burst allowed
+# above it
+REST_RATE_LIMIT_REQUESTS_PER_SECOND = 5
+REST_RATE_LIMIT_BURST = 10
+
+# GET requests rejected with 429 Too Many Requests are retried up to this many times, with
+# exponential backoff from the base delay up to the maximum
+REST_MAX_RETRIES = 3
+REST_RETRY_BACKOFF_SECONDS = 0.5
+REST_RETRY_BACKOFF_MAX_SECONDS = 8
+
+# Suggested cache TTLs (in seconds) for RestPublicClient's response cache, covering reference
+# data that rarely changes
+REST_RESPONSE_CACHE_TTLS = {
+    "/exchange": 60.0,
+    "/assets": 300.0,
+    "/markets": 300.0,
+    "/liquidityPools": 60.0,
+}
+
+# Default page size (the maximum allowed) when iterating over paginated REST API endpoints
+REST_PAGINATION_PAGE_SIZE = 1000
+
+# WebSocket authentication tokens are valid for 15 minutes. Cached tokens are refreshed in the
+# background this many seconds before they expire
+WEBSOCKET_AUTH_TOKEN_TTL_SECONDS = 15 * 60
+WEBSOCKET_AUTH_TOKEN_REFRESH_MARGIN_SECONDS = 60
+
 
 # The URI that will be used based on the configuration given.  This includes
 # sandbox vs production as well as the multi-verse chain that should be used
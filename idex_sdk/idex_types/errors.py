@@ -65,9 +65,17 @@ API_ERRORS_BY_STATUS_CODE = {
 }
 
 
+def check_response_status(status_code: int, text: str) -> None:
+    """
+    Raises the API error matching a response's HTTP status code, for any HTTP client
+    """
+    if status_code != 200:
+        ErrorClass = API_ERRORS_BY_STATUS_CODE.get(status_code)
+        if ErrorClass:
+            raise ErrorClass(text)
+        raise Exception(f"Error {status_code}: {text}")
+
+
 def check_response_errors(response: Response) -> None:
     if response.status_code != 200:
-        ErrorClass = API_ERRORS_BY_STATUS_CODE.get(response.status_code)
-        if ErrorClass:
-            raise ErrorClass(response.text)
-        raise Exception(f"Error {response.status_code}: {response.text}")
+        check_response_status(response.status_code, response.text)
@@ -1,4 +1,14 @@
-from typing import List, Literal, Optional, TypedDict
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    MutableMapping,
+    Optional,
+    TypedDict,
+    cast,
+)
 
 
 class BestAvailablePriceLevels(TypedDict):
@@ -35,6 +45,92 @@ class OrderBookLevelL2(OrderBookLevelL1):
     type: OrderBookLevelType
 
 
+class OrderBookLevel(MutableMapping[str, Any]):
+    """
+    Compact order book price level, storing its fields in slots rather than a per-level dict.
+    Levels created by the SDK are plain dicts; convert them with compact_order_book_levels to
+    hold many books in less memory (about 72 bytes per level instead of 190).
+
+    Supports the same item access as OrderBookLevelL2 (level["price"], level["size"] += x,
+    level.copy(), comparison with dicts, ...) so it can be passed wherever that type is
+    expected, and additionally exposes the fields as attributes, which is faster than item
+    access. It is not a dict: json.dumps and isinstance(level, dict) fail, and item access is
+    slower than on a dict, so the order book functions are slower on compact levels. Use
+    to_dict for a plain dict, eg. for JSON serialization.
+    """
+
+    __slots__ = ("price", "size", "num_orders", "type")
+
+    price: int
+    size: int
+    num_orders: int
+    type: OrderBookLevelType
+
+    def __init__(
+        self, price: int, size: int, num_orders: int, type: OrderBookLevelType = "limit"
+    ) -> None:
+        self.price = price
+        self.size = size
+        self.num_orders = num_orders
+        self.type = type
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _ORDER_BOOK_LEVEL_FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in _ORDER_BOOK_LEVEL_FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("Order book level fields cannot be deleted")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(OrderBookLevel.__slots__)
+
+    def __len__(self) -> int:
+        return len(OrderBookLevel.__slots__)
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def copy(self) -> "OrderBookLevel":
+        return OrderBookLevel(self.price, self.size, self.num_orders, self.type)
+
+    def to_dict(self) -> OrderBookLevelL2:
+        return {
+            "price": self.price,
+            "size": self.size,
+            "num_orders": self.num_orders,
+            "type": self.type,
+        }
+
+
+_ORDER_BOOK_LEVEL_FIELDS = frozenset(OrderBookLevel.__slots__)
+
+
+def make_order_book_level(
+    price: int, size: int, num_orders: int, type: OrderBookLevelType = "limit"
+) -> OrderBookLevelL2:
+    return {"price": price, "size": size, "num_orders": num_orders, "type": type}
+
+
+def compact_order_book_levels(levels: Iterable[OrderBookLevelL2]) -> List[OrderBookLevelL2]:
+    """
+    Convert levels to compact OrderBookLevels, typed as the OrderBookLevelL2 they are
+    compatible with
+    """
+    return [
+        cast(
+            OrderBookLevelL2,
+            OrderBookLevel(level["price"], level["size"], level["num_orders"], level["type"]),
+        )
+        for level in levels
+    ]
+
+
 class PoolReserveQuantities(TypedDict):
     base_reserve_quantity: int
     quote_reserve_quantity: int
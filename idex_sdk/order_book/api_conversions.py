@@ -1,21 +1,23 @@
 import math
-from typing import List, Optional, Union, cast
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple, Union, cast
 
+from idex_sdk.constants import ORDER_BOOK_RESPONSE_LEVEL_CACHE_SIZE
 from idex_sdk.idex_types.order_book import (
     L1OrderBook,
     L2OrderBook,
     OrderBookLevelL1,
     OrderBookLevelL2,
     PoolReserveQuantities,
+    make_order_book_level,
 )
 from idex_sdk.idex_types.rest.response import (
     RestResponseLiquidityPoolReserves,
     RestResponseOrderBook,
     RestResponseOrderBookPriceLevel,
 )
-from idex_sdk.idex_types.websocket.response import (
-    WebSocketResponseL2OrderBookLong,
-)
+from idex_sdk.idex_types.websocket.response import WebSocketResponseL2OrderBookLong
+from idex_sdk.order_book.columnar import ColumnarL2OrderBook, ColumnarL2OrderBookSide
 from idex_sdk.pipmath import decimal_to_pip, pip_to_decimal
 
 
@@ -47,35 +49,57 @@ def l1_order_book_to_rest_response(l1: L1OrderBook) -> RestResponseOrderBook:
     }
 
 
+@lru_cache(maxsize=ORDER_BOOK_RESPONSE_LEVEL_CACHE_SIZE)
+def _format_price_and_size(price: int, size: int) -> Tuple[str, str]:
+    return pip_to_decimal(price), pip_to_decimal(size)
+
+
 def order_book_level_to_response_level(
     order_book_level: Union[OrderBookLevelL1, OrderBookLevelL2],
 ) -> RestResponseOrderBookPriceLevel:
-    level: RestResponseOrderBookPriceLevel = (
-        pip_to_decimal(order_book_level["price"]),
-        pip_to_decimal(order_book_level["size"]),
-        order_book_level["num_orders"],
-    )
+    # Most levels are unchanged between calls, so their formatted strings are cached
+    price, size = _format_price_and_size(order_book_level["price"], order_book_level["size"])
     # We want to display as a list, but keep the type checking as a tuple for safety
-    return cast(RestResponseOrderBookPriceLevel, list(level))
+    return cast(RestResponseOrderBookPriceLevel, [price, size, order_book_level["num_orders"]])
 
 
-def l2_order_book_to_rest_response(l2: L2OrderBook, limit: int = 1000) -> RestResponseOrderBook:
+def columnar_side_to_response_levels(
+    side: ColumnarL2OrderBookSide,
+) -> List[RestResponseOrderBookPriceLevel]:
+    format_price_and_size = _format_price_and_size
+    return [
+        cast(RestResponseOrderBookPriceLevel, [*format_price_and_size(price, size), orders])
+        for price, size, orders in zip(
+            side.prices.tolist(), side.sizes.tolist(), side.num_orders.tolist()
+        )
+    ]
+
+
+def l2_order_book_to_rest_response(
+    l2: Union[L2OrderBook, ColumnarL2OrderBook], limit: int = 1000
+) -> RestResponseOrderBook:
     if limit < 2 or limit > 1000:
         raise Exception("limit must be between 2 and 1000")
 
     per_side = math.ceil(limit / 2)
-    asks = list(map(order_book_level_to_response_level, l2["asks"][:per_side]))
-    bids = list(map(order_book_level_to_response_level, l2["bids"][:per_side]))
+    if isinstance(l2, ColumnarL2OrderBook):
+        sequence, l2_pool = l2.sequence, l2.pool
+        asks = columnar_side_to_response_levels(l2.asks[:per_side])
+        bids = columnar_side_to_response_levels(l2.bids[:per_side])
+    else:
+        sequence, l2_pool = l2["sequence"], l2["pool"]
+        asks = list(map(order_book_level_to_response_level, l2["asks"][:per_side]))
+        bids = list(map(order_book_level_to_response_level, l2["bids"][:per_side]))
     pool: Optional[RestResponseLiquidityPoolReserves] = (
         None
-        if not l2["pool"]
+        if not l2_pool
         else {
-            "baseReserveQuantity": pip_to_decimal(l2["pool"]["base_reserve_quantity"]),
-            "quoteReserveQuantity": pip_to_decimal(l2["pool"]["quote_reserve_quantity"]),
+            "baseReserveQuantity": pip_to_decimal(l2_pool["base_reserve_quantity"]),
+            "quoteReserveQuantity": pip_to_decimal(l2_pool["quote_reserve_quantity"]),
         }
     )
     return {
-        "sequence": l2["sequence"],
+        "sequence": sequence,
         "asks": asks,
         "bids": bids,
         "pool": pool,
@@ -85,19 +109,28 @@ def l2_order_book_to_rest_response(l2: L2OrderBook, limit: int = 1000) -> RestRe
 def response_level_to_order_book_level(
     level: RestResponseOrderBookPriceLevel,
 ) -> OrderBookLevelL2:
-    return {
-        "price": decimal_to_pip(level[0]),
-        "size": decimal_to_pip(level[1]),
-        "num_orders": level[2],
-        "type": "limit",
-    }
+    return make_order_book_level(decimal_to_pip(level[0]), decimal_to_pip(level[1]), level[2])
+
+
+def response_levels_to_order_book_levels(
+    levels: Sequence[RestResponseOrderBookPriceLevel],
+) -> List[OrderBookLevelL2]:
+    """
+    Batch version of response_level_to_order_book_level, used when ingesting REST snapshots and
+    WebSocket updates
+    """
+    to_pip = decimal_to_pip
+    return [
+        make_order_book_level(to_pip(price), to_pip(size), num_orders)
+        for price, size, num_orders in levels
+    ]
 
 
 def response_to_l2_order_book(
     response: Union[RestResponseOrderBook, WebSocketResponseL2OrderBookLong]
 ) -> L2OrderBook:
-    asks = list(map(response_level_to_order_book_level, response["asks"]))
-    bids = list(map(response_level_to_order_book_level, response["bids"]))
+    asks = response_levels_to_order_book_levels(response["asks"])
+    bids = response_levels_to_order_book_levels(response["bids"])
     pool: Optional[PoolReserveQuantities] = (
         None
         if not response["pool"]
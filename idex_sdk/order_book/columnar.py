@@ -0,0 +1,205 @@
+from typing import Any, Iterable, List, Optional
+
+from idex_sdk.idex_types.order_book import (
+    L2OrderBook,
+    OrderBookLevelL2,
+    PoolReserveQuantities,
+    make_order_book_level,
+)
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, only required for columnar order books
+    np = None  # type: ignore
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("numpy is required for columnar order books: pip install numpy")
+
+
+def _pip_array(values: Iterable[int]) -> Any:
+    """
+    Quantities in pips fit in int64 for all practical purposes, but fall back to Python ints
+    (object arrays) rather than overflow
+    """
+    values = list(values)
+    try:
+        return np.array(values, dtype=np.int64)
+    except OverflowError:
+        return np.array(values, dtype=object)
+
+
+class ColumnarL2OrderBookSide:
+    """
+    A single side of a level 2 order book stored as parallel arrays, sorted by price ascending
+    for asks and descending for bids
+
+    Attributes:
+        is_ascending: true for asks, false for bids (ordering of price levels)
+        prices: price of each level in pips (int64)
+        sizes: size of each level in pips (int64, or object if a size exceeds int64)
+        num_orders: number of orders at each level (int64)
+        is_pool: whether each level is a synthetic pool level rather than limit orders (bool)
+    """
+
+    __slots__ = ("is_ascending", "prices", "sizes", "num_orders", "is_pool")
+
+    def __init__(
+        self,
+        is_ascending: bool,
+        prices: Any,
+        sizes: Any,
+        num_orders: Any,
+        is_pool: Optional[Any] = None,
+    ) -> None:
+        _require_numpy()
+        self.is_ascending = is_ascending
+        self.prices = prices
+        self.sizes = sizes
+        self.num_orders = num_orders
+        self.is_pool = np.zeros(len(prices), dtype=bool) if is_pool is None else is_pool
+
+    @classmethod
+    def from_levels(
+        cls, is_ascending: bool, levels: List[OrderBookLevelL2]
+    ) -> "ColumnarL2OrderBookSide":
+        _require_numpy()
+        return cls(
+            is_ascending,
+            np.array([level["price"] for level in levels], dtype=np.int64),
+            _pip_array(level["size"] for level in levels),
+            np.array([level["num_orders"] for level in levels], dtype=np.int64),
+            np.array([level["type"] == "pool" for level in levels], dtype=bool),
+        )
+
+    def to_levels(self) -> List[OrderBookLevelL2]:
+        return [
+            make_order_book_level(price, size, num_orders, "pool" if is_pool else "limit")
+            for price, size, num_orders, is_pool in zip(
+                self.prices.tolist(),
+                self.sizes.tolist(),
+                self.num_orders.tolist(),
+                self.is_pool.tolist(),
+            )
+        ]
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def __getitem__(self, key: slice) -> "ColumnarL2OrderBookSide":
+        """Slice price levels, eg. side[:10] for the 10 best levels"""
+        if not isinstance(key, slice):
+            raise TypeError("Columnar order book sides can only be sliced")
+        return ColumnarL2OrderBookSide(
+            self.is_ascending,
+            self.prices[key],
+            self.sizes[key],
+            self.num_orders[key],
+            self.is_pool[key],
+        )
+
+    def cumulative_sizes(self) -> Any:
+        """Cumulative depth in pips up to and including each price level"""
+        return np.cumsum(self.sizes)
+
+    def apply_updates(self, updates: List[OrderBookLevelL2]) -> "ColumnarL2OrderBookSide":
+        """
+        Applies a changeset of limit order price levels: levels at updated prices are replaced,
+        or removed if the update has no size or no orders
+
+        Returns:
+            Updated order book side
+        """
+        if not updates:
+            return self
+        updated = ColumnarL2OrderBookSide.from_levels(self.is_ascending, updates)
+        keep = ~np.isin(self.prices, updated.prices)
+        add = (updated.sizes > 0) & (updated.num_orders > 0)
+        prices = np.concatenate((self.prices[keep], updated.prices[add]))
+        order = np.argsort(prices if self.is_ascending else -prices, kind="stable")
+        return ColumnarL2OrderBookSide(
+            self.is_ascending,
+            prices[order],
+            np.concatenate((self.sizes[keep], updated.sizes[add]))[order],
+            np.concatenate((self.num_orders[keep], updated.num_orders[add]))[order],
+            np.concatenate((self.is_pool[keep], updated.is_pool[add]))[order],
+        )
+
+    def aggregate_at_tick_size(self, tick_size: int) -> "ColumnarL2OrderBookSide":
+        """
+        Re-aggregate price levels at a larger tick size, rounding ask prices up and bid prices
+        down. See aggregate_l2_order_book_at_tick_size.
+        """
+        if not len(self):
+            return ColumnarL2OrderBookSide(
+                self.is_ascending, self.prices, self.sizes, self.num_orders
+            )
+        if self.is_ascending:
+            prices = -(-self.prices // tick_size) * tick_size
+        else:
+            prices = self.prices // tick_size * tick_size
+        # Rounding preserves the sort order, so levels that share a price are adjacent
+        starts = np.flatnonzero(np.concatenate(([True], prices[1:] != prices[:-1])))
+        return ColumnarL2OrderBookSide(
+            self.is_ascending,
+            prices[starts],
+            np.add.reduceat(self.sizes, starts),
+            np.add.reduceat(self.num_orders, starts),
+        )
+
+
+class ColumnarL2OrderBook:
+    """
+    Level 2 order book with each side stored as contiguous NumPy arrays rather than a list of
+    price levels, for vectorized analytics (requires numpy). Accepted by update_l2_levels,
+    aggregate_l2_order_book_at_tick_size and l2_order_book_to_rest_response in place of an
+    L2OrderBook; convert with from_l2_order_book and to_l2_order_book.
+    """
+
+    __slots__ = ("sequence", "asks", "bids", "pool")
+
+    def __init__(
+        self,
+        sequence: int,
+        asks: ColumnarL2OrderBookSide,
+        bids: ColumnarL2OrderBookSide,
+        pool: Optional[PoolReserveQuantities],
+    ) -> None:
+        self.sequence = sequence
+        self.asks = asks
+        self.bids = bids
+        self.pool = pool
+
+    @classmethod
+    def from_l2_order_book(cls, book: L2OrderBook) -> "ColumnarL2OrderBook":
+        return cls(
+            book["sequence"],
+            ColumnarL2OrderBookSide.from_levels(True, book["asks"]),
+            ColumnarL2OrderBookSide.from_levels(False, book["bids"]),
+            book["pool"],
+        )
+
+    def to_l2_order_book(self) -> L2OrderBook:
+        return {
+            "sequence": self.sequence,
+            "asks": self.asks.to_levels(),
+            "bids": self.bids.to_levels(),
+            "pool": self.pool,
+        }
+
+    def apply_updates(self, updated_levels: L2OrderBook) -> None:
+        """Updates the order book in place. See update_l2_levels."""
+        self.sequence = updated_levels["sequence"]
+        self.asks = self.asks.apply_updates(updated_levels["asks"])
+        self.bids = self.bids.apply_updates(updated_levels["bids"])
+        self.pool = updated_levels["pool"]
+
+    def aggregate_at_tick_size(self, tick_size: int) -> "ColumnarL2OrderBook":
+        """See aggregate_l2_order_book_at_tick_size"""
+        return ColumnarL2OrderBook(
+            self.sequence,
+            self.asks.aggregate_at_tick_size(tick_size),
+            self.bids.aggregate_at_tick_size(tick_size),
+            self.pool,
+        )
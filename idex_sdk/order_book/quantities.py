@@ -1,5 +1,5 @@
 from decimal import ROUND_DOWN, ROUND_HALF_UP, ROUND_UP, Decimal
-from typing import Callable, Dict, List, Literal, cast
+from typing import Callable, Dict, List, Literal, Sequence, Union, cast, overload
 
 from idex_sdk.idex_types.order_book import (
     BestAvailablePriceLevels,
@@ -9,15 +9,18 @@ from idex_sdk.idex_types.order_book import (
     PoolReserveQuantities,
     PriceLevelQuantities,
     SyntheticL2OrderBook,
+    make_order_book_level,
 )
+from idex_sdk.order_book.columnar import ColumnarL2OrderBook
 from idex_sdk.order_book.utils import l2_to_l1_order_book
 from idex_sdk.pipmath import (
     MAX_64_BIT_INT,
-    ONE_IN_PIPS,
+    ONE_IN_PIPS_INT,
     divide_pips,
     multiply_pips,
     pip_to_decimal,
     square_root_big_int,
+    truncated_divide,
 )
 
 RoundingMode = Literal["ROUND_DOWN", "ROUND_HALF_UP", "ROUND_UP"]
@@ -48,17 +51,18 @@ def calculate_gross_base_quantity(
         base_asset_quantity, quote_asset_quantity, target_price, False
     )
 
-    pool_fee: Decimal = ONE_IN_PIPS - int(
-        (ONE_IN_PIPS * pool_fee_rate) / (ONE_IN_PIPS - idex_fee_rate)
+    pool_fee = _pool_fee_multiplier(idex_fee_rate, pool_fee_rate)
+    v0 = pool_fee * base_asset_quantity + ONE_IN_PIPS_INT * base_asset_quantity
+    v1 = base_asset_quantity * base_asset_quantity - truncated_divide(
+        ONE_IN_PIPS_INT * base_asset_quantity * quote_asset_quantity, target_price
     )
-    v0: Decimal = pool_fee * base_asset_quantity + ONE_IN_PIPS * base_asset_quantity
-    v1: Decimal = Decimal(base_asset_quantity) * Decimal(base_asset_quantity) - int(
-        (ONE_IN_PIPS * base_asset_quantity * quote_asset_quantity) / target_price
-    )
-    numerator: Decimal = square_root_big_int(v0 * v0 - 4 * pool_fee * v1 * ONE_IN_PIPS) - v0
-    denominator: Decimal = 2 * pool_fee * (ONE_IN_PIPS - idex_fee_rate)
-    result = int(numerator * ONE_IN_PIPS / denominator)
-    return result
+    numerator = square_root_big_int(v0 * v0 - 4 * pool_fee * v1 * ONE_IN_PIPS_INT) - v0
+    denominator = 2 * pool_fee * (ONE_IN_PIPS_INT - idex_fee_rate)
+    return truncated_divide(numerator * ONE_IN_PIPS_INT, denominator)
+
+
+def _pool_fee_multiplier(idex_fee_rate: int, pool_fee_rate: int) -> int:
+    return ONE_IN_PIPS_INT - (ONE_IN_PIPS_INT * pool_fee_rate) // (ONE_IN_PIPS_INT - idex_fee_rate)
 
 
 def calculate_gross_base_value_of_buy_quantities(
@@ -70,11 +74,9 @@ def calculate_gross_base_value_of_buy_quantities(
     Helper function to convert from quote to base quantities.
     See quantities_available_from_pool_at_ask_price.
     """
-    result = base_asset_quantity - int(
-        (Decimal(base_asset_quantity) * Decimal(quote_asset_quantity))
-        / Decimal(quote_asset_quantity + gross_quote_quantity)
+    return base_asset_quantity - truncated_divide(
+        base_asset_quantity * quote_asset_quantity, quote_asset_quantity + gross_quote_quantity
     )
-    return result
 
 
 def calculate_gross_quote_quantity(
@@ -92,20 +94,18 @@ def calculate_gross_quote_quantity(
         base_asset_quantity, quote_asset_quantity, target_price, True
     )
 
-    pool_fee: Decimal = ONE_IN_PIPS - int(
-        (ONE_IN_PIPS * pool_fee_rate) / (ONE_IN_PIPS - idex_fee_rate)
+    pool_fee = _pool_fee_multiplier(idex_fee_rate, pool_fee_rate)
+    v0 = ONE_IN_PIPS_INT * quote_asset_quantity * (pool_fee + ONE_IN_PIPS_INT)
+    v1 = quote_asset_quantity**2 * (
+        pool_fee**2 + 2 * pool_fee * ONE_IN_PIPS_INT + ONE_IN_PIPS_INT**2
     )
-    v0: Decimal = ONE_IN_PIPS * quote_asset_quantity * (pool_fee + ONE_IN_PIPS)
-    v1: Decimal = quote_asset_quantity**2 * (
-        pool_fee**2 + 2 * pool_fee * ONE_IN_PIPS + ONE_IN_PIPS**2
-    )
-    v2: Decimal = quote_asset_quantity * (
-        ONE_IN_PIPS * quote_asset_quantity - base_asset_quantity * target_price
+    v2 = quote_asset_quantity * (
+        ONE_IN_PIPS_INT * quote_asset_quantity - base_asset_quantity * target_price
     )
 
-    numerator: Decimal = square_root_big_int((v1 - 4 * pool_fee * v2) * ONE_IN_PIPS**2) - v0
-    denominator: Decimal = 2 * pool_fee * ONE_IN_PIPS - 2 * pool_fee * idex_fee_rate
-    return int(numerator / denominator)
+    numerator = square_root_big_int((v1 - 4 * pool_fee * v2) * ONE_IN_PIPS_INT**2) - v0
+    denominator = 2 * pool_fee * ONE_IN_PIPS_INT - 2 * pool_fee * idex_fee_rate
+    return truncated_divide(numerator, denominator)
 
 
 def calculate_gross_quote_value_of_sell_quantities(
@@ -117,9 +117,8 @@ def calculate_gross_quote_value_of_sell_quantities(
     Helper function to convert from base to quote quantities.
     See quantities_available_from_pool_at_bid_price.
     """
-    return quote_asset_quantity - int(
-        (Decimal(base_asset_quantity) * Decimal(quote_asset_quantity))
-        / Decimal(base_asset_quantity + gross_base_quantity)
+    return quote_asset_quantity - truncated_divide(
+        base_asset_quantity * quote_asset_quantity, base_asset_quantity + gross_base_quantity
     )
 
 
@@ -137,14 +136,14 @@ def calculate_base_quantity_out(
     if not quote_asset_quantity or not gross_quote_quantity_in:
         return 0
 
-    numerator: Decimal = base_asset_quantity * quote_asset_quantity * ONE_IN_PIPS
-    denominator: Decimal = quote_asset_quantity * ONE_IN_PIPS + gross_quote_quantity_in * (
-        ONE_IN_PIPS - idex_fee_rate - pool_fee_rate
+    numerator = base_asset_quantity * quote_asset_quantity * ONE_IN_PIPS_INT
+    denominator = quote_asset_quantity * ONE_IN_PIPS_INT + gross_quote_quantity_in * (
+        ONE_IN_PIPS_INT - idex_fee_rate - pool_fee_rate
     )
 
     # The result needs to be rounded down to prevent the pool's constant product from decreasing,
     # ie. the second part of the subtraction (the division) needs to be rounded up.
-    quotient = int(numerator / denominator)
+    quotient = truncated_divide(numerator, denominator)
     if quotient * denominator != numerator:
         quotient += 1
 
@@ -165,14 +164,14 @@ def calculate_quote_quantity_out(
     if not base_asset_quantity or not gross_base_quantity_in:
         return 0
 
-    numerator: Decimal = base_asset_quantity * quote_asset_quantity * ONE_IN_PIPS
-    denominator: Decimal = base_asset_quantity * ONE_IN_PIPS + gross_base_quantity_in * (
-        ONE_IN_PIPS - idex_fee_rate - pool_fee_rate
+    numerator = base_asset_quantity * quote_asset_quantity * ONE_IN_PIPS_INT
+    denominator = base_asset_quantity * ONE_IN_PIPS_INT + gross_base_quantity_in * (
+        ONE_IN_PIPS_INT - idex_fee_rate - pool_fee_rate
     )
 
     # The result needs to be rounded down to prevent the pool's constant product from decreasing,
     # ie. the second part of the subtraction (the division) needs to be rounded up.
-    quotient = int(numerator / denominator)
+    quotient = truncated_divide(numerator, denominator)
     if quotient * denominator != numerator:
         quotient += 1
 
@@ -212,7 +211,7 @@ def calculate_synthetic_price_levels(
 
     # Calculate price slippage per level respecting tick size
     price_slippage_per_level = adjust_price_to_tick_size(
-        int((Decimal(pool_price) * Decimal(visible_slippage)) / Decimal(100000)),
+        truncated_divide(pool_price * visible_slippage, 100000),
         tick_size,
     )
     # If the tick size is too large compared to the price to allow for the specified slippage,
@@ -226,7 +225,7 @@ def calculate_synthetic_price_levels(
     previous_bid_quantity_in_base = 0
 
     for level in range(1, visible_levels + 1):
-        ask_price = int(pool_price + Decimal(level * price_slippage_per_level))
+        ask_price = pool_price + level * price_slippage_per_level
 
         ask_quantity_in_base = quantities_available_from_pool_at_ask_price(
             base_asset_quantity,
@@ -236,14 +235,11 @@ def calculate_synthetic_price_levels(
             pool_fee_rate,
         )["gross_base"]
         asks.append(
-            {
-                "price": ask_price,
-                "size": ask_quantity_in_base - previous_ask_quantity_in_base,
-                "num_orders": 0,
-                "type": "pool",
-            }
+            make_order_book_level(
+                ask_price, ask_quantity_in_base - previous_ask_quantity_in_base, 0, "pool"
+            )
         )
-        bid_price = int(pool_price - Decimal(level * price_slippage_per_level))
+        bid_price = pool_price - level * price_slippage_per_level
         if bid_price > 0:
             bid_quantity_in_base = quantities_available_from_pool_at_bid_price(
                 base_asset_quantity,
@@ -254,12 +250,9 @@ def calculate_synthetic_price_levels(
             )["gross_base"]
 
             bids.append(
-                {
-                    "price": bid_price,
-                    "size": bid_quantity_in_base - previous_bid_quantity_in_base,
-                    "num_orders": 0,
-                    "type": "pool",
-                }
+                make_order_book_level(
+                    bid_price, bid_quantity_in_base - previous_bid_quantity_in_base, 0, "pool"
+                )
             )
 
             previous_bid_quantity_in_base = bid_quantity_in_base
@@ -285,67 +278,50 @@ def _recalculate_hybrid_level_amounts_for_side(
     if not orderbook["pool"]:
         return
 
-    quantities_available_from_pool_func = (
-        quantities_available_from_pool_at_ask_price
-        if side == "asks"
-        else quantities_available_from_pool_at_bid_price
-    )
-
-    def recalculate_size_for_limit(level: OrderBookLevelL2) -> None:
-        assert orderbook["pool"]
-
-        level["size"] += quantities_available_from_pool_func(
-            orderbook["pool"]["base_reserve_quantity"],
-            orderbook["pool"]["quote_reserve_quantity"],
-            level["price"],
-            idex_fee_rate,
-            pool_fee_rate,
-        )["gross_base"] - (
-            0
-            if not prev_level["price"]
-            else quantities_available_from_pool_func(
-                orderbook["pool"]["base_reserve_quantity"],
-                orderbook["pool"]["quote_reserve_quantity"],
-                prev_level["price"],
-                idex_fee_rate,
-                pool_fee_rate,
-            )["gross_base"]
-        )
-
-    def recalculate_size_for_pool(level: OrderBookLevelL2) -> None:
-        assert orderbook["pool"]
-        level["size"] = (
-            quantities_available_from_pool_func(
-                orderbook["pool"]["base_reserve_quantity"],
-                orderbook["pool"]["quote_reserve_quantity"],
-                level["price"],
-                idex_fee_rate,
-                pool_fee_rate,
-            )["gross_base"]
-            - quantities_available_from_pool_func(
-                orderbook["pool"]["base_reserve_quantity"],
-                orderbook["pool"]["quote_reserve_quantity"],
-                prev_level["price"],
-                idex_fee_rate,
-                pool_fee_rate,
-            )["gross_base"]
-        )
-
-    prev_level: OrderBookLevelL2 = {"price": 0, "size": 0, "num_orders": 0, "type": "pool"}
+    levels: List[OrderBookLevelL2] = []
     for level in orderbook[side]:
         # empty asks may be represented this way
         if level["price"] == 0:
             break
+        levels.append(level)
+
+    # limit levels always accrue pool liquidity from the previous level, and pool levels
+    # following a limit level were previously subdivided
+    recalculated_indexes = [
+        index
+        for index, level in enumerate(levels)
+        if level["type"] == "limit" or (index and levels[index - 1]["type"] != "pool")
+    ]
+    # each of those levels needs pool quantities at its own and the previous price, evaluate
+    # every distinct price once
+    evaluated_indexes = sorted(
+        set(recalculated_indexes) | {index - 1 for index in recalculated_indexes if index}
+    )
+    gross_base_at_index = dict(
+        zip(
+            evaluated_indexes,
+            (
+                quantities["gross_base"]
+                for quantities in quantities_available_from_pool_at_prices(
+                    orderbook["pool"]["base_reserve_quantity"],
+                    orderbook["pool"]["quote_reserve_quantity"],
+                    [levels[index]["price"] for index in evaluated_indexes],
+                    idex_fee_rate,
+                    pool_fee_rate,
+                    side == "asks",
+                )
+            ),
+        )
+    )
 
-        # limit levels always accrue pool liquidity from the previous level
-        if level["type"] == "limit":
-            recalculate_size_for_limit(level)
-
-        # this pool level was previously subdivided
-        if level["type"] == "pool" and prev_level["type"] != "pool":
-            recalculate_size_for_pool(level)
-
-        prev_level = level
+    for index in recalculated_indexes:
+        pool_quantity = gross_base_at_index[index] - (
+            gross_base_at_index[index - 1] if index else 0
+        )
+        if levels[index]["type"] == "limit":
+            levels[index]["size"] += pool_quantity
+        else:
+            levels[index]["size"] = pool_quantity
 
 
 def recalculate_hybrid_level_amounts(
@@ -451,13 +427,12 @@ def quantities_available_from_pool_at_ask_price(
     )
     idex_fee: int = multiply_pips(gross_quote, idex_fee_rate)
     pool_fee: int = multiply_pips(gross_quote, pool_fee_rate)
-    net_quote: int = int(
-        (gross_quote * (ONE_IN_PIPS - idex_fee_rate - pool_fee_rate)) / ONE_IN_PIPS
+    net_quote: int = truncated_divide(
+        gross_quote * (ONE_IN_PIPS_INT - idex_fee_rate - pool_fee_rate), ONE_IN_PIPS_INT
     )
 
-    base_out: int = base_asset_quantity - int(
-        (Decimal(base_asset_quantity) * Decimal(quote_asset_quantity))
-        / Decimal(quote_asset_quantity + net_quote)
+    base_out: int = base_asset_quantity - truncated_divide(
+        base_asset_quantity * quote_asset_quantity, quote_asset_quantity + net_quote
     )
 
     # new pool balances, including the retained pool fee
@@ -528,17 +503,176 @@ def quantities_available_from_pool_at_bid_price(
     }
 
 
+def quantities_available_from_pool_at_prices(
+    base_asset_quantity: int,
+    quote_asset_quantity: int,
+    prices: Sequence[int],
+    idex_fee_rate: int,
+    pool_fee_rate: int,
+    is_ask: bool,
+) -> List[PriceLevelQuantities]:
+    """
+    Batch version of quantities_available_from_pool_at_ask_price and
+    quantities_available_from_pool_at_bid_price, evaluating many price levels of one side
+    against the same pool in a single pass
+
+    Args:
+        base_asset_quantity: pool reserve in base asset, must be at least 1.0 expressed
+            in pips (10^-8)
+        quote_asset_quantity: pool reserve in quote asset, must be at least 1.0 expressed
+            in pips (10^-8)
+        prices: price levels to calculate quantities for, sorted ascending for asks and
+            descending for bids
+        idex_fee_rate: the idex fee rate to use for calculations (query /v1/exchange for
+            current global setting)
+        pool_fee_rate: the liquidity pool fee rate to use for calculations (query /v1/exchange for
+            current global setting)
+        is_ask: true to calculate quantities at ask prices, false for bid prices
+
+    Returns:
+        Pool quantities available at each price, in the same order as prices
+    """
+    pool_price = divide_pips(quote_asset_quantity, base_asset_quantity)
+    contributing_prices = [
+        price for price in prices if (price > pool_price if is_ask else price < pool_price)
+    ]
+    if not contributing_prices:
+        return [{"gross_base": 0, "gross_quote": 0} for _ in prices]
+    # validates the reserves once, the remaining prices are known to be on the correct side of
+    # the pool price
+    validate_synthetic_price_level_inputs(
+        base_asset_quantity, quote_asset_quantity, contributing_prices[0], is_ask
+    )
+    for price in contributing_prices:
+        _validate_target_price(price)
+
+    quantities_at_price = (
+        _quantities_available_from_pool_at_ask_prices
+        if is_ask
+        else _quantities_available_from_pool_at_bid_prices
+    )(base_asset_quantity, quote_asset_quantity, contributing_prices, idex_fee_rate, pool_fee_rate)
+    return [
+        quantities_at_price.get(price) or {"gross_base": 0, "gross_quote": 0} for price in prices
+    ]
+
+
+def _quantities_available_from_pool_at_ask_prices(
+    base_asset_quantity: int,
+    quote_asset_quantity: int,
+    prices: Sequence[int],
+    idex_fee_rate: int,
+    pool_fee_rate: int,
+) -> Dict[int, PriceLevelQuantities]:
+    """
+    quantities_available_from_pool_at_ask_price for validated ask prices, with the terms that
+    only depend on the pool and fees computed once
+    """
+    b, q = base_asset_quantity, quote_asset_quantity
+    pool_fee = _pool_fee_multiplier(idex_fee_rate, pool_fee_rate)
+    # calculate_gross_quote_quantity, with its square root argument expanded to
+    # radicand_constant + radicand_per_price * price
+    v0 = ONE_IN_PIPS_INT * q * (pool_fee + ONE_IN_PIPS_INT)
+    v1 = q**2 * (pool_fee**2 + 2 * pool_fee * ONE_IN_PIPS_INT + ONE_IN_PIPS_INT**2)
+    radicand_constant = (v1 - 4 * pool_fee * ONE_IN_PIPS_INT * q * q) * ONE_IN_PIPS_INT**2
+    radicand_per_price = 4 * pool_fee * q * b * ONE_IN_PIPS_INT**2
+    denominator = 2 * pool_fee * ONE_IN_PIPS_INT - 2 * pool_fee * idex_fee_rate
+    net_quote_rate = ONE_IN_PIPS_INT - idex_fee_rate - pool_fee_rate
+    constant_product = b * q
+
+    results: Dict[int, PriceLevelQuantities] = {}
+    for price in prices:
+        if price in results:
+            continue
+        gross_quote = truncated_divide(
+            square_root_big_int(radicand_constant + radicand_per_price * price) - v0, denominator
+        )
+        idex_fee = multiply_pips(gross_quote, idex_fee_rate)
+        pool_fee_quantity = multiply_pips(gross_quote, pool_fee_rate)
+        net_quote = truncated_divide(gross_quote * net_quote_rate, ONE_IN_PIPS_INT)
+
+        # new pool balances, including the retained pool fee
+        resulting_base = truncated_divide(constant_product, q + net_quote)
+        resulting_quote = q + pool_fee_quantity + net_quote
+
+        # fix quote quantity for constant pricing
+        resulting_price = divide_pips(resulting_quote, resulting_base)
+        if resulting_price < price:
+            net_quote += multiply_pips(price, resulting_base, True) - resulting_quote
+        elif resulting_price > price:
+            net_quote -= 1
+
+        results[price] = {
+            "gross_base": b
+            - truncated_divide(constant_product, q + net_quote + pool_fee_quantity + idex_fee),
+            "gross_quote": gross_quote,
+        }
+    return results
+
+
+def _quantities_available_from_pool_at_bid_prices(
+    base_asset_quantity: int,
+    quote_asset_quantity: int,
+    prices: Sequence[int],
+    idex_fee_rate: int,
+    pool_fee_rate: int,
+) -> Dict[int, PriceLevelQuantities]:
+    """
+    quantities_available_from_pool_at_bid_price for validated bid prices, with the terms that
+    only depend on the pool and fees computed once
+    """
+    b, q = base_asset_quantity, quote_asset_quantity
+    pool_fee = _pool_fee_multiplier(idex_fee_rate, pool_fee_rate)
+    # calculate_gross_base_quantity
+    v0 = pool_fee * b + ONE_IN_PIPS_INT * b
+    v0_squared = v0 * v0
+    v1_multiplier = 4 * pool_fee * ONE_IN_PIPS_INT
+    scaled_constant_product = ONE_IN_PIPS_INT * b * q
+    denominator = 2 * pool_fee * (ONE_IN_PIPS_INT - idex_fee_rate)
+    constant_product = b * q
+
+    results: Dict[int, PriceLevelQuantities] = {}
+    for price in prices:
+        if price in results:
+            continue
+        v1 = b * b - truncated_divide(scaled_constant_product, price)
+        gross_base = truncated_divide(
+            (square_root_big_int(v0_squared - v1_multiplier * v1) - v0) * ONE_IN_PIPS_INT,
+            denominator,
+        )
+        results[price] = {
+            "gross_base": gross_base,
+            "gross_quote": q - truncated_divide(constant_product, b + gross_base),
+        }
+    return results
+
+
+@overload
 def aggregate_l2_order_book_at_tick_size(input_book: L2OrderBook, tick_size: int) -> L2OrderBook:
+    ...
+
+
+@overload
+def aggregate_l2_order_book_at_tick_size(
+    input_book: ColumnarL2OrderBook, tick_size: int
+) -> ColumnarL2OrderBook:
+    ...
+
+
+def aggregate_l2_order_book_at_tick_size(
+    input_book: Union[L2OrderBook, ColumnarL2OrderBook], tick_size: int
+) -> Union[L2OrderBook, ColumnarL2OrderBook]:
     """
     Helper function to re-aggregate L2 orderbook price levels at a larger (more zeroes) tick size
     """
+    if isinstance(input_book, ColumnarL2OrderBook):
+        return input_book.aggregate_at_tick_size(tick_size)
+
     ask_levels_by_price: Dict[int, OrderBookLevelL2] = {}
     for ask_level in input_book["asks"]:
         price = adjust_price_to_tick_size(ask_level["price"], tick_size, ASKS_TICK_ROUNDING_MODE)
         level = ask_levels_by_price.get(price)
         if not level:
-            level = NULL_LEVEL.copy()
-            level["price"] = price
+            level = make_order_book_level(price, 0, 0)
         level["num_orders"] += ask_level["num_orders"]
         level["size"] += ask_level["size"]
         ask_levels_by_price[price] = level
@@ -548,8 +682,7 @@ def aggregate_l2_order_book_at_tick_size(input_book: L2OrderBook, tick_size: int
         price = adjust_price_to_tick_size(bid_level["price"], tick_size, BIDS_TICK_ROUNDING_MODE)
         level = bid_levels_by_price.get(price)
         if not level:
-            level = NULL_LEVEL.copy()
-            level["price"] = price
+            level = make_order_book_level(price, 0, 0)
         level["num_orders"] += bid_level["num_orders"]
         level["size"] += bid_level["size"]
         bid_levels_by_price[price] = level
@@ -571,7 +704,7 @@ def l1_best_available_buy_price(
 ) -> int:
     taker_minimum_in_quote_after_idex_fee = multiply_pips(
         taker_minimum_in_quote,
-        int(ONE_IN_PIPS - idex_fee_rate),
+        ONE_IN_PIPS_INT - idex_fee_rate,
     )
     base_received = calculate_base_quantity_out(
         pool["base_reserve_quantity"],
@@ -600,7 +733,7 @@ def l1_best_available_sell_price(
 ) -> int:
     taker_minimum_in_base_after_idex_fee = multiply_pips(
         taker_minimum_in_base,
-        int(ONE_IN_PIPS - idex_fee_rate),
+        ONE_IN_PIPS_INT - idex_fee_rate,
     )
     quote_received = calculate_quote_quantity_out(
         pool["base_reserve_quantity"],
@@ -681,10 +814,9 @@ def l1_l2_order_books_with_minimum_taker(
         return {"l1": l2_to_l1_order_book(l2), "l2": l2}
 
     l2_values: L2OrderBook = l2.copy()
-    taker_minimum_in_base = int(
-        Decimal(taker_minimum_in_quote)
-        * Decimal(l2["pool"]["base_reserve_quantity"])
-        / Decimal(l2["pool"]["quote_reserve_quantity"])
+    taker_minimum_in_base = truncated_divide(
+        taker_minimum_in_quote * l2["pool"]["base_reserve_quantity"],
+        l2["pool"]["quote_reserve_quantity"],
     )
 
     best_available_prices = l1_or_l2_best_available_prices(
@@ -717,9 +849,7 @@ def l1_l2_order_books_with_minimum_taker(
         )["gross_base"]
 
     if not l2["asks"] or buy_price < l2["asks"][0]["price"]:
-        l2_values["asks"].insert(
-            0, {"price": buy_price, "size": gross_buy_base, "num_orders": 0, "type": "pool"}
-        )
+        l2_values["asks"].insert(0, make_order_book_level(buy_price, gross_buy_base, 0, "pool"))
         if len(l2_values["asks"]) > 1:
             l2_values["asks"][1]["size"] -= gross_buy_base
 
@@ -745,7 +875,7 @@ def l1_l2_order_books_with_minimum_taker(
 
         if not l2["bids"] or sell_price > l2["bids"][0]["price"]:
             l2_values["bids"].insert(
-                0, {"price": sell_price, "size": gross_sell_base, "num_orders": 0, "type": "pool"}
+                0, make_order_book_level(sell_price, gross_sell_base, 0, "pool")
             )
             if len(l2_values["bids"]) > 1:
                 l2_values["bids"][1]["size"] -= gross_sell_base
@@ -774,17 +904,13 @@ def validate_synthetic_price_level_inputs(
     Returns:
         None, validation always succeeds or raises an exception
     """
-    if base_asset_quantity < ONE_IN_PIPS or quote_asset_quantity < ONE_IN_PIPS:
+    if base_asset_quantity < ONE_IN_PIPS_INT or quote_asset_quantity < ONE_IN_PIPS_INT:
         raise Exception(
             "Base asset quantity and quote asset quantity must be positive integers, "
             "for pools with at least 1 quote and 1 base token"
         )
 
-    if target_price <= 0 or target_price > MAX_64_BIT_INT:
-        raise Exception(
-            f"Target price ({pip_to_decimal(target_price)}) "
-            "must be above zero and below the 64 bit integer limit"
-        )
+    _validate_target_price(target_price)
 
     current_price = divide_pips(quote_asset_quantity, base_asset_quantity)
     if is_buy and current_price >= target_price:
@@ -799,6 +925,14 @@ def validate_synthetic_price_level_inputs(
         )
 
 
+def _validate_target_price(target_price: int) -> None:
+    if target_price <= 0 or target_price > MAX_64_BIT_INT:
+        raise Exception(
+            f"Target price ({pip_to_decimal(target_price)}) "
+            "must be above zero and below the 64 bit integer limit"
+        )
+
+
 def adjust_price_to_tick_size(
     price: int,
     tick_size: int,
@@ -1,9 +1,18 @@
-from decimal import ROUND_DOWN, Decimal
+import math
+from decimal import ROUND_DOWN, Decimal, getcontext
+from typing import Union
 
 EXCHANGE_DECIMALS = 8
 ONE_IN_PIPS = Decimal(10**EXCHANGE_DECIMALS)
+# Integer counterpart of ONE_IN_PIPS for exact integer-only arithmetic
+ONE_IN_PIPS_INT = 10**EXCHANGE_DECIMALS
 MAX_64_BIT_INT = 18446744073709551615
 DECIMAL_FORMAT_STR = "{:." + str(EXCHANGE_DECIMALS) + "f}"
+_DECIMAL_PRECISION = getcontext().prec
+_MAX_EXACT_WHOLE_PART = 10 ** (_DECIMAL_PRECISION - EXCHANGE_DECIMALS)
+# Integer arithmetic matches Decimal arithmetic for operands below this bound, one digit short of
+# its precision so rounding the last digit of a quotient cannot carry into the integer part
+_MAX_EXACT = 10 ** (_DECIMAL_PRECISION - 1)
 
 
 def asset_units_to_decimal(asset_units: int, decimals: int) -> str:
@@ -11,38 +20,90 @@ def asset_units_to_decimal(asset_units: int, decimals: int) -> str:
 
 
 def decimal_to_pip(decimal: str) -> int:
+    """
+    Parse a decimal string to pips, rounding down. Plain unsigned fixed-point strings such as
+    API prices and quantities are parsed with integer operations only.
+    """
+    whole, _, fraction = decimal.partition(".")
+    if (
+        (whole.isdecimal() or (not whole and fraction))
+        and (not fraction or fraction.isdecimal())
+        # Decimal arithmetic rounds coefficients beyond its precision before rounding down
+        and len(whole) + len(fraction) <= _DECIMAL_PRECISION
+    ):
+        if len(fraction) == EXCHANGE_DECIMALS:
+            return int(whole + fraction)
+        return int(whole or 0) * ONE_IN_PIPS_INT + int(
+            fraction[:EXCHANGE_DECIMALS].ljust(EXCHANGE_DECIMALS, "0")
+        )
     return int((Decimal(decimal) * ONE_IN_PIPS).to_integral_value(rounding=ROUND_DOWN))
 
 
 def divide_pips(value_in_pips: int, divisor_in_pips: int) -> int:
     if divisor_in_pips <= 0:
         return 0
-    result = int((Decimal(value_in_pips) * ONE_IN_PIPS) / Decimal(divisor_in_pips))
-    return result
+    numerator = value_in_pips * ONE_IN_PIPS_INT
+    if abs(numerator) >= _MAX_EXACT:
+        # Beyond Decimal precision, keep its rounding behavior
+        return int((Decimal(value_in_pips) * ONE_IN_PIPS) / Decimal(divisor_in_pips))
+    return truncated_divide(numerator, divisor_in_pips)
 
 
 def multiply_pips(pip_value_1: int, pip_value_2: int, round_up: bool = False) -> int:
-    pip_values_product = Decimal(pip_value_1 * pip_value_2)
-    if round_up and pip_values_product % ONE_IN_PIPS > 0:
-        return int(1 + pip_values_product / ONE_IN_PIPS)
-    result = int(pip_values_product / ONE_IN_PIPS)
+    pip_values_product = pip_value_1 * pip_value_2
+    if abs(pip_values_product) >= _MAX_EXACT:
+        # Beyond Decimal precision, keep its rounding behavior
+        decimal_product = Decimal(pip_values_product)
+        if round_up and decimal_product % ONE_IN_PIPS > 0:
+            return int(1 + decimal_product / ONE_IN_PIPS)
+        return int(decimal_product / ONE_IN_PIPS)
+    result = truncated_divide(pip_values_product, ONE_IN_PIPS_INT)
+    if round_up and pip_values_product > 0 and pip_values_product % ONE_IN_PIPS_INT:
+        return result + 1
     return result
 
 
 def pip_to_decimal(pips: int) -> str:
-    return asset_units_to_decimal(pips, EXCHANGE_DECIMALS)
+    """
+    Format pips as a decimal string with 8 decimals, using integer operations only
+    """
+    whole, fraction = divmod(abs(pips), ONE_IN_PIPS_INT)
+    if whole >= _MAX_EXACT_WHOLE_PART:
+        # Beyond Decimal precision, keep its rounding behavior
+        return asset_units_to_decimal(pips, EXCHANGE_DECIMALS)
+    return f"{'-' if pips < 0 else ''}{whole}.{fraction:08d}"
 
 
-def square_root_big_int(value: Decimal) -> int:
+def square_root_big_int(value: Union[int, Decimal]) -> int:
+    """
+    Integer square root, rounded down, exact for any value. This intentionally differs from
+    the Newton iteration it replaced, which rounded its quotients: for Decimal values above
+    about 10^27 it could return one more than the exact root, and for int values it used float
+    arithmetic, inexact above 2^53.
+    """
     if value < 0:
         raise ValueError("Square root of negative numbers is not supported")
-    elif value == 0:
-        return int(value)
-    elif value <= 3:
-        return 1
+    return _isqrt(int(value))
+
+
+def truncated_divide(numerator: int, denominator: int) -> int:
+    """
+    Exact integer division rounding toward zero, like int() of a decimal quotient
+    """
+    quotient = abs(numerator) // abs(denominator)
+    return quotient if (numerator < 0) == (denominator < 0) else -quotient
+
+
+def _newton_isqrt(value: int) -> int:
+    if value < 2:
+        return value
     z = value
-    x = value / 2 + 1
+    x = value // 2 + 1
     while x < z:
         z = x
-        x = (value / x + x) / 2
-    return int(z)
+        x = (value // x + x) // 2
+    return z
+
+
+# math.isqrt is only available from Python 3.8
+_isqrt = getattr(math, "isqrt", _newton_isqrt)
@@ -1,23 +1,46 @@
+import asyncio
 import json
 import os
+import threading
+import time
 import unittest
-from typing import Any
+from typing import Any, List
+from unittest import mock
 from unittest.mock import MagicMock
 
+from websockets.exceptions import ConnectionClosed
+
 from idex_sdk.client.order_book.real_time import OrderBookRealTimeClient
 
 file_dir = os.path.dirname(os.path.abspath(__file__))
 
 
+class FakeWebSocket:
+    open = True
+
+    def __init__(self) -> None:
+        self.sent: List[str] = []
+
+    async def send(self, message: str) -> None:
+        self.sent.append(message)
+
+    async def recv(self) -> str:
+        self.open = False
+        raise ConnectionClosed(1000, "")
+
+    async def close(self) -> None:
+        self.open = False
+
+
 class TestRestAuthenticatedClient(unittest.IsolatedAsyncioTestCase):
     maxDiff = None
 
     @staticmethod
-    async def get_client(order_book: Any) -> OrderBookRealTimeClient:
+    async def get_client(order_book: Any, **kwargs: Any) -> OrderBookRealTimeClient:
         async def async_nothing():
             pass
 
-        client = OrderBookRealTimeClient()
+        client = OrderBookRealTimeClient(**kwargs)
         client.rest_public_client = MagicMock()
         client.rest_public_client.get_exchange_info.return_value = {
             "timeZone": "UTC",
@@ -143,6 +166,145 @@ class TestRestAuthenticatedClient(unittest.IsolatedAsyncioTestCase):
         )
         del client
 
+    async def test_get_hybrid_books_cache(self):
+        with open(f"{file_dir}/sequence_1130790.json") as json_file:
+            rest_order_book = json.load(json_file)
+        client = await self.get_client(rest_order_book)
+        client.l2_order_books["IDEX-USDC"] = client.load_level2("IDEX-USDC")
+        first = client.get_order_book_l2("IDEX-USDC", 10)
+        self.assertEqual(client.get_order_book_l2("IDEX-USDC", 10), first)
+        client.get_order_book_l1("IDEX-USDC")
+        self.assertEqual(client.get_hybrid_books_cache_stats(), {"hits": 2, "misses": 1})
+
+        client.l2_order_book_updates["IDEX-USDC"] = [
+            {
+                "sequence": 1130791,
+                "asks": [],
+                "bids": [{"price": 6500000, "size": 0, "num_orders": 0, "type": "limit"}],
+                "pool": client.l2_order_books["IDEX-USDC"]["pool"],
+            }
+        ]
+        await client.apply_order_book_updates("IDEX-USDC")
+        self.assertEqual(client.get_order_book_l2("IDEX-USDC", 10)["sequence"], 1130791)
+        self.assertEqual(client.get_hybrid_books_cache_stats(), {"hits": 2, "misses": 2})
+
+        client.apply_token_price_update({"token": "USDC", "price": "1.30000000"})
+        client.get_order_book_l1("IDEX-USDC")
+        self.assertEqual(client.get_hybrid_books_cache_stats(), {"hits": 2, "misses": 3})
+        client.reset_internal_state()
+        del client
+
+    async def test_synchronize_from_rest_api_concurrency(self):
+        with open(f"{file_dir}/sequence_1130790.json") as json_file:
+            rest_order_book = json.load(json_file)
+        client = await self.get_client(rest_order_book, max_concurrent_rest_requests=3)
+        client.markets = [f"MARKET{i}-USDC" for i in range(9)]
+        lock = threading.Lock()
+        in_flight = {"current": 0, "max": 0}
+
+        def get_order_book_level2(market: str, limit: int, limit_order_only: bool) -> Any:
+            with lock:
+                in_flight["current"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["current"])
+            time.sleep(0.05)
+            with lock:
+                in_flight["current"] -= 1
+            return rest_order_book
+
+        client.rest_public_client.get_order_book_level2.side_effect = get_order_book_level2
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        await client.synchronize_from_rest_api()
+        ticker.cancel()
+
+        self.assertEqual(in_flight["max"], 3)
+        self.assertEqual(sorted(client.l2_order_books.keys()), sorted(client.markets))
+        # the event loop kept running while snapshots were loading
+        self.assertGreater(ticks, 5)
+        client.reset_internal_state()
+        del client
+
+    async def test_apply_order_book_updates_resynchronizes_single_market(self):
+        with open(f"{file_dir}/sequence_1130790.json") as json_file:
+            rest_order_book = json.load(json_file)
+        client = await self.get_client(rest_order_book)
+        client.markets = ["IDEX-USDC", "ETH-USDC"]
+        await client.synchronize_from_rest_api()
+        other_book = client.l2_order_books["ETH-USDC"]
+        errors = []
+        ready = []
+        pool = client.l2_order_books["IDEX-USDC"]["pool"]
+        client.on("error", errors.append)
+        client.on("ready", ready.append)
+
+        def update(sequence: int, price: int) -> Any:
+            return {
+                "sequence": sequence,
+                "asks": [],
+                "bids": [{"price": price, "size": 100000000, "num_orders": 1, "type": "limit"}],
+                "pool": pool,
+            }
+
+        client.rest_public_client.get_order_book_level2.return_value = {
+            **rest_order_book,
+            "sequence": 1130793,
+        }
+        client.l2_order_book_updates["IDEX-USDC"] = [update(1130791, 6400000)]
+        client.l2_order_book_updates["IDEX-USDC"].append(update(1130793, 6300000))
+        client.l2_order_book_updates["IDEX-USDC"].append(update(1130794, 6200000))
+        await client.apply_order_book_updates("IDEX-USDC")
+
+        self.assertEqual(len(errors), 1)
+        self.assertNotIn("IDEX-USDC", client.l2_order_books)
+        self.assertIs(client.l2_order_books["ETH-USDC"], other_book)
+
+        # updates that arrive during resynchronization are buffered
+        client.l2_order_book_updates["IDEX-USDC"].append(update(1130795, 6100000))
+        await client.apply_order_book_updates("IDEX-USDC")
+        await client.market_resynchronization_tasks["IDEX-USDC"]
+
+        book = client.l2_order_books["IDEX-USDC"]
+        self.assertEqual(ready, ["IDEX-USDC"])
+        self.assertEqual(book["sequence"], 1130795)
+        bid_prices = [level["price"] for level in book["bids"]]
+        self.assertNotIn(6400000, bid_prices)
+        self.assertNotIn(6300000, bid_prices)
+        self.assertIn(6200000, bid_prices)
+        self.assertIn(6100000, bid_prices)
+        self.assertNotIn("IDEX-USDC", client.l2_order_book_updates)
+        self.assertIs(client.l2_order_books["ETH-USDC"], other_book)
+        client.reset_internal_state()
+        del client
+
+    async def test_reconnect_subscribes_once(self):
+        client = OrderBookRealTimeClient()
+        client.websocket_client.should_reconnect_automatically = False
+        client.synchronize_from_rest_api = mock.AsyncMock()  # type: ignore
+        connections = [FakeWebSocket(), FakeWebSocket()]
+
+        with mock.patch(
+            "idex_sdk.client.websocket.client.ws_connect", mock.AsyncMock(side_effect=connections)
+        ):
+            await client.start(["IDEX-USDC"])
+            client.websocket_client.state["is_reconnecting"] = True
+            await client.websocket_client.connect()
+
+        for ws in connections:
+            subscriptions = [
+                subscription["name"]
+                for mesg in ws.sent
+                for subscription in client.websocket_client.json_codec.loads(mesg)["subscriptions"]
+            ]
+            self.assertCountEqual(subscriptions, ["l2orderbook", "tokenprice"])
+        self.assertEqual(client.synchronize_from_rest_api.await_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,86 @@
+import random
+import unittest
+from typing import List
+
+from idex_sdk.client.order_book.utils import (
+    L2OrderBookSide,
+    update_l2_levels,
+    update_l2_side,
+)
+from idex_sdk.idex_types.order_book import L2OrderBook, OrderBookLevelL2
+
+
+def level(price: int, size: int, num_orders: int = 1) -> OrderBookLevelL2:
+    return {"price": price, "size": size, "num_orders": num_orders, "type": "limit"}
+
+
+def random_side(rng: random.Random, is_ascending: bool, count: int) -> List[OrderBookLevelL2]:
+    prices = sorted(rng.sample(range(1, 5000), count), reverse=not is_ascending)
+    return [level(price, rng.randint(1, 10**10), rng.randint(1, 5)) for price in prices]
+
+
+def random_updates(
+    rng: random.Random, is_ascending: bool, side: List[OrderBookLevelL2], count: int
+) -> List[OrderBookLevelL2]:
+    existing_prices = [level["price"] for level in side]
+    updates = {}
+    for _ in range(count):
+        action = rng.random()
+        if existing_prices and action < 0.3:
+            # removal of an existing level
+            price = rng.choice(existing_prices)
+            updates[price] = level(price, 0, 0)
+        elif existing_prices and action < 0.6:
+            # change of an existing level
+            price = rng.choice(existing_prices)
+            updates[price] = level(price, rng.randint(1, 10**10), rng.randint(1, 5))
+        else:
+            # new level anywhere in the book, including beyond either end
+            price = rng.randint(1, 6000)
+            if price not in existing_prices:
+                updates[price] = level(price, rng.randint(1, 10**10), rng.randint(1, 5))
+    return sorted(updates.values(), key=lambda u: u["price"], reverse=not is_ascending)
+
+
+class TestOrderBookUtils(unittest.TestCase):
+    maxDiff = None
+
+    def test_l2_order_book_side_apply_updates(self) -> None:
+        side = L2OrderBookSide(False, [level(300, 1), level(200, 1), level(100, 1)])
+        side.apply_updates(
+            [level(400, 4), level(300, 3, 2), level(200, 0, 0), level(150, 0, 0), level(50, 5)]
+        )
+        self.assertEqual(side, [level(400, 4), level(300, 3, 2), level(100, 1), level(50, 5)])
+
+    def test_update_l2_levels_matches_update_l2_side(self) -> None:
+        rng = random.Random(1130790)
+        for _ in range(200):
+            asks = random_side(rng, True, rng.randint(0, 60))
+            bids = random_side(rng, False, rng.randint(0, 60))
+            book: L2OrderBook = {
+                "sequence": 1,
+                "asks": list(asks),
+                "bids": list(bids),
+                "pool": None,
+            }
+            for sequence in range(2, 7):
+                ask_updates = random_updates(rng, True, asks, rng.randint(0, 20))
+                bid_updates = random_updates(rng, False, bids, rng.randint(0, 20))
+                update_l2_levels(
+                    book,
+                    {
+                        "sequence": sequence,
+                        "asks": list(ask_updates),
+                        "bids": list(bid_updates),
+                        "pool": None,
+                    },
+                )
+                asks = update_l2_side(True, asks, list(ask_updates))
+                bids = update_l2_side(False, bids, list(bid_updates))
+                self.assertEqual(book["sequence"], sequence)
+                self.assertEqual(book["asks"], asks)
+                self.assertEqual(book["bids"], bids)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import json
+import unittest
+from typing import Any, List
+
+from aiohttp import web
+
+from idex_sdk.client.rate_limit import RateLimiter
+from idex_sdk.client.rest.async_authenticated import AsyncRestAuthenticatedClient
+from idex_sdk.client.rest.async_public import AsyncRestPublicClient
+from idex_sdk.client.utils import create_hmac_rest_request_signature_header
+from idex_sdk.constants import REST_API_KEY_HEADER, REST_HMAC_SIGNATURE_HEADER
+from idex_sdk.idex_types.errors import BadRequestError
+
+API_KEY = "api_key"
+API_SECRET = "864bbe8797574d9f"
+
+
+class TestAsyncRestClients(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.requests: List[Any] = []
+
+        async def handle(request: web.Request) -> web.Response:
+            body = await request.text()
+            self.requests.append(
+                {
+                    "method": request.method,
+                    "path": request.path,
+                    "query": request.query_string,
+                    "body": body,
+                    "headers": dict(request.headers),
+                }
+            )
+            if request.path == "/v1/assets" and len(self.requests) == 1:
+                return web.json_response(
+                    {"code": "EXCEEDED_RATE_LIMIT", "message": "rate limit exceeded"},
+                    status=429,
+                    headers={"Retry-After": "0"},
+                )
+            if request.path == "/v1/assets":
+                return web.json_response([])
+            if request.path == "/v1/time":
+                return web.json_response({"serverTime": 1663357542131})
+            if request.path == "/v1/orderbook":
+                return web.json_response({"sequence": 1, "bids": [], "asks": [], "pool": None})
+            if request.path == "/v1/wsToken":
+                return web.json_response({"token": "ws-token"})
+            if request.path == "/v1/orders" and request.method == "POST":
+                return web.json_response(json.loads(body)["parameters"])
+            return web.json_response(
+                {"code": "INVALID_PARAMETER", "message": "invalid market"}, status=400
+            )
+
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # type: ignore
+        self.base_url = f"http://127.0.0.1:{port}/v1"
+
+    async def asyncTearDown(self) -> None:
+        await self.runner.cleanup()
+
+    async def test_public_client(self) -> None:
+        async with AsyncRestPublicClient(base_url=self.base_url) as client:
+            self.assertEqual(await client.get_server_time(), 1663357542131)
+            order_book = await client.get_order_book_level2("IDEX-USDC", limit=10)
+            self.assertEqual(order_book["sequence"], 1)
+            with self.assertRaises(BadRequestError):
+                await client.get_tickers()
+
+        self.assertEqual(
+            self.requests[1]["query"], "level=2&limit=10&limitOrderOnly=False&market=IDEX-USDC"
+        )
+        # market=None is omitted
+        self.assertEqual(self.requests[2]["query"], "")
+        self.assertNotIn(REST_API_KEY_HEADER, self.requests[0]["headers"])
+
+    async def test_retries_rate_limited_requests(self) -> None:
+        rate_limiter = RateLimiter(retry_backoff_seconds=0.001)
+        async with AsyncRestPublicClient(
+            base_url=self.base_url, rate_limiter=rate_limiter
+        ) as client:
+            self.assertEqual(await client.get_assets(), [])
+
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(rate_limiter.get_metrics()["retried"], 1)
+
+    async def test_authenticated_client_signs_requests(self) -> None:
+        async with AsyncRestPublicClient(base_url=self.base_url) as public_client:
+            client = AsyncRestAuthenticatedClient(
+                api_key=API_KEY,
+                api_secret=API_SECRET,
+                base_url=self.base_url,
+                session=public_client.get_session(),
+            )
+            self.assertEqual(await client.get_ws_token("nonce", "0xa"), "ws-token")
+            order = await client.create_order(
+                {
+                    "nonce": "e10cdc00-e1fb-11ec-9ae3-e11f6164b292",
+                    "wallet": "0x13ccbb6a85aec077da32c7078e83a70bbb70a6dd",
+                    "market": "IDEX-USDC",
+                    "type": "limit",
+                    "side": "buy",
+                    "price": "0.10000000",
+                    "quantity": "100.00000000",
+                },
+                signer=lambda _: "0xsignature",
+            )
+            self.assertEqual(order["market"], "IDEX-USDC")
+            await client.close()
+            # The shared session belongs to the public client
+            self.assertFalse(public_client.get_session().closed)
+
+        for req in self.requests:
+            payload = req["query"] if req["method"] == "GET" else req["body"]
+            self.assertEqual(req["headers"][REST_API_KEY_HEADER], API_KEY)
+            self.assertEqual(
+                req["headers"][REST_HMAC_SIGNATURE_HEADER],
+                create_hmac_rest_request_signature_header(API_SECRET, payload)[
+                    REST_HMAC_SIGNATURE_HEADER
+                ],
+            )
+        self.assertEqual(self.requests[0]["query"], "nonce=nonce&wallet=0xa")
+        self.assertEqual(json.loads(self.requests[1]["body"])["signature"], "0xsignature")
+
+
+if __name__ == "__main__":
+    unittest.main()
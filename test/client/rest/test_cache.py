@@ -0,0 +1,97 @@
+import time
+import unittest
+from typing import Any, Dict, List, Optional
+from unittest import mock
+
+import requests
+
+from idex_sdk.client.rest.public import RestPublicClient
+from idex_sdk.idex_types.errors import InternalServerError
+
+
+def make_response(
+    status_code: int, content: bytes = b"", headers: Optional[Dict[str, str]] = None
+) -> requests.Response:
+    res = requests.Response()
+    res.status_code = status_code
+    res._content = content
+    res.headers.update(headers or {})
+    return res
+
+
+class TestRestResponseCache(unittest.TestCase):
+    def make_client(self, responses: List[requests.Response]) -> Any:
+        client = RestPublicClient(cache_ttls={"/markets": 60, "/assets": 0})
+        client.session.get = mock.Mock(side_effect=responses)  # type: ignore
+        return client
+
+    def test_serves_fresh_responses_from_cache(self) -> None:
+        client = self.make_client([make_response(200, b'[{"market":"IDEX-USDC"}]')])
+        markets = client.get_markets()
+        markets.append({"market": "ETH-USDC"})
+        self.assertEqual(client.get_markets(), [{"market": "IDEX-USDC"}])
+        self.assertEqual(client.session.get.call_count, 1)
+        self.assertEqual(client.get_cache_stats(), {"hits": 1, "misses": 1, "revalidated": 0})
+
+    def test_caches_by_params(self) -> None:
+        client = self.make_client([make_response(200, b"[1]"), make_response(200, b"[2]")])
+        self.assertEqual(client.get_markets({"market": "IDEX-USDC"}), [1])
+        self.assertEqual(client.get_markets({"market": "ETH-USDC"}), [2])
+        self.assertEqual(client.get_markets({"market": "IDEX-USDC"}), [1])
+        self.assertEqual(client.session.get.call_count, 2)
+
+    def test_revalidates_expired_responses(self) -> None:
+        client = self.make_client(
+            [
+                make_response(
+                    200,
+                    b'[{"symbol":"IDEX"}]',
+                    {"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT"},
+                ),
+                make_response(304),
+                make_response(200, b'[{"symbol":"USDC"}]', {"ETag": '"v2"'}),
+            ]
+        )
+        self.assertEqual(client.get_assets(), [{"symbol": "IDEX"}])
+        self.assertEqual(client.get_assets(), [{"symbol": "IDEX"}])
+        self.assertEqual(client.get_assets(), [{"symbol": "USDC"}])
+
+        first, second, third = client.session.get.call_args_list
+        self.assertIsNone(first.kwargs["headers"])
+        self.assertEqual(
+            second.kwargs["headers"],
+            {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 21 Oct 2026 07:28:00 GMT"},
+        )
+        self.assertEqual(third.kwargs["headers"]["If-None-Match"], '"v1"')
+        self.assertEqual(client.get_cache_stats()["revalidated"], 1)
+
+    def test_invalidate_cache(self) -> None:
+        client = self.make_client([make_response(200, b"[1]"), make_response(200, b"[2]")])
+        self.assertEqual(client.get_markets(), [1])
+        client.invalidate_cache("/markets")
+        self.assertEqual(client.get_markets(), [2])
+
+    def test_does_not_cache_errors_or_other_endpoints(self) -> None:
+        client = self.make_client(
+            [
+                make_response(500, b'{"code":"INTERNAL_SERVER_ERROR","message":"error"}'),
+                make_response(200, b"{}"),
+                make_response(200, b"{}"),
+            ]
+        )
+        with self.assertRaises(InternalServerError):
+            client.get_markets()
+        client.ping()
+        client.ping()
+        self.assertEqual(client.session.get.call_count, 3)
+
+    def test_expires_responses(self) -> None:
+        client = self.make_client([make_response(200, b"[1]"), make_response(200, b"[2]")])
+        with mock.patch("time.monotonic", return_value=time.monotonic()) as monotonic:
+            self.assertEqual(client.get_markets(), [1])
+            monotonic.return_value += 61
+            self.assertEqual(client.get_markets(), [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
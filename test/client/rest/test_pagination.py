@@ -0,0 +1,95 @@
+import unittest
+from typing import Any, Dict, List
+
+from idex_sdk.client.rest.pagination import async_iterate_pages, iterate_pages
+
+FILLS = [{"fillId": f"fill-{i:02d}", "time": 1000 + i // 2} for i in range(10)]
+CANDLES = [{"start": 60000 * i} for i in range(7)]
+
+
+class FakeEndpoint:
+    """
+    Returns pages the way the API does: records created at the same time or after fromId
+    (including fromId itself), or starting at start
+    """
+
+    def __init__(self, records: List[Any]) -> None:
+        self.records = records
+        self.requests: List[Dict[str, Any]] = []
+
+    def __call__(self, request: Dict[str, Any]) -> List[Any]:
+        self.requests.append(request)
+        if "fromId" in request:
+            ids = [record["fillId"] for record in self.records]
+            matching = self.records[ids.index(request["fromId"]) :]
+        else:
+            matching = [
+                record
+                for record in self.records
+                if record.get("start", 0) >= request.get("start", 0)
+            ]
+        return matching[: request["limit"]]
+
+    async def fetch_async(self, request: Dict[str, Any]) -> List[Any]:
+        return self(request)
+
+
+class TestPagination(unittest.IsolatedAsyncioTestCase):
+    def test_iterates_from_id_pages(self) -> None:
+        endpoint = FakeEndpoint(FILLS)
+        records = list(
+            iterate_pages(endpoint, {"nonce": "nonce", "wallet": "0xa", "limit": 4}, "fillId")
+        )
+
+        self.assertEqual(records, FILLS)
+        self.assertEqual(
+            [request.get("fromId") for request in endpoint.requests],
+            [None, "fill-03", "fill-06", "fill-09"],
+        )
+        self.assertEqual(len({request["nonce"] for request in endpoint.requests}), 4)
+        self.assertEqual({request["wallet"] for request in endpoint.requests}, {"0xa"})
+
+    def test_iterates_start_pages(self) -> None:
+        endpoint = FakeEndpoint(CANDLES)
+        records = list(iterate_pages(endpoint, {"market": "IDEX-USDC", "limit": 3}, None))
+
+        self.assertEqual(records, CANDLES)
+        self.assertEqual(
+            [request.get("start") for request in endpoint.requests], [None, 120001, 300001]
+        )
+
+    def test_limit_of_one(self) -> None:
+        with self.assertRaises(Exception):
+            iterate_pages(FakeEndpoint(FILLS), {"limit": 1}, "fillId")
+        with self.assertRaises(Exception):
+            async_iterate_pages(FakeEndpoint(FILLS).fetch_async, {"limit": 1}, "fillId")
+
+        self.assertEqual(list(iterate_pages(FakeEndpoint(FILLS), {"limit": 2}, "fillId")), FILLS)
+        self.assertEqual(list(iterate_pages(FakeEndpoint(CANDLES), {"limit": 1}, None)), CANDLES)
+
+    def test_default_page_size_and_single_page(self) -> None:
+        endpoint = FakeEndpoint(FILLS)
+        self.assertEqual(list(iterate_pages(endpoint, None, "fillId")), FILLS)
+        self.assertEqual(endpoint.requests, [{"limit": 1000}])
+
+    def test_stops_fetching_when_consumer_stops(self) -> None:
+        endpoint = FakeEndpoint(FILLS)
+        iterator = iterate_pages(endpoint, {"limit": 2}, "fillId")
+        self.assertEqual(next(iterator), FILLS[0])
+        iterator.close()
+        # The first page and the prefetched second page only
+        self.assertLessEqual(len(endpoint.requests), 2)
+
+    async def test_async_iterates_from_id_pages(self) -> None:
+        endpoint = FakeEndpoint(FILLS)
+        records = [
+            record
+            async for record in async_iterate_pages(endpoint.fetch_async, {"limit": 3}, "fillId")
+        ]
+
+        self.assertEqual(records, FILLS)
+        self.assertEqual(len(endpoint.requests), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
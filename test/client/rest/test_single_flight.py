@@ -0,0 +1,164 @@
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
+from unittest import mock
+
+import requests
+
+from idex_sdk.client.rest.async_public import AsyncRestPublicClient
+from idex_sdk.client.rest.public import RestPublicClient
+from idex_sdk.client.rest.single_flight import AsyncSingleFlight, SingleFlight
+from idex_sdk.idex_types.errors import InternalServerError
+
+
+def make_response(status_code: int, content: bytes) -> requests.Response:
+    res = requests.Response()
+    res.status_code = status_code
+    res._content = content
+    return res
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sent = threading.Event()
+        self.release = threading.Event()
+        self.response = make_response(200, b'[{"market":"IDEX-USDC"}]')
+
+    def send_concurrently(self, clients: List[Any], num_requests: int, market: str) -> List[Any]:
+        """
+        Makes num_requests requests spread across clients while the first one is in flight
+        """
+        with ThreadPoolExecutor(max_workers=num_requests) as executor:
+            first = executor.submit(clients[0].get_markets, {"market": market})
+            self.sent.wait(1)
+            others = [
+                executor.submit(clients[i % len(clients)].get_markets, {"market": market})
+                for i in range(1, num_requests)
+            ]
+            while clients[0].single_flight.coalesced < num_requests - 1:
+                threading.Event().wait(0.001)
+            self.release.set()
+            return [future.result(1) for future in [first] + others]
+
+    def get(self, *args: Any, **kwargs: Any) -> requests.Response:
+        self.sent.set()
+        self.release.wait(1)
+        return self.response
+
+    def make_client(self, single_flight: Any = None) -> Any:
+        client = RestPublicClient(single_flight=single_flight)
+        client.session.get = mock.Mock(side_effect=self.get)  # type: ignore
+        return client
+
+    def test_coalesces_identical_requests(self) -> None:
+        client = self.make_client()
+        results = self.send_concurrently([client], 4, "IDEX-USDC")
+        self.assertEqual(results, [[{"market": "IDEX-USDC"}]] * 4)
+        self.assertEqual(client.session.get.call_count, 1)
+        # each caller decodes its own result
+        self.assertEqual(len({id(result) for result in results}), 4)
+
+        client.get_markets({"market": "IDEX-USDC"})
+        self.assertEqual(client.session.get.call_count, 2)
+
+    def test_coalesces_across_clients(self) -> None:
+        single_flight = SingleFlight()
+        clients = [self.make_client(single_flight), self.make_client(single_flight)]
+        self.send_concurrently(clients, 3, "IDEX-USDC")
+        self.assertEqual(clients[0].session.get.call_count, 1)
+        self.assertEqual(clients[1].session.get.call_count, 0)
+
+    def test_raises_errors_in_every_caller(self) -> None:
+        self.response = make_response(500, b'{"code":"INTERNAL_SERVER_ERROR","message":"error"}')
+        client = self.make_client()
+        with self.assertRaises(InternalServerError):
+            self.send_concurrently([client], 2, "IDEX-USDC")
+        self.assertEqual(client.single_flight.calls, {})
+
+    def test_sends_different_requests(self) -> None:
+        self.release.set()
+        client = self.make_client()
+        client.get_markets({"market": "IDEX-USDC"})
+        client.get_markets({"market": "ETH-USDC"})
+        self.assertEqual(client.session.get.call_count, 2)
+
+        client = RestPublicClient(should_coalesce_requests=False)
+        self.assertIsNone(client.single_flight)
+
+
+class TestAsyncSingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.release = asyncio.Event()
+        self.content = b'[{"market":"IDEX-USDC"}]'
+
+    def make_client(self, single_flight: Any = None) -> Any:
+        client = AsyncRestPublicClient(single_flight=single_flight)
+
+        async def send_content(*args: Any) -> bytes:
+            await self.release.wait()
+            if isinstance(self.content, Exception):
+                raise self.content
+            return self.content
+
+        client._send_content = mock.AsyncMock(side_effect=send_content)  # type: ignore
+        return client
+
+    async def send_concurrently(self, clients: List[Any], num_requests: int) -> List[Any]:
+        tasks = [
+            asyncio.ensure_future(
+                clients[i % len(clients)].get_markets({"market": "IDEX-USDC"}),
+            )
+            for i in range(num_requests)
+        ]
+        await asyncio.sleep(0)
+        self.release.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def test_coalesces_identical_requests(self) -> None:
+        client = self.make_client()
+        results = await self.send_concurrently([client], 4)
+        self.assertEqual(results, [[{"market": "IDEX-USDC"}]] * 4)
+        self.assertEqual(client._send_content.await_count, 1)
+        self.assertEqual(client.single_flight.coalesced, 3)
+        # each caller decodes its own result
+        self.assertEqual(len({id(result) for result in results}), 4)
+
+        await client.get_markets({"market": "IDEX-USDC"})
+        self.assertEqual(client._send_content.await_count, 2)
+        await client.get_markets({"market": "ETH-USDC"})
+        self.assertEqual(client._send_content.await_count, 3)
+
+    async def test_coalesces_across_clients(self) -> None:
+        single_flight = AsyncSingleFlight()
+        clients = [self.make_client(single_flight), self.make_client(single_flight)]
+        await self.send_concurrently(clients, 3)
+        self.assertEqual(clients[0]._send_content.await_count, 1)
+        self.assertEqual(clients[1]._send_content.await_count, 0)
+
+    async def test_raises_errors_in_every_caller(self) -> None:
+        self.content = InternalServerError("error")  # type: ignore
+        client = self.make_client()
+        results = await self.send_concurrently([client], 2)
+        self.assertTrue(all(isinstance(result, InternalServerError) for result in results))
+        self.assertEqual(client.single_flight.calls, {})
+
+    async def test_cancelling_a_caller_does_not_cancel_the_request(self) -> None:
+        client = self.make_client()
+        first = asyncio.ensure_future(client.get_markets({"market": "IDEX-USDC"}))
+        second = asyncio.ensure_future(client.get_markets({"market": "IDEX-USDC"}))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        self.release.set()
+        self.assertEqual(await second, [{"market": "IDEX-USDC"}])
+        self.assertTrue(first.cancelled())
+
+    def test_can_be_disabled(self) -> None:
+        client = AsyncRestPublicClient(should_coalesce_requests=False)
+        self.assertIsNone(client.single_flight)
+
+
+if __name__ == "__main__":
+    unittest.main()
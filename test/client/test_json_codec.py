@@ -0,0 +1,41 @@
+import unittest
+
+from idex_sdk.client.json_codec import (
+    STDLIB_JSON_CODEC,
+    available_json_codecs,
+    get_default_json_codec,
+    get_json_codec,
+)
+
+DOCUMENT = {
+    "method": "subscribe",
+    "subscriptions": [{"name": "l2orderbook", "markets": ["IDEX-USDC", "ÉTH-USDC"]}],
+    "sequence": 1130790,
+    "pool": None,
+}
+
+
+class TestJsonCodec(unittest.TestCase):
+    def test_codecs_round_trip(self) -> None:
+        for codec in available_json_codecs():
+            encoded = codec.dumps(DOCUMENT)
+            self.assertIsInstance(encoded, str, codec.name)
+            self.assertEqual(codec.loads(encoded), DOCUMENT, codec.name)
+            self.assertEqual(codec.loads(encoded.encode("utf-8")), DOCUMENT, codec.name)
+            self.assertEqual(STDLIB_JSON_CODEC.loads(encoded), DOCUMENT, codec.name)
+
+    def test_get_json_codec(self) -> None:
+        self.assertIs(get_json_codec("json"), STDLIB_JSON_CODEC)
+        self.assertIs(get_default_json_codec(), STDLIB_JSON_CODEC)
+        with self.assertRaises(Exception):
+            get_json_codec("yaml")
+
+    def test_default_codec_decodes_wide_integers_exactly(self) -> None:
+        document = '{"u":18446744073709551616,"q":-123456789012345678901234567890}'
+        decoded = get_default_json_codec().loads(document)
+        self.assertEqual(decoded, {"u": 2**64, "q": -123456789012345678901234567890})
+        self.assertEqual(get_default_json_codec().dumps(decoded), document)
+
+
+if __name__ == "__main__":
+    unittest.main()
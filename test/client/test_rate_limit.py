@@ -0,0 +1,87 @@
+import time
+import unittest
+from typing import List
+
+import requests
+
+from idex_sdk.client.rate_limit import RateLimiter, send_with_rate_limit
+
+
+def make_response(status_code: int, retry_after: str = "") -> requests.Response:
+    res = requests.Response()
+    res.status_code = status_code
+    if retry_after:
+        res.headers["Retry-After"] = retry_after
+    return res
+
+
+class TestRateLimiter(unittest.IsolatedAsyncioTestCase):
+    def test_token_bucket(self) -> None:
+        rate_limiter = RateLimiter(
+            requests_per_second=100, burst=2, endpoint_weights={"/orderbook": 2}
+        )
+        self.assertEqual(rate_limiter.reserve("/ping"), 0)
+        self.assertEqual(rate_limiter.reserve("/ping"), 0)
+        self.assertAlmostEqual(rate_limiter.reserve("/ping"), 0.01, delta=0.002)
+        self.assertAlmostEqual(rate_limiter.reserve("/orderbook"), 0.03, delta=0.002)
+
+        metrics = rate_limiter.get_metrics()
+        self.assertEqual(metrics["requests"], 4)
+        self.assertEqual(metrics["throttled"], 2)
+        self.assertEqual(metrics["queued"], 2)
+
+    def test_acquire_waits_for_tokens(self) -> None:
+        rate_limiter = RateLimiter(requests_per_second=50, burst=1)
+        started_at = time.monotonic()
+        for _ in range(3):
+            rate_limiter.acquire("/ping")
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.035)
+        self.assertEqual(rate_limiter.get_metrics()["queued"], 0)
+
+    async def test_acquire_async_waits_for_tokens(self) -> None:
+        rate_limiter = RateLimiter(requests_per_second=50, burst=1)
+        started_at = time.monotonic()
+        for _ in range(3):
+            await rate_limiter.acquire_async("/ping")
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.035)
+
+    def test_retry_delay(self) -> None:
+        rate_limiter = RateLimiter(retry_backoff_seconds=1, retry_backoff_max_seconds=4)
+        for attempt, expected in ((0, 1), (1, 2), (2, 4), (10, 4)):
+            delay = rate_limiter.get_retry_delay(attempt)
+            self.assertGreaterEqual(delay, expected / 2)
+            self.assertLessEqual(delay, expected)
+        self.assertEqual(rate_limiter.get_retry_delay(0, "30"), 30)
+        self.assertLessEqual(rate_limiter.get_retry_delay(0, "Wed, 21 Oct 2015 07:28:00 GMT"), 1)
+
+    def test_retries_rejected_get_requests(self) -> None:
+        rate_limiter = RateLimiter(max_retries=2, retry_backoff_seconds=0.001)
+        responses = [make_response(429), make_response(429), make_response(200)]
+        sent: List[requests.Response] = []
+
+        def send() -> requests.Response:
+            sent.append(responses[len(sent)])
+            return sent[-1]
+
+        self.assertEqual(send_with_rate_limit(rate_limiter, "GET", "/ping", send).status_code, 200)
+        self.assertEqual(len(sent), 3)
+
+        sent.clear()
+        responses = [make_response(429)] * 4
+        self.assertEqual(send_with_rate_limit(rate_limiter, "GET", "/ping", send).status_code, 429)
+        self.assertEqual(len(sent), 3)
+
+        sent.clear()
+        self.assertEqual(
+            send_with_rate_limit(rate_limiter, "POST", "/orders", send).status_code, 429
+        )
+        self.assertEqual(len(sent), 1)
+
+        metrics = rate_limiter.get_metrics()
+        self.assertEqual(metrics["rejected"], 6)
+        self.assertEqual(metrics["retried"], 4)
+        self.assertEqual(metrics["requests"], 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import asyncio
+import threading
+import unittest
+from typing import Any, List
+
+from idex_sdk.client.websocket.auth import WebSocketAuthTokenCache
+from idex_sdk.client.websocket.client import WebSocketClient
+from idex_sdk.client.websocket.sharded import ShardedWebSocketClient
+
+
+class TokenFetcher:
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, wallet: str) -> str:
+        with self.lock:
+            self.calls.append(wallet)
+            return f"{wallet}-{len(self.calls)}"
+
+
+class FakeWebSocket:
+    async def close(self) -> None:
+        pass
+
+
+async def send_nothing(payload: Any) -> None:
+    pass
+
+
+class TestWebSocketAuthTokenCache(unittest.IsolatedAsyncioTestCase):
+    async def test_caches_and_shares_concurrent_fetches(self) -> None:
+        fetch = TokenFetcher()
+        cache = WebSocketAuthTokenCache(fetch)
+
+        tokens = await cache.get_many(["0xa", "0xb", "0xa"])
+        self.assertEqual(tokens[0], tokens[2])
+        self.assertCountEqual(fetch.calls, ["0xa", "0xb"])
+
+        self.assertEqual(await cache.get("0xb"), tokens[1])
+        self.assertEqual(len(fetch.calls), 2)
+
+        cache.invalidate("0xb")
+        self.assertIsNone(cache.get_cached("0xb"))
+        await cache.get("0xb")
+        self.assertEqual(len(fetch.calls), 3)
+        cache.cancel_refresh()
+
+    async def test_refreshes_before_expiry(self) -> None:
+        fetch = TokenFetcher()
+        cache = WebSocketAuthTokenCache(fetch, ttl_seconds=0.2, refresh_margin_seconds=0.15)
+
+        first = await cache.get("0xa")
+        for _ in range(100):
+            if len(fetch.calls) == 2 and cache.get_cached("0xa") != first:
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(fetch.calls, ["0xa", "0xa"])
+        self.assertNotEqual(cache.get_cached("0xa"), first)
+
+        cache.cancel_refresh()
+        await asyncio.sleep(0.1)
+        self.assertEqual(len(fetch.calls), 2)
+
+    async def test_expired_token_is_fetched_again(self) -> None:
+        fetch = TokenFetcher()
+        cache = WebSocketAuthTokenCache(fetch, ttl_seconds=0.05, refresh_margin_seconds=0)
+        await cache.get("0xa")
+        cache.cancel_refresh()
+        await asyncio.sleep(0.06)
+        self.assertIsNone(cache.get_cached("0xa"))
+        await cache.get("0xa")
+        self.assertEqual(len(fetch.calls), 2)
+        cache.cancel_refresh()
+
+    async def test_client_fetches_each_wallet_once(self) -> None:
+        fetch = TokenFetcher()
+        client = WebSocketClient(websocket_auth_token_fetch=fetch)
+        sent: List[Any] = []
+
+        async def send_message(payload: Any) -> None:
+            sent.append(payload)
+
+        client._send_message = send_message  # type: ignore
+        subscriptions: Any = [
+            {"name": "balances", "wallet": "0xa"},
+            {"name": "orders", "wallet": "0xb"},
+            "tickers",
+        ]
+        await client.subscribe(subscriptions)
+        await client.subscribe(subscriptions)
+        assert client.websocket_auth_token_cache
+        client.websocket_auth_token_cache.cancel_refresh()
+
+        self.assertCountEqual(fetch.calls, ["0xa", "0xb"])
+        tokens = [mesg["token"] for mesg in sent if "token" in mesg]
+        self.assertEqual(len(tokens), 4)
+        self.assertEqual(tokens[:2], tokens[2:])
+
+    async def test_refresh_is_cancelled_per_owner(self) -> None:
+        fetch = TokenFetcher()
+        cache = WebSocketAuthTokenCache(fetch)
+        await cache.get("0xa", "client1")
+        await cache.get("0xa", "client2")
+        await cache.get("0xb", "client2")
+
+        cache.cancel_refresh("client1")
+        self.assertCountEqual(cache.refresh_handles, ["0xa", "0xb"])
+        cache.cancel_refresh("client2", ["0xb"])
+        self.assertCountEqual(cache.refresh_handles, ["0xa"])
+        cache.cancel_refresh()
+        self.assertEqual(cache.refresh_handles, {})
+
+        # A refresh already in flight does not schedule another one
+        cache._refresh("0xa")
+        await asyncio.sleep(0.05)
+        self.assertEqual(len(fetch.calls), 3)
+        self.assertEqual(cache.refresh_handles, {})
+
+    async def test_shards_share_token_refresh(self) -> None:
+        fetch = TokenFetcher()
+        client = ShardedWebSocketClient(num_shards=2, websocket_auth_token_fetch=fetch)
+        first, second = client.shards
+        cache = first.websocket_auth_token_cache
+        assert cache
+        self.assertIs(second.websocket_auth_token_cache, cache)
+        for shard in client.shards:
+            shard._send_message = send_nothing  # type: ignore
+            shard.ws = FakeWebSocket()  # type: ignore
+
+        await first.subscribe(
+            [{"name": "balances", "wallet": "0xa"}, {"name": "orders", "wallet": "0xb"}]
+        )
+        await second.subscribe([{"name": "balances", "wallet": "0xa"}])
+        self.assertCountEqual(fetch.calls, ["0xa", "0xb"])
+        self.assertCountEqual(cache.refresh_handles, ["0xa", "0xb"])
+
+        # Disconnecting one shard keeps refreshing the tokens the other shard uses
+        await second.disconnect()
+        self.assertCountEqual(cache.refresh_handles, ["0xa", "0xb"])
+
+        await first.unsubscribe(["orders"])
+        self.assertCountEqual(cache.refresh_handles, ["0xa"])
+        await first.unsubscribe(["balances"])
+        self.assertEqual(cache.refresh_handles, {})
+        self.assertEqual(cache.refresh_owners, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import asyncio
+import json
+import unittest
+from typing import Any, List
+
+from idex_sdk.client.websocket.client import WebSocketClient
+
+
+def ticker_frame(market: str, sequence: int) -> str:
+    return json.dumps({"type": "tickers", "data": {"m": market, "u": sequence}})
+
+
+def trade_frame(sequence: int) -> str:
+    return json.dumps({"type": "trades", "data": {"m": "IDEX-USDC", "u": sequence}})
+
+
+class TestWebSocketDispatchQueues(unittest.IsolatedAsyncioTestCase):
+    async def test_block_preserves_every_message_in_order(self) -> None:
+        client = WebSocketClient(dispatch_queue_size=2, response_mode="short")
+        sequences: List[int] = []
+
+        async def on_response(response: Any) -> None:
+            await asyncio.sleep(0)
+            sequences.append(response["data"]["u"])
+
+        client.on_response(on_response)
+        for sequence in range(10):
+            await client._handle_message(trade_frame(sequence))
+        await client._join_dispatch_queues()
+
+        self.assertEqual(sequences, list(range(10)))
+        metrics = client.get_dispatch_queue_metrics()["trades"]
+        self.assertEqual(metrics["policy"], "block")
+        self.assertEqual(metrics["dispatched"], 10)
+        self.assertEqual(metrics["dropped"], 0)
+        self.assertLessEqual(metrics["max_depth"], 2)
+        self.assertEqual(metrics["depth"], 0)
+
+    async def test_drop_oldest(self) -> None:
+        client = WebSocketClient(
+            dispatch_queue_size=2,
+            dispatch_policies={"trades": "drop_oldest"},
+            response_mode="short",
+        )
+        sequences: List[int] = []
+        release = asyncio.Event()
+
+        async def on_response(response: Any) -> None:
+            await release.wait()
+            sequences.append(response["data"]["u"])
+
+        client.on_response(on_response)
+        await client._handle_message(trade_frame(0))
+        await asyncio.sleep(0)
+        for sequence in range(1, 6):
+            await client._handle_message(trade_frame(sequence))
+        release.set()
+        await client._join_dispatch_queues()
+
+        # The first message is being dispatched, only the last 2 remain queued
+        self.assertEqual(sequences, [0, 4, 5])
+        self.assertEqual(client.get_dispatch_queue_metrics()["trades"]["dropped"], 3)
+
+    async def test_conflate_latest_per_market(self) -> None:
+        client = WebSocketClient(dispatch_queue_size=10, response_mode="short")
+        received: List[Any] = []
+        release = asyncio.Event()
+
+        async def on_response(response: Any) -> None:
+            await release.wait()
+            received.append((response["data"]["m"], response["data"]["u"]))
+
+        client.on_response(on_response)
+        await client._handle_message(ticker_frame("IDEX-USDC", 0))
+        await asyncio.sleep(0)
+        for sequence in range(1, 4):
+            await client._handle_message(ticker_frame("IDEX-USDC", sequence))
+            await client._handle_message(ticker_frame("ETH-USDC", sequence))
+        release.set()
+        await client._join_dispatch_queues()
+
+        self.assertEqual(received, [("IDEX-USDC", 0), ("IDEX-USDC", 3), ("ETH-USDC", 3)])
+        metrics = client.get_dispatch_queue_metrics()["tickers"]
+        self.assertEqual(metrics["policy"], "conflate")
+        self.assertEqual(metrics["conflated"], 4)
+        self.assertEqual(metrics["dropped"], 0)
+
+    async def test_listener_errors_do_not_stop_dispatch(self) -> None:
+        client = WebSocketClient(dispatch_queue_size=5, response_mode="short")
+        errors: List[Exception] = []
+        sequences: List[int] = []
+
+        async def on_response(response: Any) -> None:
+            if response["data"]["u"] == 1:
+                raise Exception("listener failed")
+            sequences.append(response["data"]["u"])
+
+        async def on_error(error: Exception) -> None:
+            errors.append(error)
+
+        client.on_response(on_response).on_error(on_error)
+        for sequence in range(3):
+            await client._handle_message(trade_frame(sequence))
+        await client._join_dispatch_queues()
+
+        self.assertEqual(sequences, [0, 2])
+        self.assertEqual(len(errors), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
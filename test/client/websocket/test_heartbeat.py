@@ -0,0 +1,100 @@
+import asyncio
+import unittest
+from typing import Any, List, Optional
+from unittest import mock
+
+from idex_sdk.client.websocket.client import WebSocketClient, get_percentile
+
+
+class FakeClock:
+    """
+    Replaces the time module of the client, only advancing when told to
+    """
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, ms: float) -> None:
+        self.now += ms / 1000
+
+
+class FakeWebSocket:
+    open = True
+    close_code: Optional[int] = None
+
+    def __init__(self, round_trip_times: Optional[List[float]] = None, clock: Any = None) -> None:
+        """
+        Answers each ping after the next of round_trip_times (in milliseconds) on clock, and
+        closes once they are all used. Pings are never answered without round_trip_times.
+        """
+        self.round_trip_times = round_trip_times
+        self.clock = clock
+        self.pings = 0
+
+    async def ping(self) -> "asyncio.Future[Any]":
+        self.pings += 1
+        pong_waiter = asyncio.get_running_loop().create_future()
+        if self.round_trip_times is not None:
+            self.clock.advance(self.round_trip_times[self.pings - 1])
+            pong_waiter.set_result(None)
+            self.open = self.pings < len(self.round_trip_times)
+        return pong_waiter
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        self.open = False
+        self.close_code = code
+
+
+class TestWebSocketHeartbeat(unittest.IsolatedAsyncioTestCase):
+    def test_percentile(self) -> None:
+        values = [float(value) for value in range(1, 101)]
+        self.assertIsNone(get_percentile([], 0.5))
+        self.assertEqual(get_percentile(values, 0.5), 51)
+        self.assertEqual(get_percentile(values, 0.99), 100)
+        self.assertEqual(get_percentile([5.0], 0.9), 5)
+
+    async def test_records_round_trip_times(self) -> None:
+        client = WebSocketClient(ping_interval=5)
+        self.assertEqual(client.get_latency_metrics()["samples"], 0)
+        self.assertIsNone(client.get_latency_metrics()["ms_since_last_message"])
+
+        clock = FakeClock()
+        ws: Any = FakeWebSocket([4, 2, 8, 3, 5], clock)
+        with mock.patch("idex_sdk.client.websocket.client.time", clock):
+            await client._handle_message('{"type":"tokenprice","data":{"t":"IDEX","p":"0.1"}}')
+            client.ws = ws
+            client._start_heartbeat()
+            heartbeat_task = client.state["heartbeat_task"]
+            assert heartbeat_task
+            await asyncio.wait_for(heartbeat_task, 1)
+            clock.advance(78)
+
+            metrics = client.get_latency_metrics()
+
+        self.assertEqual(ws.pings, 5)
+        self.assertEqual(metrics["samples"], 5)
+        self.assertAlmostEqual(metrics["last_rtt"], 5)
+        self.assertAlmostEqual(metrics["rtt_p50"], 4)
+        self.assertAlmostEqual(metrics["rtt_p90"], 8)
+        self.assertAlmostEqual(metrics["rtt_max"], 8)
+        self.assertAlmostEqual(metrics["ms_since_last_message"], 100)
+
+    async def test_closes_dead_connection(self) -> None:
+        client = WebSocketClient(ping_interval=5, pong_timeout=20)
+        ws: Any = FakeWebSocket()
+        client.ws = ws
+        client._start_heartbeat()
+        heartbeat_task = client.state["heartbeat_task"]
+        assert heartbeat_task
+        await asyncio.wait_for(heartbeat_task, 1)
+
+        self.assertEqual(ws.pings, 1)
+        self.assertFalse(ws.open)
+        self.assertEqual(ws.close_code, 1011)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+from typing import Any, List
+from unittest import mock
+
+from websockets.exceptions import ConnectionClosed
+
+from idex_sdk.client.websocket.client import (
+    RECONNECT_BACKOFF_BASE_SECONDS,
+    RECONNECT_BACKOFF_MAX_SECONDS,
+    WebSocketClient,
+    get_reconnect_backoff_seconds,
+)
+
+
+class FakeWebSocket:
+    open = True
+
+    def __init__(self) -> None:
+        self.sent: List[str] = []
+
+    async def send(self, message: str) -> None:
+        self.sent.append(message)
+
+    async def recv(self) -> str:
+        self.open = False
+        raise ConnectionClosed(1000, "")
+
+    async def close(self) -> None:
+        self.open = False
+
+
+class TestWebSocketReconnect(unittest.IsolatedAsyncioTestCase):
+    def test_backoff_is_capped_and_jittered(self) -> None:
+        for attempt in range(100):
+            expected = min(
+                RECONNECT_BACKOFF_MAX_SECONDS, RECONNECT_BACKOFF_BASE_SECONDS * 2**attempt
+            )
+            backoff_seconds = get_reconnect_backoff_seconds(attempt)
+            self.assertGreaterEqual(backoff_seconds, expected / 2)
+            self.assertLessEqual(backoff_seconds, expected)
+        self.assertGreater(len({get_reconnect_backoff_seconds(10) for _ in range(10)}), 1)
+
+    async def test_tracks_active_subscriptions(self) -> None:
+        client = WebSocketClient(websocket_auth_token_fetch=lambda wallet: f"token-{wallet}")
+        sent: List[Any] = []
+
+        async def send_message(payload: Any) -> None:
+            sent.append(payload)
+
+        client._send_message = send_message  # type: ignore
+        subscriptions: Any = [
+            {"name": "l2orderbook", "markets": ["ETH-USDC"]},
+            {"name": "candles", "interval": "1m"},
+            {"name": "balances", "wallet": "0xa"},
+            "trades",
+        ]
+        await client.subscribe(subscriptions, ["IDEX-USDC"])
+        await client.unsubscribe(["trades"])
+        await client.unsubscribe([{"name": "l2orderbook", "markets": ["ETH-USDC"]}])
+        await client.subscribe([{"name": "l2orderbook", "markets": ["IDEX-USDC", "ETH-USDC"]}])
+        assert client.websocket_auth_token_cache
+        client.websocket_auth_token_cache.cancel_refresh()
+
+        self.assertCountEqual(
+            client.get_active_subscriptions(),
+            [
+                {"name": "candles", "markets": ["IDEX-USDC"], "interval": "1m"},
+                {"name": "balances", "markets": ["IDEX-USDC"], "wallet": "0xa"},
+                {"name": "l2orderbook", "markets": ["ETH-USDC", "IDEX-USDC"]},
+            ],
+        )
+
+    async def test_restores_subscriptions_after_reconnect(self) -> None:
+        client = WebSocketClient()
+        client.state["active_subscriptions"] = {
+            ("l2orderbook", None, None): {"ETH-USDC"},
+            ("tickers", None, None): {"ETH-USDC", "IDEX-USDC"},
+        }
+        client.state["have_ever_started"] = True
+        client.state["is_reconnecting"] = True
+        ws = FakeWebSocket()
+
+        with mock.patch(
+            "idex_sdk.client.websocket.client.ws_connect", mock.AsyncMock(return_value=ws)
+        ):
+            await client.connect()
+
+        self.assertEqual(len(ws.sent), 1)
+        mesg = client.json_codec.loads(ws.sent[0])
+        self.assertEqual(mesg["method"], "subscribe")
+        self.assertCountEqual(
+            mesg["subscriptions"],
+            [
+                {"name": "l2orderbook", "markets": ["ETH-USDC"]},
+                {"name": "tickers", "markets": ["ETH-USDC", "IDEX-USDC"]},
+            ],
+        )
+        self.assertFalse(client.state["is_reconnecting"])
+
+
+if __name__ == "__main__":
+    unittest.main()
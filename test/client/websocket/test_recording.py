@@ -0,0 +1,94 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from typing import List
+
+from idex_sdk.client.websocket.client import WebSocketClient
+from idex_sdk.client.websocket.recording import (
+    WebSocketRecorder,
+    WebSocketReplayer,
+    read_recorded_frames,
+)
+from idex_sdk.idex_types.websocket.response import WebSocketResponse
+
+TOKEN_PRICE_FRAME = json.dumps({"type": "tokenprice", "data": {"t": "IDEX", "p": "0.06000000"}})
+L2_FRAME = json.dumps(
+    {
+        "type": "l2orderbook",
+        "data": {
+            "m": "IDEX-USDC",
+            "t": 1663357542131,
+            "u": 2,
+            "b": [["0.05900000", "10.00000000", 1]],
+            "a": [],
+            "p": {"q": "100.00000000", "Q": "6.00000000"},
+        },
+    }
+)
+
+
+class TestWebSocketRecording(unittest.IsolatedAsyncioTestCase):
+    maxDiff = None
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "stream.bin")
+
+    async def test_client_records_received_frames(self) -> None:
+        responses: List[WebSocketResponse] = []
+
+        async def on_response(response: WebSocketResponse) -> None:
+            responses.append(response)
+
+        with WebSocketRecorder(self.path) as recorder:
+            client = WebSocketClient(recorder=recorder)
+            client.on_response(on_response)
+            await client._handle_message(TOKEN_PRICE_FRAME)
+            await client._handle_message(L2_FRAME.encode("utf-8"))
+            self.assertEqual(recorder.frames_recorded, 2)
+
+        frames = list(read_recorded_frames(self.path))
+        self.assertEqual(
+            [frame for _, frame in frames],
+            [TOKEN_PRICE_FRAME.encode("utf-8"), L2_FRAME.encode("utf-8")],
+        )
+        self.assertLessEqual(frames[0][0], frames[1][0])
+
+        replayed: List[WebSocketResponse] = []
+
+        async def handler(response: WebSocketResponse) -> None:
+            replayed.append(response)
+
+        self.assertEqual(await WebSocketReplayer(self.path).replay(handler), 2)
+        self.assertEqual(replayed, responses)
+
+    async def test_replay_ignores_truncated_frame(self) -> None:
+        with WebSocketRecorder(self.path) as recorder:
+            recorder.record(TOKEN_PRICE_FRAME, 1.0)
+            recorder.record(L2_FRAME, 2.0)
+        with open(self.path, "r+b") as file:
+            file.truncate(os.path.getsize(self.path) - 1)
+
+        self.assertEqual(
+            list(read_recorded_frames(self.path)), [(1.0, TOKEN_PRICE_FRAME.encode("utf-8"))]
+        )
+
+    async def test_replay_at_recorded_speed(self) -> None:
+        with WebSocketRecorder(self.path) as recorder:
+            recorder.record(TOKEN_PRICE_FRAME, 100.0)
+            recorder.record(TOKEN_PRICE_FRAME, 100.2)
+
+        received_at: List[float] = []
+
+        async def handler(response: WebSocketResponse) -> None:
+            received_at.append(time.monotonic())
+
+        await WebSocketReplayer(self.path).replay(handler, speed=2.0)
+        self.assertGreaterEqual(received_at[1] - received_at[0], 0.09)
+
+
+if __name__ == "__main__":
+    unittest.main()
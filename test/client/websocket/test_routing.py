@@ -0,0 +1,67 @@
+import json
+import unittest
+from typing import Any, List, Tuple
+
+from idex_sdk.client.websocket.client import WebSocketClient
+from idex_sdk.client.websocket.sharded import ShardedWebSocketClient
+
+
+def frame(message_type: str, market: str) -> str:
+    return json.dumps({"type": message_type, "data": {"m": market}})
+
+
+class TestWebSocketRouting(unittest.IsolatedAsyncioTestCase):
+    async def test_routes_by_type_and_market(self) -> None:
+        client = WebSocketClient(response_mode="short")
+        received: List[Tuple[str, str, str]] = []
+
+        def make_listener(name: str) -> Any:
+            async def listener(response: Any) -> None:
+                received.append((name, response["type"], response["data"]["m"]))
+
+            return listener
+
+        all_messages = make_listener("all")
+        all_l2 = make_listener("l2")
+        eth_l2 = make_listener("eth-l2")
+        client.on_response(all_messages)
+        client.on("l2orderbook", all_l2)
+        client.on("l2orderbook", eth_l2, market="ETH-USDC")
+
+        await client._handle_message(frame("l2orderbook", "ETH-USDC"))
+        await client._handle_message(frame("l2orderbook", "IDEX-USDC"))
+        await client._handle_message(frame("tickers", "ETH-USDC"))
+
+        self.assertCountEqual(
+            received,
+            [
+                ("all", "l2orderbook", "ETH-USDC"),
+                ("l2", "l2orderbook", "ETH-USDC"),
+                ("eth-l2", "l2orderbook", "ETH-USDC"),
+                ("all", "l2orderbook", "IDEX-USDC"),
+                ("l2", "l2orderbook", "IDEX-USDC"),
+                ("all", "tickers", "ETH-USDC"),
+            ],
+        )
+
+        received.clear()
+        client.off("l2orderbook", eth_l2, market="ETH-USDC").off("l2orderbook", all_l2)
+        self.assertEqual(client.state["routed_response_listeners"], {})
+        await client._handle_message(frame("l2orderbook", "ETH-USDC"))
+        self.assertEqual(received, [("all", "l2orderbook", "ETH-USDC")])
+
+    def test_sharded_registers_market_listener_on_its_shard(self) -> None:
+        client = ShardedWebSocketClient(num_shards=3)
+
+        async def listener(response: Any) -> None:
+            pass
+
+        client.on("l2orderbook", listener, market="ETH-USDC")
+        index = client.shard_index_for_market("ETH-USDC")
+        for i, shard in enumerate(client.shards):
+            routes = shard.state["routed_response_listeners"]
+            self.assertEqual(routes == {"l2orderbook": {"ETH-USDC": {listener}}}, i == index)
+
+
+if __name__ == "__main__":
+    unittest.main()
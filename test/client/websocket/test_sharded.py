@@ -0,0 +1,114 @@
+import json
+import unittest
+from unittest.mock import AsyncMock
+
+from idex_sdk.client.websocket.client import WebSocketClient
+from idex_sdk.client.websocket.sharded import ShardedWebSocketClient
+
+MARKETS = ["IDEX-USDC", "ETH-USDC", "MATIC-USDC", "WBTC-USDC", "DIL-ETH", "QUICK-USDC"]
+
+
+class TestShardedWebSocketClient(unittest.IsolatedAsyncioTestCase):
+    maxDiff = None
+
+    def test_state_is_per_instance(self) -> None:
+        async def listener() -> None:
+            pass
+
+        first, second = WebSocketClient(), WebSocketClient()
+        first.on_connect(listener)
+        first.state["reconnect_attempt"] = 3
+        self.assertEqual(second.state["connect_listeners"], set())
+        self.assertEqual(second.state["reconnect_attempt"], 0)
+
+    async def test_subscribe_routes_markets_to_shards(self) -> None:
+        client = ShardedWebSocketClient(num_shards=3)
+        for shard in client.shards:
+            shard.subscribe = AsyncMock()  # type: ignore
+        self.assertEqual(
+            [client.shard_index_for_market(market) for market in MARKETS], [2, 0, 0, 2, 1, 2]
+        )
+        self.assertIs(client.shard_for_market("DIL-ETH"), client.shards[1])
+
+        balances = {"name": "balances", "wallet": "0x1"}
+        await client.subscribe(
+            [{"name": "l2orderbook", "markets": MARKETS}, "tickers", balances],  # type: ignore
+            MARKETS,
+            "cid",
+        )
+
+        client.shards[0].subscribe.assert_awaited_once_with(  # type: ignore
+            [{"name": "l2orderbook", "markets": ["ETH-USDC", "MATIC-USDC"]}, "tickers", balances],
+            ["ETH-USDC", "MATIC-USDC"],
+            "cid",
+        )
+        client.shards[1].subscribe.assert_awaited_once_with(  # type: ignore
+            [{"name": "l2orderbook", "markets": ["DIL-ETH"]}, "tickers"], ["DIL-ETH"], "cid"
+        )
+        client.shards[2].subscribe.assert_awaited_once_with(  # type: ignore
+            [
+                {"name": "l2orderbook", "markets": ["IDEX-USDC", "WBTC-USDC", "QUICK-USDC"]},
+                "tickers",
+            ],
+            ["IDEX-USDC", "WBTC-USDC", "QUICK-USDC"],
+            "cid",
+        )
+
+    async def test_unsubscribe_without_markets_is_sent_to_every_shard(self) -> None:
+        client = ShardedWebSocketClient(num_shards=2)
+        for shard in client.shards:
+            shard.unsubscribe = AsyncMock()  # type: ignore
+
+        await client.unsubscribe(["l2orderbook"])
+
+        for shard in client.shards:
+            shard.unsubscribe.assert_awaited_once_with(["l2orderbook"], [], None)  # type: ignore
+
+    async def test_dispatch_queues_per_shard(self) -> None:
+        client = ShardedWebSocketClient(
+            num_shards=3,
+            dispatch_queue_size=4,
+            dispatch_policies={"trades": "drop_oldest"},
+            response_mode="short",
+        )
+        for shard in client.shards:
+            self.assertEqual(shard.dispatch_queue_size, 4)
+            self.assertEqual(shard.dispatch_policies["trades"], "drop_oldest")
+            self.assertEqual(shard.dispatch_policies["tickers"], "conflate")
+
+        await client.shards[1]._handle_message(
+            json.dumps({"type": "trades", "data": {"m": "DIL-ETH", "u": 1}})
+        )
+        await client.shards[1]._join_dispatch_queues()
+
+        metrics = client.get_dispatch_queue_metrics()
+        self.assertEqual(len(metrics), 3)
+        self.assertEqual(metrics[0], {})
+        self.assertEqual(metrics[1]["trades"]["policy"], "drop_oldest")
+        self.assertEqual(metrics[1]["trades"]["dispatched"], 1)
+        self.assertEqual(metrics[2], {})
+
+    async def test_active_subscriptions_are_merged_across_shards(self) -> None:
+        client = ShardedWebSocketClient(num_shards=3, should_restore_subscriptions=False)
+        for shard in client.shards:
+            self.assertFalse(shard.should_restore_subscriptions)
+            shard._send_message = AsyncMock()  # type: ignore
+
+        await client.subscribe(
+            [{"name": "l2orderbook", "markets": MARKETS}, "tickers"],  # type: ignore
+            ["ETH-USDC", "DIL-ETH"],
+        )
+        await client.subscribe([{"name": "candles", "markets": MARKETS[:2], "interval": "1m"}])
+
+        self.assertEqual(
+            client.get_active_subscriptions(),
+            [
+                {"name": "l2orderbook", "markets": sorted(MARKETS)},
+                {"name": "tickers", "markets": ["DIL-ETH", "ETH-USDC"]},
+                {"name": "candles", "markets": ["ETH-USDC", "IDEX-USDC"], "interval": "1m"},
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
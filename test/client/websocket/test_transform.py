@@ -0,0 +1,246 @@
+import copy
+import unittest
+from typing import Any, Dict, List, Set
+
+from idex_sdk.client.websocket.client import WebSocketClient
+from idex_sdk.client.websocket.transform import (
+    MESG_DATA_LONG_TO_SHORT_KEYS,
+    MESG_DATA_TRANSFORM_FUNCS,
+    ORDER_FILL_LONG_TO_SHORT_KEYS,
+    WebSocketResponseDataView,
+    transform_websocket_short_response_mesg,
+    view_websocket_short_response_mesg,
+)
+
+MESSAGES: List[Any] = [
+    {
+        "type": "tickers",
+        "data": {
+            "m": "IDEX-USDC",
+            "t": 1663357542131,
+            "o": "0.06512000",
+            "h": "0.06921000",
+            "l": "0.06423000",
+            "c": "0.06610000",
+            "Q": "1000.00000000",
+            "v": "1543873.11840712",
+            "q": "103047.81261305",
+            "P": "1.50",
+            "n": 1512,
+            "a": None,
+            "b": "0.06500000",
+            "u": 848778,
+        },
+    },
+    {
+        "type": "trades",
+        "data": {
+            "y": "hybrid",
+            "m": "IDEX-USDC",
+            "i": "a0b6a470-a6bf-11ea-90a3-8de307b3b6da",
+            "p": "0.06610000",
+            "q": "1000.00000000",
+            "Q": "66.10000000",
+            "t": 1663357542131,
+            "s": "sell",
+            "u": 848778,
+        },
+    },
+    {
+        "type": "l2orderbook",
+        "data": {
+            "m": "IDEX-USDC",
+            "t": 1663357542131,
+            "u": 1130791,
+            "b": [["0.06500000", "434.16670784", 1]],
+            "a": [],
+            "p": {"q": "3843521.04591346", "Q": "254011.14627617"},
+        },
+    },
+    {
+        "type": "l1orderbook",
+        "data": {
+            "m": "IDEX-USDC",
+            "t": 1663357542131,
+            "b": "0.06500000",
+            "B": "434.16670784",
+            "a": "0.06913000",
+            "A": "5218.01431648",
+            "p": None,
+        },
+    },
+    {
+        "type": "orders",
+        "data": {
+            "m": "IDEX-USDC",
+            "i": "92782120-a775-11ea-aa55-4da1cc97a06d",
+            "w": "0x0ab3d7f8a3d2c2bb43ad7ea97eaa6a9b5c6ae2bd",
+            "t": 1663357542131,
+            "T": 1663357542131,
+            "x": "fill",
+            "X": "filled",
+            "u": 71228108,
+            "o": "market",
+            "S": "sell",
+            "q": "1000.00000000",
+            "z": "1000.00000000",
+            "Z": "66.10000000",
+            "v": "0.06610000",
+            "P": None,
+            "F": [
+                {
+                    "y": "hybrid",
+                    "i": "974480d0-a775-11ea-aa55-4da1cc97a06d",
+                    "p": "0.06610000",
+                    "q": "1000.00000000",
+                    "Q": "66.10000000",
+                    "t": 1663357542131,
+                    "s": "sell",
+                    "u": 981372,
+                    "f": "0.13220000",
+                    "a": "USDC",
+                    "l": "taker",
+                    "S": "pending",
+                }
+            ],
+        },
+    },
+    {"type": "tokenprice", "data": {"t": "IDEX", "p": "0.06610000"}},
+    {"type": "error", "data": {"code": "INVALID_PARAMETER", "message": "invalid market"}},
+    {
+        "type": "candles",
+        "data": {
+            "m": "IDEX-USDC",
+            "t": 1663357542131,
+            "i": "1m",
+            "s": 1663357500000,
+            "e": 1663357559999,
+            "o": "0.06512000",
+            "h": "0.06921000",
+            "l": "0.06423000",
+            "c": "0.06610000",
+            "v": "1543873.11840712",
+            "n": 15,
+            "u": 848778,
+        },
+    },
+    {
+        "type": "balances",
+        "data": {
+            "w": "0x0ab3d7f8a3d2c2bb43ad7ea97eaa6a9b5c6ae2bd",
+            "a": "USDC",
+            "q": "38192.94678100",
+            "f": "26710.66678121",
+            "l": "11482.28000000",
+            "d": "38188.22",
+        },
+    },
+    # Every optional order and fill field
+    {
+        "type": "orders",
+        "data": {
+            "m": "IDEX-USDC",
+            "i": "92782120-a775-11ea-aa55-4da1cc97a06d",
+            "c": "client-order-1",
+            "w": "0x0ab3d7f8a3d2c2bb43ad7ea97eaa6a9b5c6ae2bd",
+            "t": 1663357542131,
+            "T": 1663357542131,
+            "x": "fill",
+            "X": "partiallyFilled",
+            "u": 71228108,
+            "o": "stopLossLimit",
+            "S": "buy",
+            "q": "1000.00000000",
+            "Q": "66.10000000",
+            "z": "500.00000000",
+            "Z": "33.05000000",
+            "v": "0.06610000",
+            "p": "0.06610000",
+            "P": "0.06600000",
+            "f": "gtc",
+            "V": "dc",
+            "F": [
+                {
+                    "y": "hybrid",
+                    "i": "974480d0-a775-11ea-aa55-4da1cc97a06d",
+                    "p": "0.06610000",
+                    "q": "500.00000000",
+                    "Q": "33.05000000",
+                    "oq": "400.00000000",
+                    "oQ": "26.44000000",
+                    "pq": "100.00000000",
+                    "pQ": "6.61000000",
+                    "t": 1663357542131,
+                    "s": "sell",
+                    "u": 981372,
+                    "f": "0.50000000",
+                    "a": "IDEX",
+                    "g": "0.00100000",
+                    "l": "maker",
+                    "T": "0x01d28c33271cf1dd0eb04249617d3092f24bd9bad77ffb57a0316c3ce5425158",
+                    "S": "mined",
+                }
+            ],
+        },
+    },
+]
+
+
+class TestWebSocketTransform(unittest.IsolatedAsyncioTestCase):
+    maxDiff = None
+
+    def test_view_matches_long_transform(self) -> None:
+        for message in MESSAGES:
+            view = view_websocket_short_response_mesg(copy.deepcopy(message))
+            self.assertEqual(view, transform_websocket_short_response_mesg(copy.deepcopy(message)))
+
+    def test_messages_cover_every_field(self) -> None:
+        """
+        The view tables duplicate the mappings of the long transforms, so the messages compared
+        by test_view_matches_long_transform must include every field of every message type
+        """
+        self.assertEqual(set(MESG_DATA_LONG_TO_SHORT_KEYS), set(MESG_DATA_TRANSFORM_FUNCS))
+        short_keys_by_type: Dict[str, Set[str]] = {}
+        fill_short_keys: Set[str] = set()
+        for message in MESSAGES:
+            short_keys_by_type.setdefault(message["type"], set()).update(message["data"])
+            for fill in message["data"].get("F", []):
+                fill_short_keys.update(fill)
+        for message_type, keys in MESG_DATA_LONG_TO_SHORT_KEYS.items():
+            self.assertEqual(short_keys_by_type.get(message_type), set(keys.values()))
+        self.assertEqual(fill_short_keys, set(ORDER_FILL_LONG_TO_SHORT_KEYS.values()))
+
+    def test_view_reads_short_keys(self) -> None:
+        message = copy.deepcopy(MESSAGES[4])
+        data = view_websocket_short_response_mesg(message)["data"]
+        self.assertIsInstance(data, WebSocketResponseDataView)
+        self.assertEqual(data["orderId"], "92782120-a775-11ea-aa55-4da1cc97a06d")
+        self.assertEqual(data["fills"][0]["txStatus"], "pending")
+        self.assertNotIn("stopPrice", data)
+        self.assertNotIn("clientOrderId", data)
+        with self.assertRaises(KeyError):
+            data["m"]
+
+        pool = view_websocket_short_response_mesg(copy.deepcopy(MESSAGES[2]))["data"]["pool"]
+        self.assertEqual(pool["baseReserveQuantity"], "3843521.04591346")
+
+    async def test_client_response_modes(self) -> None:
+        frame = '{"type":"tokenprice","data":{"t":"IDEX","p":"0.06610000"}}'
+        for mode, expected in (
+            ("long", {"type": "tokenprice", "data": {"token": "IDEX", "price": "0.06610000"}}),
+            ("short", {"type": "tokenprice", "data": {"t": "IDEX", "p": "0.06610000"}}),
+            ("view", {"type": "tokenprice", "data": {"token": "IDEX", "price": "0.06610000"}}),
+        ):
+            responses: List[Any] = []
+
+            async def on_response(response: Any) -> None:
+                responses.append(response)
+
+            client = WebSocketClient(response_mode=mode)  # type: ignore
+            client.on_response(on_response)
+            await client._handle_message(frame)
+            self.assertEqual(responses, [expected], mode)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import json
+import pickle
+import unittest
+
+from idex_sdk.idex_types.order_book import (
+    OrderBookLevel,
+    compact_order_book_levels,
+    make_order_book_level,
+)
+
+
+class TestOrderBookLevel(unittest.TestCase):
+    def test_dict_compatibility(self) -> None:
+        level = OrderBookLevel(6598000, 33264912641, 2)
+        as_dict = {"price": 6598000, "size": 33264912641, "num_orders": 2, "type": "limit"}
+        self.assertEqual(level, as_dict)
+        self.assertEqual(as_dict, level)
+        self.assertEqual(dict(level), as_dict)
+        self.assertEqual(level.to_dict(), as_dict)
+        self.assertEqual(repr(level), repr(as_dict))
+        self.assertEqual(level["price"], level.price)
+        self.assertIn("num_orders", level)
+        self.assertIsNone(level.get("market"))
+        with self.assertRaises(KeyError):
+            level["market"] = "IDEX-USDC"
+        with self.assertRaises(TypeError):
+            del level["size"]
+        self.assertFalse(hasattr(level, "__dict__"))
+
+    def test_mutation_and_copy(self) -> None:
+        level = OrderBookLevel(6598000, 100, 0, "pool")
+        copy = level.copy()
+        level["size"] += 50
+        self.assertEqual(level.size, 150)
+        self.assertEqual(copy["size"], 100)
+        self.assertEqual(copy["type"], "pool")
+        self.assertEqual(pickle.loads(pickle.dumps(level)), level)
+
+    def test_levels_are_dicts_unless_compacted(self) -> None:
+        level = make_order_book_level(6598000, 100, 1)
+        self.assertIsInstance(level, dict)
+        self.assertEqual(
+            json.loads(json.dumps(level)),
+            {"price": 6598000, "size": 100, "num_orders": 1, "type": "limit"},
+        )
+
+        (compact,) = compact_order_book_levels([make_order_book_level(6598000, 100, 0, "pool")])
+        self.assertIsInstance(compact, OrderBookLevel)
+        self.assertEqual(compact, {"price": 6598000, "size": 100, "num_orders": 0, "type": "pool"})
+        with self.assertRaises(TypeError):
+            json.dumps(compact)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import random
+import unittest
+from typing import List
+
+from idex_sdk.client.order_book.utils import update_l2_levels
+from idex_sdk.idex_types.order_book import L2OrderBook, OrderBookLevelL2
+from idex_sdk.order_book.api_conversions import l2_order_book_to_rest_response
+from idex_sdk.order_book.quantities import aggregate_l2_order_book_at_tick_size
+
+try:
+    import numpy as np
+
+    from idex_sdk.order_book.columnar import ColumnarL2OrderBook
+except ImportError:  # numpy is optional
+    np = None
+
+
+def level(price: int, size: int, num_orders: int = 1) -> OrderBookLevelL2:
+    return {"price": price, "size": size, "num_orders": num_orders, "type": "limit"}
+
+
+def random_book(rng: random.Random, sequence: int) -> L2OrderBook:
+    prices = rng.sample(range(1000, 9000), 80)
+    return {
+        "sequence": sequence,
+        "asks": [level(p, rng.randint(1, 10**12)) for p in sorted(prices[:40])],
+        "bids": [level(p - 1000, rng.randint(1, 10**12)) for p in sorted(prices[40:])[::-1]],
+        "pool": {"base_reserve_quantity": 10**14, "quote_reserve_quantity": 5 * 10**12},
+    }
+
+
+def random_updates(rng: random.Random, book: L2OrderBook, sequence: int) -> L2OrderBook:
+    def side_updates(levels: List[OrderBookLevelL2], is_ascending: bool) -> List[OrderBookLevelL2]:
+        updates = {}
+        for existing in rng.sample(levels, min(len(levels), 5)):
+            updates[existing["price"]] = level(existing["price"], 0, 0)
+        for existing in rng.sample(levels, min(len(levels), 5)):
+            updates[existing["price"]] = level(existing["price"], rng.randint(1, 10**12), 2)
+        for price in rng.sample(range(1, 10000), 5):
+            updates.setdefault(price, level(price, rng.randint(1, 10**12), 3))
+        return sorted(updates.values(), key=lambda u: u["price"], reverse=not is_ascending)
+
+    return {
+        "sequence": sequence,
+        "asks": side_updates(book["asks"], True),
+        "bids": side_updates(book["bids"], False),
+        "pool": book["pool"],
+    }
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestColumnarL2OrderBook(unittest.TestCase):
+    maxDiff = None
+
+    def test_round_trip(self) -> None:
+        book = random_book(random.Random(1), 1)
+        self.assertEqual(ColumnarL2OrderBook.from_l2_order_book(book).to_l2_order_book(), book)
+
+    def test_update_l2_levels(self) -> None:
+        rng = random.Random(2)
+        book = random_book(rng, 1)
+        columnar = ColumnarL2OrderBook.from_l2_order_book(book)
+        for sequence in range(2, 20):
+            updates = random_updates(rng, book, sequence)
+            update_l2_levels(columnar, updates)
+            update_l2_levels(book, updates)
+            self.assertEqual(columnar.to_l2_order_book(), book)
+
+    def test_aggregate_l2_order_book_at_tick_size(self) -> None:
+        book = random_book(random.Random(3), 1)
+        columnar = ColumnarL2OrderBook.from_l2_order_book(book)
+        for tick_size in (1, 10, 100, 1000):
+            self.assertEqual(
+                aggregate_l2_order_book_at_tick_size(columnar, tick_size).to_l2_order_book(),
+                aggregate_l2_order_book_at_tick_size(book, tick_size),
+            )
+
+    def test_l2_order_book_to_rest_response(self) -> None:
+        book = random_book(random.Random(4), 1)
+        columnar = ColumnarL2OrderBook.from_l2_order_book(book)
+        for limit in (2, 11, 1000):
+            self.assertEqual(
+                l2_order_book_to_rest_response(columnar, limit),
+                l2_order_book_to_rest_response(book, limit),
+            )
+
+    def test_vectorized_side_operations(self) -> None:
+        columnar = ColumnarL2OrderBook.from_l2_order_book(
+            {
+                "sequence": 1,
+                "asks": [level(100, 5), level(101, 7), level(105, 1)],
+                "bids": [level(99, 2), level(90, 3)],
+                "pool": None,
+            }
+        )
+        self.assertEqual(columnar.asks.cumulative_sizes().tolist(), [5, 12, 13])
+        self.assertEqual(columnar.asks[:2].prices.tolist(), [100, 101])
+        self.assertEqual(len(columnar.bids[:10]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
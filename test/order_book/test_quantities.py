@@ -1,10 +1,67 @@
+import random
 import unittest
-from decimal import ROUND_DOWN, ROUND_HALF_UP, ROUND_UP
+from decimal import ROUND_DOWN, ROUND_HALF_UP, ROUND_UP, Decimal
 from typing import List
 
 from idex_sdk.idex_types.order_book import L2OrderBook, OrderBookLevelL2
 from idex_sdk.order_book import quantities as q
-from idex_sdk.pipmath import ONE_IN_PIPS
+from idex_sdk.pipmath import (
+    ONE_IN_PIPS,
+    ONE_IN_PIPS_INT,
+    divide_pips,
+    multiply_pips,
+    square_root_big_int,
+)
+
+
+# Decimal based reference implementations the integer pool math must agree with
+
+
+def decimal_square_root(value: Decimal) -> int:
+    if value <= 3:
+        return 1 if value > 0 else 0
+    z = value
+    x = value / 2 + 1
+    while x < z:
+        z = x
+        x = (value / x + x) / 2
+    return int(z)
+
+
+def decimal_gross_base_quantity(
+    base: int, quote: int, target_price: int, idex_fee_rate: int, pool_fee_rate: int
+) -> int:
+    pool_fee = ONE_IN_PIPS - int((ONE_IN_PIPS * pool_fee_rate) / (ONE_IN_PIPS - idex_fee_rate))
+    v0 = pool_fee * base + ONE_IN_PIPS * base
+    v1 = Decimal(base) * Decimal(base) - int((ONE_IN_PIPS * base * quote) / target_price)
+    numerator = decimal_square_root(v0 * v0 - 4 * pool_fee * v1 * ONE_IN_PIPS) - v0
+    denominator = 2 * pool_fee * (ONE_IN_PIPS - idex_fee_rate)
+    return int(numerator * ONE_IN_PIPS / denominator)
+
+
+def decimal_gross_quote_quantity(
+    base: int, quote: int, target_price: int, idex_fee_rate: int, pool_fee_rate: int
+) -> int:
+    pool_fee = ONE_IN_PIPS - int((ONE_IN_PIPS * pool_fee_rate) / (ONE_IN_PIPS - idex_fee_rate))
+    v0 = ONE_IN_PIPS * quote * (pool_fee + ONE_IN_PIPS)
+    v1 = quote**2 * (pool_fee**2 + 2 * pool_fee * ONE_IN_PIPS + ONE_IN_PIPS**2)
+    v2 = quote * (ONE_IN_PIPS * quote - base * target_price)
+    numerator = decimal_square_root((v1 - 4 * pool_fee * v2) * ONE_IN_PIPS**2) - v0
+    denominator = 2 * pool_fee * ONE_IN_PIPS - 2 * pool_fee * idex_fee_rate
+    return int(numerator / denominator)
+
+
+def decimal_base_quantity_out(
+    base: int, quote: int, gross_quote_in: int, idex_fee_rate: int, pool_fee_rate: int
+) -> int:
+    numerator = base * quote * ONE_IN_PIPS
+    denominator = quote * ONE_IN_PIPS + gross_quote_in * (
+        ONE_IN_PIPS - idex_fee_rate - pool_fee_rate
+    )
+    quotient = int(numerator / denominator)
+    if quotient * denominator != numerator:
+        quotient += 1
+    return base - quotient
 
 
 class TestOrderBookQuantities(unittest.TestCase):
@@ -513,6 +570,114 @@ class TestOrderBookQuantities(unittest.TestCase):
             ],
         )
 
+    def test_quantities_available_from_pool_at_prices(self) -> None:
+        base, quote = 10 * ONE_IN_PIPS_INT, 50 * ONE_IN_PIPS_INT
+        ask_prices = [
+            4 * ONE_IN_PIPS_INT,
+            5 * ONE_IN_PIPS_INT,
+            5100000000,
+            5100000000,
+            6 * ONE_IN_PIPS_INT,
+        ]
+        self.assertEqual(
+            q.quantities_available_from_pool_at_prices(
+                base, quote, ask_prices, 50000, 200000, True
+            ),
+            [
+                q.quantities_available_from_pool_at_ask_price(base, quote, price, 50000, 200000)
+                for price in ask_prices
+            ],
+        )
+        bid_prices = list(reversed(ask_prices))
+        self.assertEqual(
+            q.quantities_available_from_pool_at_prices(
+                base, quote, bid_prices, 50000, 200000, False
+            ),
+            [
+                q.quantities_available_from_pool_at_bid_price(base, quote, price, 50000, 200000)
+                for price in bid_prices
+            ],
+        )
+
+    def test_quantities_available_from_pool_at_prices_matches_scalar(self) -> None:
+        rng = random.Random(20261018)
+        for _ in range(300):
+            base = rng.randint(10**8, 10**16)
+            quote = rng.randint(10**8, 10**16)
+            pool_price = divide_pips(quote, base)
+            idex_fee_rate = rng.randint(0, 10**5)
+            pool_fee_rate = rng.randint(0, 10**6)
+            for is_ask in (True, False):
+                prices = sorted(
+                    (
+                        max(1, pool_price + rng.randint(-pool_price // 2, pool_price // 2))
+                        for _ in range(rng.randint(0, 20))
+                    ),
+                    reverse=not is_ask,
+                )
+                scalar = (
+                    q.quantities_available_from_pool_at_ask_price
+                    if is_ask
+                    else q.quantities_available_from_pool_at_bid_price
+                )
+                self.assertEqual(
+                    q.quantities_available_from_pool_at_prices(
+                        base, quote, prices, idex_fee_rate, pool_fee_rate, is_ask
+                    ),
+                    [scalar(base, quote, price, idex_fee_rate, pool_fee_rate) for price in prices],
+                )
+
+        with self.assertRaises(Exception):
+            q.quantities_available_from_pool_at_prices(
+                10**7, 10**9, [10**9, 2**64], 50000, 200000, True
+            )
+        self.assertEqual(
+            q.quantities_available_from_pool_at_prices(10**7, 10**9, [1], 50000, 200000, True),
+            [{"gross_base": 0, "gross_quote": 0}],
+        )
+
+    def test_integer_pool_math_matches_decimal_reference(self) -> None:
+        rng = random.Random(20221018)
+        for _ in range(2000):
+            base = rng.randint(10**8, 10**16)
+            quote = rng.randint(10**8, 10**16)
+            pool_price = divide_pips(quote, base)
+            idex_fee_rate = rng.randint(0, 10**6)
+            pool_fee_rate = rng.randint(0, 10**6)
+            value = rng.randint(1, 10**16)
+            divisor = rng.randint(1, 10**16)
+
+            self.assertEqual(
+                divide_pips(value, divisor), int(Decimal(value) * ONE_IN_PIPS / divisor)
+            )
+            multiplier = rng.randint(1, 10**16)
+            self.assertEqual(
+                multiply_pips(value, multiplier), int(Decimal(value * multiplier) / ONE_IN_PIPS)
+            )
+            self.assertEqual(square_root_big_int(value), decimal_square_root(Decimal(value)))
+
+            bid_price = pool_price - rng.randint(1, pool_price // 10 + 1)
+            if bid_price > 0:
+                self.assertEqual(
+                    q.calculate_gross_base_quantity(
+                        base, quote, bid_price, idex_fee_rate, pool_fee_rate
+                    ),
+                    decimal_gross_base_quantity(
+                        base, quote, bid_price, idex_fee_rate, pool_fee_rate
+                    ),
+                )
+            ask_price = pool_price + rng.randint(1, pool_price // 10 + 1)
+            self.assertEqual(
+                q.calculate_gross_quote_quantity(
+                    base, quote, ask_price, idex_fee_rate, pool_fee_rate
+                ),
+                decimal_gross_quote_quantity(base, quote, ask_price, idex_fee_rate, pool_fee_rate),
+            )
+            self.assertEqual(
+                q.calculate_base_quantity_out(base, quote, value, idex_fee_rate, pool_fee_rate),
+                decimal_base_quantity_out(base, quote, value, idex_fee_rate, pool_fee_rate),
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
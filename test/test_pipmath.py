@@ -1,5 +1,7 @@
+import math
+import random
 import unittest
-from decimal import Decimal
+from decimal import ROUND_DOWN, Decimal
 
 from idex_sdk import pipmath as p
 
@@ -19,6 +21,32 @@ class TestPipmath(unittest.TestCase):
         self.assertEqual(p.decimal_to_pip("4382887.83017307"), 438288783017307)
         self.assertEqual(p.decimal_to_pip("289139.11015652"), 28913911015652)
 
+    def test_decimal_to_pip_matches_decimal_rounding(self) -> None:
+        def reference(decimal: str) -> int:
+            return int((Decimal(decimal) * p.ONE_IN_PIPS).to_integral_value(rounding=ROUND_DOWN))
+
+        values = [
+            "0",
+            "1.",
+            ".5",
+            "00012.50000000",
+            "-1.23456789",
+            "+1.5",
+            " 1.5 ",
+            "1_000.5",
+            "1e-8",
+            "0.1234567891234",
+            "1234567890123456789.123456789",
+            "0.99999999999999999999999999999",
+        ]
+        rng = random.Random(8)
+        for _ in range(1000):
+            whole = str(rng.randint(0, 10 ** rng.randint(0, 20)))
+            fraction = "".join(rng.choice("0123456789") for _ in range(rng.randint(0, 12)))
+            values.append(f"{whole}.{fraction}" if fraction or rng.random() < 0.5 else whole)
+        for value in values:
+            self.assertEqual(p.decimal_to_pip(value), reference(value), value)
+
     def test_divide_pips(self) -> None:
         self.assertEqual(p.divide_pips(1, 0), 0)
         self.assertEqual(p.divide_pips(1, 1), 100000000)
@@ -31,8 +59,43 @@ class TestPipmath(unittest.TestCase):
         self.assertEqual(p.multiply_pips(10000000, 2), 0)
         self.assertEqual(p.multiply_pips(10000000, 2, True), 1)
 
+    def test_divide_and_multiply_pips_match_decimal_rounding(self) -> None:
+        def reference_divide(value: int, divisor: int) -> int:
+            return int((Decimal(value) * p.ONE_IN_PIPS) / Decimal(divisor))
+
+        def reference_multiply(value_1: int, value_2: int, round_up: bool) -> int:
+            product = Decimal(value_1 * value_2)
+            if round_up and product % p.ONE_IN_PIPS > 0:
+                return int(1 + product / p.ONE_IN_PIPS)
+            return int(product / p.ONE_IN_PIPS)
+
+        # Beyond Decimal precision the results keep Decimal's rounding of the last digit
+        self.assertEqual(
+            p.multiply_pips(854077000875202224, 545877334199154993), 4662212764385647558787527088
+        )
+        rng = random.Random(7)
+        for _ in range(5000):
+            value = rng.randint(-(10 ** rng.randint(0, 22)), 10 ** rng.randint(0, 22))
+            other = rng.randint(1, 10 ** rng.randint(0, 22))
+            self.assertEqual(p.divide_pips(value, other), reference_divide(value, other))
+            self.assertEqual(p.multiply_pips(value, other), reference_multiply(value, other, False))
+            if abs(value * other) < 10**35:
+                # larger products make Decimal's remainder raise InvalidOperation
+                self.assertEqual(
+                    p.multiply_pips(value, other, True), reference_multiply(value, other, True)
+                )
+
     def test_pip_to_decimal(self) -> None:
         self.assertEqual(p.pip_to_decimal(10000000), "0.10000000")
+        self.assertEqual(p.pip_to_decimal(0), "0.00000000")
+        self.assertEqual(p.pip_to_decimal(-1), "-0.00000001")
+        self.assertEqual(p.pip_to_decimal(438288783017307), "4382887.83017307")
+
+    def test_pip_to_decimal_matches_decimal_formatting(self) -> None:
+        rng = random.Random(12)
+        for _ in range(1000):
+            pips = rng.randint(-(10 ** rng.randint(0, 30)), 10 ** rng.randint(0, 30))
+            self.assertEqual(p.pip_to_decimal(pips), p.asset_units_to_decimal(pips, 8), pips)
 
     def test_square_root_big_int(self) -> None:
         self.assertEqual(p.square_root_big_int(Decimal(0)), 0)
@@ -40,3 +103,17 @@ class TestPipmath(unittest.TestCase):
         self.assertEqual(p.square_root_big_int(Decimal(4)), 2)
         self.assertEqual(p.square_root_big_int(Decimal(5)), 2)
         self.assertEqual(p.square_root_big_int(Decimal(200)), 14)
+
+    def test_square_root_big_int_is_exact(self) -> None:
+        rng = random.Random(16)
+        for _ in range(1000):
+            root = rng.randint(1, 10**30)
+            for value in (root * root - 1, root * root, root * root + 1):
+                self.assertEqual(p.square_root_big_int(value), math.isqrt(value))
+        # The Newton iteration this replaced rounded its quotients, to float precision for int
+        # arguments (returning 9974975530542196 here) and to 28 significant digits for Decimal
+        # arguments (returning 767254256254973 here)
+        self.assertEqual(p.square_root_big_int(99500136834915584515172797586812), 9974975530542197)
+        self.assertEqual(
+            p.square_root_big_int(Decimal(588679093741371774895187230728)), 767254256254972
+        )